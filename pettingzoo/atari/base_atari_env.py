@@ -21,10 +21,11 @@ __all__ = [
 
 
 def base_env_wrapper_fn(raw_env_fn):
-    def env_fn(**kwargs):
+    def env_fn(validate=None, **kwargs):
         env = raw_env_fn(**kwargs)
-        env = wrappers.AssertOutOfBoundsWrapper(env)
-        env = wrappers.OrderEnforcingWrapper(env)
+        if wrappers.validation_enabled(validate):
+            env = wrappers.AssertOutOfBoundsWrapper(env)
+            env = wrappers.OrderEnforcingWrapper(env)
         return env
 
     return env_fn
@@ -312,3 +313,25 @@ class ParallelAtariEnv(ParallelEnv, EzPickle):
         state_ref = self.ale.decodeState(state)
         self.ale.restoreSystemState(state_ref)
         self.ale.deleteState(state_ref)
+
+    def snapshot(self):
+        # the emulator state is encoded as bytes, including its pseudorandomness
+        return (
+            self.clone_full_state(),
+            list(self.agents),
+            dict(self.terminations),
+            self.frame,
+            self.np_random.bit_generator.state,
+        )
+
+    def restore(self, snapshot):
+        (
+            state,
+            agents,
+            terminations,
+            self.frame,
+            self.np_random.bit_generator.state,
+        ) = snapshot
+        self.restore_full_state(state)
+        self.agents = list(agents)
+        self.terminations = dict(terminations)
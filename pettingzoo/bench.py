@@ -0,0 +1,383 @@
+r"""Benchmarks the speed and memory use of PettingZoo environments.
+
+Every selected environment is run with random (legal) actions through its AEC
+and/or parallel API, once per set of environment arguments, and the results can
+be written to a JSON file to compare releases::
+
+    python -m pettingzoo.bench mpe sisl/pursuit_v4 --api aec parallel \\
+        --kwargs "{}" --kwargs '{"N": 10}' --seconds 2 --output results.json
+
+Environments are selected by name (e.g. ``mpe/simple_spread_v3``) or by family
+prefix (e.g. ``mpe``); all environments in ``all_environments`` are benchmarked
+by default.
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib
+import json
+import pkgutil
+import platform
+import sys
+import time
+import tracemalloc
+from typing import Any, Callable, Sequence
+
+import numpy as np
+
+import pettingzoo
+from pettingzoo.utils.action_sampling import sample_action
+from pettingzoo.utils.deprecated_module import is_env
+from pettingzoo.utils.env import AECEnv, ParallelEnv
+
+try:
+    import resource
+except ImportError:  # not available on Windows
+    resource = None
+
+
+# the families of pettingzoo.utils.all_modules, which imports every environment
+FAMILIES = ("atari", "butterfly", "classic", "mpe", "sisl")
+
+
+def peak_rss_mb() -> float | None:
+    """Peak resident set size of this process in MB, or None if it cannot be measured."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and kilobytes elsewhere
+    return peak / 2**20 if sys.platform == "darwin" else peak / 2**10
+
+
+class _RawEnvTimer:
+    """Accumulates the time spent in the ``step`` and ``observe`` methods of a raw env.
+
+    The methods are replaced on the instance until `restore` is called, so the calls
+    made through the wrappers of the env are timed. Nested calls (e.g. ``observe``
+    inside ``step``) are only counted once.
+    """
+
+    def __init__(self, raw_env: AECEnv | ParallelEnv):
+        self.total = 0.0
+        self._depth = 0
+        self._raw_env = raw_env
+        # the replaced instance attributes, None for methods of the class
+        self._replaced = {}
+        for name in ("step", "observe"):
+            method = getattr(raw_env, name, None)
+            if method is not None:
+                self._replaced[name] = vars(raw_env).get(name)
+                setattr(raw_env, name, self._timed(method))
+
+    def restore(self) -> None:
+        """Puts back the methods of the raw env which were replaced."""
+        for name, method in self._replaced.items():
+            if method is None:
+                delattr(self._raw_env, name)
+            else:
+                setattr(self._raw_env, name, method)
+
+    def _timed(self, method: Callable) -> Callable:
+        def timed(*args, **kwargs):
+            if self._depth:
+                return method(*args, **kwargs)
+            self._depth += 1
+            start = time.perf_counter()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                self.total += time.perf_counter() - start
+                self._depth -= 1
+
+        return timed
+
+
+def _aec_step(env: AECEnv, rng: np.random.Generator) -> float:
+    # one agent turn: last() and step(), not counting the action sampling
+    start = time.perf_counter()
+    observation, _, termination, truncation, info = env.last()
+    middle = time.perf_counter()
+    if termination or truncation:
+        action = None
+    else:
+        action = sample_action(
+            env.action_space(env.agent_selection), observation, info, rng
+        )
+    restart = time.perf_counter()
+    env.step(action)
+    return middle - start + time.perf_counter() - restart
+
+
+def _parallel_step(
+    env: ParallelEnv, observations: dict, infos: dict, rng: np.random.Generator
+) -> tuple:
+    actions = {
+        agent: sample_action(
+            env.action_space(agent),
+            observations.get(agent),
+            infos.get(agent, {}),
+            rng,
+        )
+        for agent in env.agents
+    }
+    start = time.perf_counter()
+    observations, _, _, _, infos = env.step(actions)
+    return time.perf_counter() - start, observations, infos
+
+
+def benchmark_env(
+    env: AECEnv | ParallelEnv,
+    api: str = "aec",
+    seconds: float = 2.0,
+    max_steps: int | None = None,
+    alloc_steps: int = 100,
+    seed: int | None = 0,
+) -> dict[str, Any]:
+    """Runs ``env`` with random actions for ``seconds`` (or ``max_steps`` steps) and returns its metrics.
+
+    A step is one agent turn (``last`` and ``step``) for the AEC API and one call to
+    ``step`` for the parallel API. The environment is reset whenever no agents are
+    left. The time spent in the raw environment's ``step`` and ``observe`` is
+    measured separately, the rest of the step time is spent in wrappers and
+    conversions. After the timed run, ``alloc_steps`` more steps are traced with
+    ``tracemalloc`` to estimate the memory allocated per step. The ``step`` and
+    ``observe`` methods of ``env.unwrapped`` are only replaced while it runs.
+
+    Returns:
+        A dict with ``steps``, ``episodes``, ``steps_per_second``, ``reset_latency_ms``,
+        ``step_latency_p50_ms``, ``step_latency_p99_ms``, ``raw_env_ms_per_step``,
+        ``wrapper_ms_per_step``, ``alloc_bytes_per_step`` and ``peak_rss_mb``
+    """
+    assert api in ("aec", "parallel"), f"Unknown API {api}, expected aec or parallel"
+    rng = np.random.default_rng(seed)
+    raw_timer = _RawEnvTimer(env.unwrapped)
+    try:
+        return _benchmark(
+            env, api, seconds, max_steps, alloc_steps, seed, rng, raw_timer
+        )
+    finally:
+        raw_timer.restore()
+
+
+def _benchmark(
+    env: AECEnv | ParallelEnv,
+    api: str,
+    seconds: float,
+    max_steps: int | None,
+    alloc_steps: int,
+    seed: int | None,
+    rng: np.random.Generator,
+    raw_timer: _RawEnvTimer,
+) -> dict[str, Any]:
+    reset_times = []
+    step_times = []
+    observations, infos = {}, {}
+
+    def reset(seed=None):
+        nonlocal observations, infos
+        start = time.perf_counter()
+        if api == "aec":
+            env.reset(seed=seed)
+        else:
+            observations, infos = env.reset(seed=seed)
+        return time.perf_counter() - start
+
+    def step():
+        nonlocal observations, infos
+        if api == "aec":
+            return _aec_step(env, rng)
+        step_time, observations, infos = _parallel_step(env, observations, infos, rng)
+        return step_time
+
+    reset_times.append(reset(seed))
+    if seed is not None:
+        for agent in env.possible_agents:
+            env.action_space(agent).seed(seed)
+
+    raw_time = 0.0
+    start = time.perf_counter()
+    while time.perf_counter() - start < seconds and (
+        max_steps is None or len(step_times) < max_steps
+    ):
+        if not env.agents:
+            reset_times.append(reset())
+            continue
+        raw_before = raw_timer.total
+        step_times.append(step())
+        raw_time += raw_timer.total - raw_before
+    elapsed = time.perf_counter() - start
+
+    alloc_bytes = []
+    tracemalloc.start()
+    try:
+        for _ in range(alloc_steps):
+            if not env.agents:
+                reset()
+            before = tracemalloc.get_traced_memory()[0]
+            if hasattr(tracemalloc, "reset_peak"):
+                tracemalloc.reset_peak()
+            step()
+            alloc_bytes.append(tracemalloc.get_traced_memory()[1] - before)
+    finally:
+        tracemalloc.stop()
+
+    steps = len(step_times)
+    step_ms = np.array(step_times) * 1e3
+    return {
+        "steps": steps,
+        "episodes": len(reset_times),
+        "steps_per_second": steps / elapsed if elapsed > 0 else None,
+        "reset_latency_ms": float(np.mean(reset_times) * 1e3),
+        "step_latency_p50_ms": float(np.percentile(step_ms, 50)) if steps else None,
+        "step_latency_p99_ms": float(np.percentile(step_ms, 99)) if steps else None,
+        "raw_env_ms_per_step": raw_time * 1e3 / steps if steps else None,
+        "wrapper_ms_per_step": (
+            (np.sum(step_times) - raw_time) * 1e3 / steps if steps else None
+        ),
+        "alloc_bytes_per_step": float(np.mean(alloc_bytes)) if alloc_bytes else None,
+        "peak_rss_mb": peak_rss_mb(),
+    }
+
+
+def select_environments(names: Sequence[str] = ()) -> dict[str, Any]:
+    """Returns the environment modules matching the given names or family prefixes.
+
+    Only the selected environments are imported. An environment which cannot be
+    imported, e.g. because the optional dependencies of atari are missing, maps to
+    the ImportError instead of a module.
+    """
+    families = {name.split("/")[0] for name in names} if names else FAMILIES
+    selected = {}
+    for family in sorted(families):
+        assert family in FAMILIES, f"Unknown environment family {family}"
+        package = importlib.import_module(f"pettingzoo.{family}")
+        for module_info in pkgutil.iter_modules(package.__path__):
+            env_name = f"{family}/{module_info.name}"
+            if not is_env(module_info.name):
+                continue
+            if names and not any(
+                env_name == name or env_name.startswith(name + "/") for name in names
+            ):
+                continue
+            try:
+                selected[env_name] = importlib.import_module(
+                    f"{package.__name__}.{module_info.name}"
+                )
+            except ImportError as e:
+                selected[env_name] = e
+    assert selected, f"No environments match {list(names)}"
+    return selected
+
+
+def run_benchmarks(
+    env_names: Sequence[str] = (),
+    apis: Sequence[str] = ("aec", "parallel"),
+    kwargs_list: Sequence[dict[str, Any]] = ({},),
+    verbose: bool = True,
+    **benchmark_kwargs,
+) -> list[dict[str, Any]]:
+    """Benchmarks every selected environment with every API and set of arguments.
+
+    Combinations an environment does not support (e.g. the parallel API of classic
+    environments) are skipped. Environments which fail are reported with an
+    ``error`` instead of metrics, as are environments which cannot be imported.
+    ``benchmark_kwargs`` are passed to `benchmark_env`.
+    """
+    results = []
+    for env_name, module in select_environments(env_names).items():
+        for kwargs in kwargs_list:
+            for api in apis:
+                result = {"env": env_name, "api": api, "kwargs": kwargs}
+                if isinstance(module, ImportError):
+                    # an environment which could not be imported
+                    result["error"] = f"{type(module).__name__}: {module}"
+                else:
+                    env_fn = getattr(
+                        module, "env" if api == "aec" else "parallel_env", None
+                    )
+                    if env_fn is None:
+                        continue
+                    try:
+                        env = env_fn(**kwargs)
+                        try:
+                            result.update(benchmark_env(env, api, **benchmark_kwargs))
+                        finally:
+                            env.close()
+                    except Exception as e:
+                        result["error"] = f"{type(e).__name__}: {e}"
+                if verbose:
+                    print(format_result(result))
+                results.append(result)
+    return results
+
+
+def format_result(result: dict[str, Any]) -> str:
+    name = f"{result['env']} ({result['api']}) {json.dumps(result['kwargs'])}"
+    if "error" in result:
+        return f"{name}: {result['error']}"
+    return (
+        f"{name}: {result['steps_per_second']:.1f} steps/s, "
+        f"p50 {result['step_latency_p50_ms']:.3f} ms, "
+        f"p99 {result['step_latency_p99_ms']:.3f} ms, "
+        f"wrappers {result['wrapper_ms_per_step']:.3f} ms/step, "
+        f"reset {result['reset_latency_ms']:.2f} ms"
+    )
+
+
+def main(argv: Sequence[str] | None = None) -> list[dict[str, Any]]:
+    parser = argparse.ArgumentParser(
+        prog="python -m pettingzoo.bench", description=__doc__.splitlines()[0]
+    )
+    parser.add_argument(
+        "envs",
+        nargs="*",
+        help="environment names or family prefixes, e.g. mpe/simple_spread_v3 or mpe (default: all)",
+    )
+    parser.add_argument(
+        "--api", nargs="+", choices=["aec", "parallel"], default=["aec", "parallel"]
+    )
+    parser.add_argument(
+        "--kwargs",
+        action="append",
+        type=json.loads,
+        help="JSON dict of environment arguments, can be repeated to sweep e.g. agent counts or obs types",
+    )
+    parser.add_argument("--seconds", type=float, default=2.0, help="time per benchmark")
+    parser.add_argument("--max-steps", type=int, default=None)
+    parser.add_argument(
+        "--alloc-steps",
+        type=int,
+        default=100,
+        help="steps traced with tracemalloc to measure allocations",
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--output", help="path of the JSON file to write the results to"
+    )
+    args = parser.parse_args(argv)
+
+    results = run_benchmarks(
+        args.envs,
+        args.api,
+        args.kwargs or [{}],
+        seconds=args.seconds,
+        max_steps=args.max_steps,
+        alloc_steps=args.alloc_steps,
+        seed=args.seed,
+    )
+    if args.output:
+        report = {
+            "pettingzoo_version": pettingzoo.__version__,
+            "python_version": platform.python_version(),
+            "platform": platform.platform(),
+            "time": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "results": results,
+        }
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+    return results
+
+
+if __name__ == "__main__":
+    main()
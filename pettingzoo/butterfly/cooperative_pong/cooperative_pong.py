@@ -68,6 +68,8 @@ right_paddle_speed=12, cake_paddle=True, max_cycles=900, bounce_randomness=False
 
 """
 
+import copy
+
 import gymnasium
 import numpy as np
 import pygame
@@ -104,6 +106,15 @@ def original_obs_shape(screen_width, screen_height, kernel_window_length=2):
     )
 
 
+def _sprite_state(sprite):
+    # the surfaces of the sprites are never drawn, only their rects move
+    return {
+        name: value
+        for name, value in vars(sprite).items()
+        if not isinstance(value, pygame.Surface) and name != "randomizer"
+    }
+
+
 def get_valid_angle(randomizer):
     # generates an angle in [0, 2*np.pi) that
     # excludes (90 +- ver_deg_range), (270 +- ver_deg_range), (0 +- hor_deg_range), (180 +- hor_deg_range)
@@ -283,13 +294,14 @@ class CooperativePong:
             else None
         )
 
-    def observe(self):
-        observation = np.array(pygame.surfarray.pixels3d(self.screen))
-        observation = np.rot90(
-            observation, k=3
-        )  # now the obs is laid out as H, W as rows and cols
-        observation = np.fliplr(observation)  # laid out in the correct order
-        return observation
+    def observe(self, out=None):
+        # rotating by 270 degrees and flipping left to right lays the screen out
+        # as H, W rows and cols, which is a transpose
+        observation = pygame.surfarray.pixels3d(self.screen).transpose(1, 0, 2)
+        if out is None:
+            return np.array(observation)
+        np.copyto(out, observation)
+        return out
 
     def state(self):
         """Returns an observation of the global environment."""
@@ -342,10 +354,11 @@ class CooperativePong:
         self.render()
 
 
-def env(**kwargs):
+def env(validate=None, **kwargs):
     env = raw_env(**kwargs)
-    env = wrappers.AssertOutOfBoundsWrapper(env)
-    env = wrappers.OrderEnforcingWrapper(env)
+    if wrappers.validation_enabled(validate):
+        env = wrappers.AssertOutOfBoundsWrapper(env)
+        env = wrappers.OrderEnforcingWrapper(env)
     return env
 
 
@@ -413,8 +426,48 @@ class raw_env(AECEnv, EzPickle):
         self.truncations = self.env.truncations
         self.infos = self.env.infos
 
-    def observe(self, agent):
-        obs = self.env.observe()
+    def snapshot(self):
+        game = self.env
+        return (
+            copy.deepcopy(
+                (
+                    [_sprite_state(sprite) for sprite in (game.p0, game.p1, game.ball)],
+                    game.terminate,
+                    game.truncate,
+                    game.num_frames,
+                    game.score,
+                )
+            ),
+            # observations are the frame drawn at the end of the last step
+            pygame.surfarray.array3d(game.screen),
+            self.randomizer.bit_generator.state,
+            self.score,
+            self._snapshot_agents(),
+        )
+
+    def restore(self, snapshot):
+        game_state, pixels, rng_state, self.score, agents = snapshot
+        game = self.env
+        (
+            sprite_states,
+            game.terminate,
+            game.truncate,
+            game.num_frames,
+            game.score,
+        ) = copy.deepcopy(game_state)
+        for sprite, state in zip((game.p0, game.p1, game.ball), sprite_states):
+            vars(sprite).update(state)
+        pygame.surfarray.blit_array(game.screen, pixels)
+        self.randomizer.bit_generator.state = rng_state
+        self._restore_agents(agents)
+        # the game updates the dicts of the agents in place
+        game.rewards = self.rewards
+        game.terminations = self.terminations
+        game.truncations = self.truncations
+        game.infos = self.infos
+
+    def observe(self, agent, out=None):
+        obs = self.env.observe(out=out)
         return obs
 
     def state(self):
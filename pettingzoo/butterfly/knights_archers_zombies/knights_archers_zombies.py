@@ -203,10 +203,11 @@ sys.dont_write_bytecode = True
 __all__ = ["ManualPolicy", "env", "parallel_env", "raw_env"]
 
 
-def env(**kwargs):
+def env(validate=None, **kwargs):
     env = raw_env(**kwargs)
-    env = wrappers.AssertOutOfBoundsWrapper(env)
-    env = wrappers.OrderEnforcingWrapper(env)
+    if wrappers.validation_enabled(validate):
+        env = wrappers.AssertOutOfBoundsWrapper(env)
+        env = wrappers.OrderEnforcingWrapper(env)
     return env
 
 
@@ -222,6 +223,16 @@ class raw_env(AECEnv, EzPickle):
         "has_manual_policy": True,
     }
 
+    # the background images do not change, snapshots do not copy them
+    _snapshot_exclude = AECEnv._snapshot_exclude | {
+        "left_wall",
+        "right_wall",
+        "floor_patch1",
+        "floor_patch2",
+        "floor_patch3",
+        "floor_patch4",
+    }
+
     def __init__(
         self,
         spawn_rate=20,
@@ -504,7 +515,7 @@ class raw_env(AECEnv, EzPickle):
             run = False
         return run
 
-    def observe(self, agent):
+    def observe(self, agent, out=None):
         if not self.vector_state:
             screen = pygame.surfarray.pixels3d(self.screen)
 
@@ -512,8 +523,13 @@ class raw_env(AECEnv, EzPickle):
             agent_obj = self.agent_list[i]
             agent_position = (agent_obj.rect.x, agent_obj.rect.y)
 
+            if out is not None:
+                # crop in the x, y layout of the screen, straight into out
+                cropped = np.swapaxes(out, 1, 0)
+                cropped.fill(0)
             if not agent_obj.alive:
-                cropped = np.zeros((512, 512, 3), dtype=np.uint8)
+                if out is None:
+                    cropped = np.zeros((512, 512, 3), dtype=np.uint8)
             else:
                 min_x = agent_position[0] - 256
                 max_x = agent_position[0] + 256
@@ -527,12 +543,13 @@ class raw_env(AECEnv, EzPickle):
                 starty = lower_y_bound - min_y
                 endx = 512 + upper_x_bound - max_x
                 endy = 512 + upper_y_bound - max_y
-                cropped = np.zeros_like(self.observation_spaces[agent].low)
+                if out is None:
+                    cropped = np.zeros_like(self.observation_spaces[agent].low)
                 cropped[startx:endx, starty:endy, :] = screen[
                     lower_x_bound:upper_x_bound, lower_y_bound:upper_y_bound, :
                 ]
 
-            return np.swapaxes(cropped, 1, 0)
+            return np.swapaxes(cropped, 1, 0) if out is None else out
 
         else:
             # get the agent
@@ -582,6 +599,9 @@ class raw_env(AECEnv, EzPickle):
                 # remove pure zero rows if using sequence space
                 state = state[~np.all(state == 0, axis=-1)]
 
+            if out is not None:
+                np.copyto(out, state)
+                return out
             return state
 
     def state(self):
@@ -830,6 +850,20 @@ class raw_env(AECEnv, EzPickle):
             pygame.quit()
             self.screen = None
 
+    def snapshot(self):
+        # pixel observations are read from the frame drawn at the end of the
+        # last cycle, the sprites are copied by the default snapshot
+        pixels = None
+        if not self.vector_state:
+            pixels = pygame.surfarray.array3d(self.screen)
+        return super().snapshot(), pixels
+
+    def restore(self, snapshot):
+        attributes, pixels = snapshot
+        super().restore(attributes)
+        if pixels is not None:
+            pygame.surfarray.blit_array(self.screen, pixels)
+
     def check_game_end(self):
         # Zombie reaches the End of the Screen
         self.run = self.zombie_endscreen(self.run, self.zombie_list)
@@ -9,3 +9,32 @@ def get_image(path):
     sfc = pygame.Surface(image.get_size(), flags=pygame.SRCALPHA)
     sfc.blit(image, (0, 0))
     return sfc
+
+
+class Sprite(pygame.sprite.Sprite):
+    """A sprite which can be deep copied and pickled, e.g. by `snapshot`.
+
+    Pygame surfaces cannot be pickled, so images are stored as their pixels.
+    """
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        for name, value in state.items():
+            if isinstance(value, pygame.Surface):
+                state[name] = _SurfacePixels(value)
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        for name, value in state.items():
+            if isinstance(value, _SurfacePixels):
+                setattr(self, name, value.surface())
+
+
+class _SurfacePixels:
+    def __init__(self, surface):
+        self.size = surface.get_size()
+        self.pixels = pygame.image.tobytes(surface, "RGBA")
+
+    def surface(self):
+        return pygame.image.frombytes(self.pixels, self.size, "RGBA")
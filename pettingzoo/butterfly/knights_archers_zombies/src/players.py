@@ -5,10 +5,10 @@ import numpy as np
 import pygame
 
 from pettingzoo.butterfly.knights_archers_zombies.src import constants as const
-from pettingzoo.butterfly.knights_archers_zombies.src.img import get_image
+from pettingzoo.butterfly.knights_archers_zombies.src.img import Sprite, get_image
 
 
-class Player(pygame.sprite.Sprite):
+class Player(Sprite):
     def __init__(self):
         super().__init__()
         self.agent_name = None
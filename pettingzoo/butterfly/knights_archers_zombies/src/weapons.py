@@ -5,10 +5,10 @@ import numpy as np
 import pygame
 
 from pettingzoo.butterfly.knights_archers_zombies.src import constants as const
-from pettingzoo.butterfly.knights_archers_zombies.src.img import get_image
+from pettingzoo.butterfly.knights_archers_zombies.src.img import Sprite, get_image
 
 
-class Arrow(pygame.sprite.Sprite):
+class Arrow(Sprite):
     def __init__(self, archer):
         super().__init__()
         self.archer = archer
@@ -48,7 +48,7 @@ class Arrow(pygame.sprite.Sprite):
         return True
 
 
-class Sword(pygame.sprite.Sprite):
+class Sword(Sprite):
     def __init__(self, knight):
         # the sword is actually a mace, but we refer to it as sword everywhere
         super().__init__()
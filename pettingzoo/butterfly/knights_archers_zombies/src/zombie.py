@@ -1,13 +1,12 @@
 import os
 
 import numpy as np
-import pygame
 
 from pettingzoo.butterfly.knights_archers_zombies.src import constants as const
-from pettingzoo.butterfly.knights_archers_zombies.src.img import get_image
+from pettingzoo.butterfly.knights_archers_zombies.src.img import Sprite, get_image
 
 
-class Zombie(pygame.sprite.Sprite):
+class Zombie(Sprite):
     def __init__(self, randomizer):
         super().__init__()
         self.image = get_image(os.path.join("img", "zombie.png"))
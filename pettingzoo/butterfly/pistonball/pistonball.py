@@ -78,6 +78,7 @@ ball_elasticity=1.5, max_cycles=125)
 
 """
 
+import copy
 import math
 
 import gymnasium
@@ -89,7 +90,7 @@ from gymnasium.utils import EzPickle, seeding
 
 from pettingzoo import AECEnv
 from pettingzoo.butterfly.pistonball.manual_policy import ManualPolicy
-from pettingzoo.utils import AgentSelector, wrappers
+from pettingzoo.utils import AgentArrays, AgentSelector, wrappers
 from pettingzoo.utils.conversions import parallel_wrapper_fn
 
 _image_library = {}
@@ -109,13 +110,15 @@ def get_image(path):
     return sfc
 
 
-def env(**kwargs):
+def env(validate=None, **kwargs):
+    validate = wrappers.validation_enabled(validate)
     env = raw_env(**kwargs)
     if env.continuous:
         env = wrappers.ClipOutOfBoundsWrapper(env)
-    else:
+    elif validate:
         env = wrappers.AssertOutOfBoundsWrapper(env)
-    env = wrappers.OrderEnforcingWrapper(env)
+    if validate:
+        env = wrappers.OrderEnforcingWrapper(env)
     return env
 
 
@@ -181,6 +184,8 @@ class raw_env(AECEnv, EzPickle):
         self.possible_agents = self.agents[:]
         self.agent_name_mapping = dict(zip(self.agents, list(range(self.n_pistons))))
         self._agent_selector = AgentSelector(self.agents)
+        # rewards, terminations and truncations are stored in arrays indexed by piston
+        self.agent_arrays = AgentArrays(self.possible_agents)
 
         self.observation_spaces = dict(
             zip(
@@ -282,7 +287,7 @@ class raw_env(AECEnv, EzPickle):
     def _seed(self, seed=None):
         self.np_random, seed = seeding.np_random(seed)
 
-    def observe(self, agent):
+    def observe(self, agent, out=None):
         observation = pygame.surfarray.pixels3d(self.screen)
         i = self.agent_name_mapping[agent]
         # Set x bounds to include 40px left and 40px right of piston
@@ -290,10 +295,13 @@ class raw_env(AECEnv, EzPickle):
         x_low = self.wall_width + self.piston_width * (i - 1)
         y_high = self.screen_height - self.wall_width - self.piston_body_height
         y_low = self.wall_width
-        cropped = np.array(observation[x_low:x_high, y_low:y_high, :])
-        observation = np.rot90(cropped, k=3)
-        observation = np.fliplr(observation)
-        return observation
+        # rotating by 270 degrees and flipping left to right is a transpose,
+        # the crop is copied once, directly into its final layout
+        cropped = observation[x_low:x_high, y_low:y_high, :].transpose(1, 0, 2)
+        if out is None:
+            return np.array(cropped)
+        np.copyto(out, cropped)
+        return out
 
     def state(self):
         """Returns an observation of the global environment."""
@@ -311,6 +319,60 @@ class raw_env(AECEnv, EzPickle):
         self.draw_background()
         self.draw()
 
+    def snapshot(self):
+        # the space is copied with its bodies, so cached contacts are restored too
+        space, ball, pistons = copy.deepcopy((self.space, self.ball, self.pistonList))
+        return (
+            space,
+            ball,
+            pistons,
+            # observations are crops of the frame drawn at the end of the last cycle
+            pygame.surfarray.array3d(self.screen),
+            self.lastX,
+            self.distance,
+            self.frames,
+            self.terminate,
+            self.truncate,
+            set(self.recentPistons),
+            self._snapshot_agents(),
+        )
+
+    def restore(self, snapshot):
+        (
+            space,
+            ball,
+            pistons,
+            pixels,
+            self.lastX,
+            self.distance,
+            self.frames,
+            self.terminate,
+            self.truncate,
+            recent_pistons,
+            agents,
+        ) = snapshot
+        self.space, self.ball, self.pistonList = copy.deepcopy((space, ball, pistons))
+        pygame.surfarray.blit_array(self.screen, pixels)
+        self.recentPistons = set(recent_pistons)
+        self._restore_agents(agents)
+        # write the values back into the arrays behind the dict views
+        rewards, cumulative_rewards, terminations, truncations = (
+            self.rewards,
+            self._cumulative_rewards,
+            self.terminations,
+            self.truncations,
+        )
+        (
+            self.rewards,
+            self._cumulative_rewards,
+            self.terminations,
+            self.truncations,
+        ) = self.agent_arrays.reset(self.agents)
+        self.rewards.update(rewards)
+        self._cumulative_rewards.update(cumulative_rewards)
+        self.terminations.update(terminations)
+        self.truncations.update(truncations)
+
     def close(self):
         if self.screen is not None:
             pygame.quit()
@@ -476,10 +538,12 @@ class raw_env(AECEnv, EzPickle):
 
         self.terminate = False
         self.truncate = False
-        self.rewards = dict(zip(self.agents, [0 for _ in self.agents]))
-        self._cumulative_rewards = dict(zip(self.agents, [0 for _ in self.agents]))
-        self.terminations = dict(zip(self.agents, [False for _ in self.agents]))
-        self.truncations = dict(zip(self.agents, [False for _ in self.agents]))
+        (
+            self.rewards,
+            self._cumulative_rewards,
+            self.terminations,
+            self.truncations,
+        ) = self.agent_arrays.reset(self.agents)
         self.infos = dict(zip(self.agents, [{} for _ in self.agents]))
 
         self.frames = 0
@@ -598,8 +662,9 @@ class raw_env(AECEnv, EzPickle):
             # sets self.renderOn to true and initializes display
             self.enable_render()
 
-        self.draw_background()
-        self.draw()
+        with self.profile_section("draw"):
+            self.draw_background()
+            self.draw()
 
         observation = np.array(pygame.surfarray.pixels3d(self.screen))
         if self.render_mode == "human":
@@ -628,7 +693,8 @@ class raw_env(AECEnv, EzPickle):
                 self.pistonList[self.agent_name_mapping[agent]], action - 1
             )
 
-        self.space.step(self.dt)
+        with self.profile_section("space.step"):
+            self.space.step(self.dt)
         if self._agent_selector.is_last():
             ball_min_x = int(self.ball.position[0] - self.ball_radius)
             ball_next_x = (
@@ -640,7 +706,8 @@ class raw_env(AECEnv, EzPickle):
                 self.terminate = True
             # ensures that the ball can't pass through the wall
             ball_min_x = max(self.wall_width, ball_min_x)
-            self.draw()
+            with self.profile_section("draw"):
+                self.draw()
             local_reward = self.get_local_reward(self.lastX, ball_min_x)
             # Opposite order due to moving right to left
             global_reward = (100 / self.distance) * (self.lastX - ball_min_x)
@@ -652,27 +719,23 @@ class raw_env(AECEnv, EzPickle):
             local_pistons_to_reward = self.get_nearby_pistons()
             for index in local_pistons_to_reward:
                 total_reward[index] += local_reward * self.local_ratio
-            self.rewards = dict(zip(self.agents, total_reward))
+            self.agent_arrays.rewards[:] = total_reward
             self.lastX = ball_min_x
             self.frames += 1
         else:
-            self._clear_rewards()
+            self.agent_arrays.clear_rewards()
 
         self.truncate = self.frames >= self.max_cycles
         # Clear the list of recent pistons for the next reward cycle
         if self.frames % self.recentFrameLimit == 0:
             self.recentPistons = set()
         if self._agent_selector.is_last():
-            self.terminations = dict(
-                zip(self.agents, [self.terminate for _ in self.agents])
-            )
-            self.truncations = dict(
-                zip(self.agents, [self.truncate for _ in self.agents])
-            )
+            self.agent_arrays.terminations[:] = self.terminate
+            self.agent_arrays.truncations[:] = self.truncate
 
         self.agent_selection = self._agent_selector.next()
-        self._cumulative_rewards[agent] = 0
-        self._accumulate_rewards()
+        self.agent_arrays.cumulative_rewards[self.agent_name_mapping[agent]] = 0
+        self.agent_arrays.accumulate_rewards()
 
         if self.render_mode == "human":
             self.render()
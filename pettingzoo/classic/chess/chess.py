@@ -119,11 +119,12 @@ from pettingzoo.utils import wrappers
 from pettingzoo.utils.agent_selector import AgentSelector
 
 
-def env(**kwargs):
+def env(validate=None, **kwargs):
     env = raw_env(**kwargs)
     env = wrappers.TerminateIllegalWrapper(env, illegal_reward=-1)
-    env = wrappers.AssertOutOfBoundsWrapper(env)
-    env = wrappers.OrderEnforcingWrapper(env)
+    if wrappers.validation_enabled(validate):
+        env = wrappers.AssertOutOfBoundsWrapper(env)
+        env = wrappers.OrderEnforcingWrapper(env)
     return env
 
 
@@ -346,6 +347,24 @@ class raw_env(AECEnv, EzPickle):
                 np.array(pygame.surfarray.pixels3d(self.screen)), axes=(1, 0, 2)
             )
 
+    def snapshot(self):
+        # the move stack is kept with the board, draws by repetition depend on it
+        return (
+            self.board.copy(),
+            np.packbits(self.board_history),
+            self._snapshot_agents(),
+        )
+
+    def restore(self, snapshot):
+        board, board_history, agents = snapshot
+        self.board = board.copy()
+        self.board_history = (
+            np.unpackbits(board_history, count=8 * 8 * 104)
+            .reshape(8, 8, 104)
+            .astype(bool)
+        )
+        self._restore_agents(agents)
+
     def close(self):
         if self.screen is not None:
             pygame.quit()
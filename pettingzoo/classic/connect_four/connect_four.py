@@ -84,11 +84,12 @@ def get_image(path):
     return sfc
 
 
-def env(**kwargs):
+def env(validate=None, **kwargs):
     env = raw_env(**kwargs)
     env = wrappers.TerminateIllegalWrapper(env, illegal_reward=-1)
-    env = wrappers.AssertOutOfBoundsWrapper(env)
-    env = wrappers.OrderEnforcingWrapper(env)
+    if wrappers.validation_enabled(validate):
+        env = wrappers.AssertOutOfBoundsWrapper(env)
+        env = wrappers.OrderEnforcingWrapper(env)
     return env
 
 
@@ -295,6 +296,15 @@ class raw_env(AECEnv, EzPickle):
             else None
         )
 
+    def snapshot(self):
+        # the pieces of the board fit in one byte each
+        return bytes(self.board), self._snapshot_agents()
+
+    def restore(self, snapshot):
+        board, agents = snapshot
+        self.board = list(board)
+        self._restore_agents(agents)
+
     def close(self):
         if self.screen is not None:
             pygame.quit()
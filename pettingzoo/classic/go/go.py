@@ -132,11 +132,12 @@ def get_image(path):
     return sfc
 
 
-def env(**kwargs):
+def env(validate=None, **kwargs):
     env = raw_env(**kwargs)
     env = wrappers.TerminateIllegalWrapper(env, illegal_reward=-1)
-    env = wrappers.AssertOutOfBoundsWrapper(env)
-    env = wrappers.OrderEnforcingWrapper(env)
+    if wrappers.validation_enabled(validate):
+        env = wrappers.AssertOutOfBoundsWrapper(env)
+        env = wrappers.OrderEnforcingWrapper(env)
     return env
 
 
@@ -433,6 +434,27 @@ class raw_env(AECEnv, EzPickle):
             else None
         )
 
+    def snapshot(self):
+        # positions and observations are never changed in place, play_move
+        # returns a new position
+        return (
+            self._go,
+            self._last_obs,
+            np.array(self.next_legal_moves),
+            np.packbits(self.board_history),
+            self._snapshot_agents(),
+        )
+
+    def restore(self, snapshot):
+        self._go, self._last_obs, next_legal_moves, board_history, agents = snapshot
+        self.next_legal_moves = next_legal_moves.copy()
+        self.board_history = (
+            np.unpackbits(board_history, count=self._N * self._N * 16)
+            .reshape(self._N, self._N, 16)
+            .astype(bool)
+        )
+        self._restore_agents(agents)
+
     def close(self):
         if self.screen is not None:
             pygame.quit()
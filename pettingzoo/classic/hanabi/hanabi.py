@@ -174,7 +174,7 @@ from pettingzoo.utils import wrappers
 from pettingzoo.utils.agent_selector import AgentSelector
 
 
-def env(**kwargs):
+def env(validate=None, **kwargs):
     render_mode = kwargs.get("render_mode")
     if render_mode == "ansi":
         kwargs["render_mode"] = "human"
@@ -184,8 +184,9 @@ def env(**kwargs):
         env = raw_env(**kwargs)
 
     env = wrappers.TerminateIllegalWrapper(env, illegal_reward=-1)
-    env = wrappers.AssertOutOfBoundsWrapper(env)
-    env = wrappers.OrderEnforcingWrapper(env)
+    if wrappers.validation_enabled(validate):
+        env = wrappers.AssertOutOfBoundsWrapper(env)
+        env = wrappers.OrderEnforcingWrapper(env)
     return env
 
 
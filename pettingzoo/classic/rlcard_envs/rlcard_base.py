@@ -1,3 +1,5 @@
+import copy
+
 import numpy as np
 import rlcard
 from gymnasium import spaces
@@ -133,6 +135,32 @@ class RLCardBase(AECEnv):
         self.next_legal_moves = list(sorted(obs["legal_actions"]))
         self._last_obs = obs["obs"]
 
+    def snapshot(self):
+        # the rlcard game holds the cards, the chips and its random number generator
+        return (
+            copy.deepcopy(self.env.game),
+            self.env.timestep,
+            list(self.env.action_recorder),
+            list(self.next_legal_moves),
+            self._last_obs,
+            self._snapshot_agents(),
+        )
+
+    def restore(self, snapshot):
+        (
+            game,
+            self.env.timestep,
+            action_recorder,
+            next_legal_moves,
+            self._last_obs,
+            agents,
+        ) = snapshot
+        self.env.game = copy.deepcopy(game)
+        self.env.np_random = self.env.game.np_random
+        self.env.action_recorder = list(action_recorder)
+        self.next_legal_moves = list(next_legal_moves)
+        self._restore_agents(agents)
+
     def render(self):
         raise NotImplementedError()
 
@@ -101,11 +101,12 @@ def get_font(path, size):
     return font
 
 
-def env(**kwargs):
+def env(validate=None, **kwargs):
     env = raw_env(**kwargs)
     env = wrappers.TerminateIllegalWrapper(env, illegal_reward=-1)
-    env = wrappers.AssertOutOfBoundsWrapper(env)
-    env = wrappers.OrderEnforcingWrapper(env)
+    if wrappers.validation_enabled(validate):
+        env = wrappers.AssertOutOfBoundsWrapper(env)
+        env = wrappers.OrderEnforcingWrapper(env)
     return env
 
 
@@ -240,6 +241,15 @@ class raw_env(AECEnv, EzPickle):
         elif self.render_mode == "rgb_array":
             self.screen = pygame.Surface((self.screen_height, self.screen_height))
 
+    def snapshot(self):
+        # the marks of the board fit in one byte each
+        return bytes(self.board.squares), self._snapshot_agents()
+
+    def restore(self, snapshot):
+        squares, agents = snapshot
+        self.board.squares = list(squares)
+        self._restore_agents(agents)
+
     def close(self):
         pass
 
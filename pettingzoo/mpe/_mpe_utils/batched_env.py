@@ -0,0 +1,142 @@
+import numpy as np
+from gymnasium.utils import seeding
+
+from pettingzoo.mpe._mpe_utils.core import BatchedWorld
+
+
+def make_batched_env(raw_env):
+    def batched_env(num_worlds=1, **kwargs):
+        return BatchedSimpleEnv(raw_env(**kwargs), num_worlds)
+
+    return batched_env
+
+
+# discrete movement actions [no_action, move_left, move_right, move_down, move_up]
+DISCRETE_MOVES = np.array(
+    [[0.0, 0.0], [-1.0, 0.0], [1.0, 0.0], [0.0, -1.0], [0.0, 1.0]]
+)
+
+
+class BatchedSimpleEnv:
+    """Simulates ``num_worlds`` copies of an MPE scenario at once, with a leading batch dimension.
+
+    Follows the `ParallelEnv` API, except that every value is batched: actions are
+    given as one array of shape ``(num_worlds,)`` (discrete) or ``(num_worlds, 5)``
+    (continuous) per agent, observations are returned as ``(num_worlds, obs_dim)``
+    arrays and rewards, terminations and truncations as ``(num_worlds,)`` arrays.
+    All worlds share the episode length, so they are truncated and reset together.
+
+    The scenario of ``env`` (a `SimpleEnv`) must implement the batched methods of
+    `BaseScenario`, which express its rewards and observations as array operations
+    on a `BatchedWorld`.
+
+    Example:
+        >>> from pettingzoo.mpe import simple_spread_v3
+        >>> envs = simple_spread_v3.batched_env(num_worlds=1024, N=3)
+        >>> observations, infos = envs.reset(seed=42)
+        >>> observations["agent_0"].shape
+        (1024, 18)
+    """
+
+    def __init__(self, env, num_worlds):
+        assert num_worlds > 0, "BatchedSimpleEnv requires at least one world"
+        self.num_worlds = num_worlds
+        self.scenario = env.scenario
+        self.world = BatchedWorld(env.world, num_worlds)
+        self.max_cycles = env.max_cycles
+        self.continuous_actions = env.continuous_actions
+        self.local_ratio = env.parallel_env.local_ratio
+        self.metadata = {"name": env.metadata.get("name"), "is_parallelizable": True}
+        self.possible_agents = env.possible_agents[:]
+        self.agents = self.possible_agents[:]
+        self.action_spaces = env.action_spaces
+        self.observation_spaces = env.observation_spaces
+        self.state_space = env.state_space
+        env.close()
+
+        self._sensitivity = np.array(
+            [5.0 if agent.accel is None else agent.accel for agent in self.world.agents]
+        )
+        self._seed()
+        self.steps = 0
+
+    def observation_space(self, agent):
+        return self.observation_spaces[agent]
+
+    def action_space(self, agent):
+        return self.action_spaces[agent]
+
+    def _seed(self, seed=None):
+        self.np_random, seed = seeding.np_random(seed)
+
+    def observe(self):
+        observations = self.scenario.batched_observations(self.world)
+        return {
+            agent: obs.astype(np.float32)
+            for agent, obs in zip(self.possible_agents, observations)
+        }
+
+    def state(self):
+        return np.concatenate(
+            self.scenario.batched_observations(self.world), axis=-1
+        ).astype(np.float32)
+
+    def reset(self, seed=None, options=None):
+        if seed is not None:
+            self._seed(seed=seed)
+        self.world.p_vel[:] = 0.0
+        self.world.c[:] = 0.0
+        self.scenario.reset_batched_world(self.world, self.np_random)
+
+        self.agents = self.possible_agents[:]
+        self.steps = 0
+
+        infos = {agent: {} for agent in self.agents}
+        return self.observe(), infos
+
+    def step(self, actions):
+        self.world.step(self._action_forces(actions))
+        self.steps += 1
+
+        batched_rewards = self.scenario.batched_rewards(self.world)
+        if self.local_ratio is not None:
+            global_reward = self.scenario.batched_global_reward(self.world)
+            batched_rewards = (
+                global_reward[:, None] * (1 - self.local_ratio)
+                + batched_rewards * self.local_ratio
+            )
+        truncated = self.steps >= self.max_cycles
+
+        observations = self.observe()
+        rewards = {
+            agent: batched_rewards[:, i].astype(np.float64)
+            for i, agent in enumerate(self.possible_agents)
+        }
+        terminations = {
+            agent: np.zeros(self.num_worlds, dtype=bool) for agent in self.agents
+        }
+        truncations = {
+            agent: np.full(self.num_worlds, truncated) for agent in self.agents
+        }
+        infos = {agent: {} for agent in self.agents}
+        if truncated:
+            self.agents = []
+        return observations, rewards, terminations, truncations, infos
+
+    def _action_forces(self, actions):
+        # (num_worlds, n_agents, dim_p) forces from the movement part of each action
+        forces = np.zeros((self.num_worlds, len(self.possible_agents), 2))
+        for i, agent in enumerate(self.possible_agents):
+            action = np.asarray(actions[agent])
+            if self.continuous_actions:
+                forces[:, i, 0] = action[:, 2] - action[:, 1]
+                forces[:, i, 1] = action[:, 4] - action[:, 3]
+            else:
+                forces[:, i] = DISCRETE_MOVES[action]
+        return forces * self._sensitivity[None, :, None]
+
+    def close(self):
+        pass
+
+    def __str__(self):
+        return f"{type(self).__name__}<{self.num_worlds}x{self.metadata['name']}>"
@@ -99,6 +99,10 @@ class World:  # multi-agent world
         # contact response parameters
         self.contact_force = 1e2
         self.contact_margin = 1e-3
+        # collision broadphase: if enabled, only pairs of entities closer than
+        # the sum of their sizes plus broadphase_margin are checked for contact
+        self.broadphase = False
+        self.broadphase_margin = 0.05
 
     # return all entities in the world
     @property
@@ -147,22 +151,41 @@ class World:  # multi-agent world
 
     # gather physical forces acting on entities
     def apply_environment_force(self, p_force):
-        # simple (but inefficient) collision response
-        for a, entity_a in enumerate(self.entities):
-            for b, entity_b in enumerate(self.entities):
-                if b <= a:
-                    continue
-                [f_a, f_b] = self.get_collision_force(entity_a, entity_b)
-                if f_a is not None:
-                    if p_force[a] is None:
-                        p_force[a] = 0.0
-                    p_force[a] = f_a + p_force[a]
-                if f_b is not None:
-                    if p_force[b] is None:
-                        p_force[b] = 0.0
-                    p_force[b] = f_b + p_force[b]
+        entities = self.entities
+        if self.broadphase:
+            pairs = zip(*self.get_collision_pairs(entities))
+        else:
+            # simple (but inefficient) collision response
+            pairs = (
+                (a, b)
+                for a in range(len(entities))
+                for b in range(a + 1, len(entities))
+            )
+        for a, b in pairs:
+            entity_a, entity_b = entities[a], entities[b]
+            [f_a, f_b] = self.get_collision_force(entity_a, entity_b)
+            if f_a is not None:
+                if p_force[a] is None:
+                    p_force[a] = 0.0
+                p_force[a] = f_a + p_force[a]
+            if f_b is not None:
+                if p_force[b] is None:
+                    p_force[b] = 0.0
+                p_force[b] = f_b + p_force[b]
         return p_force
 
+    # indices (a, b), a < b, of the colliding entities within contact range
+    def get_collision_pairs(self, entities):
+        colliders = np.array(
+            [i for i, entity in enumerate(entities) if entity.collide], dtype=int
+        )
+        p_pos = np.array([entities[i].state.p_pos for i in colliders]).reshape(
+            len(colliders), self.dim_p
+        )
+        radius = np.array([entities[i].size for i in colliders], dtype=float)
+        a, b = sweep_and_prune(p_pos, radius + self.broadphase_margin / 2)
+        return colliders[a], colliders[b]
+
     # integrate physical state
     def integrate_state(self, p_force):
         for i, entity in enumerate(self.entities):
@@ -216,3 +239,207 @@ class World:  # multi-agent world
         force_a = +force if entity_a.movable else None
         force_b = -force if entity_b.movable else None
         return [force_a, force_b]
+
+
+def sweep_and_prune(p_pos, radius):
+    """Returns the indices ``(a, b)``, ``a < b``, of all pairs of overlapping circles.
+
+    The circles are sorted along the first axis, so only pairs which overlap along
+    it are compared, in ``O(n log n)`` plus the number of such pairs.
+    """
+    n = len(p_pos)
+    if n < 2:
+        return np.zeros(0, dtype=int), np.zeros(0, dtype=int)
+    order = np.argsort(p_pos[:, 0], kind="stable")
+    x = p_pos[order, 0]
+    # circle i can only overlap the circles up to x_i + r_i + max(r) along the axis
+    end = np.searchsorted(x, x + radius[order] + np.max(radius), side="right")
+    counts = end - np.arange(n) - 1
+    first = np.repeat(np.arange(n), counts)
+    offsets = np.arange(np.sum(counts)) - np.repeat(np.cumsum(counts) - counts, counts)
+    a, b = order[first], order[first + 1 + offsets]
+    overlap = np.sum(np.square(p_pos[a] - p_pos[b]), axis=-1) < np.square(
+        radius[a] + radius[b]
+    )
+    a, b = np.minimum(a[overlap], b[overlap]), np.maximum(a[overlap], b[overlap])
+    pairs = np.lexsort((b, a))
+    return a[pairs], b[pairs]
+
+
+class VectorizedWorld(World):  # multi-agent world with array-backed physics
+    """World whose physics are computed on structure-of-arrays entity state.
+
+    Positions and velocities of all entities live in the contiguous ``p_pos`` and
+    ``p_vel`` arrays, and the ``state.p_pos`` and ``state.p_vel`` of each entity
+    are views of its row. They are only gathered again when a scenario or a
+    restored snapshot replaces the arrays of an entity state (e.g. in
+    ``reset_world``), since the entities then no longer share the world's memory.
+    Masses, sizes and the movable/collide flags are gathered every step. Contact
+    forces are computed for all pairs with broadcasting and every entity is
+    integrated in a single vectorized pass, instead of the per-pair and per-entity
+    Python loops of `World`. Results match `World` up to floating point rounding.
+
+    The physics methods accept state arrays with any number of leading batch
+    dimensions, which `BatchedWorld` relies on. With ``broadphase`` enabled, an
+    unbatched world only computes the forces between the pairs of entities found
+    by `sweep_and_prune`.
+    """
+
+    @classmethod
+    def from_world(cls, world):
+        # convert a world built by a scenario, keeping its entities and parameters
+        vectorized = cls.__new__(cls)
+        vectorized.__dict__.update(world.__dict__)
+        return vectorized
+
+    # update state of the world
+    def step(self):
+        # set actions for scripted agents
+        for agent in self.scripted_agents:
+            agent.action = agent.action_callback(agent, self)
+        entities = self.entities
+        if self.state_is_bound(entities):
+            self.gather_properties(entities)
+        else:
+            self.gather_state(entities)
+        # gather agent action forces
+        p_force = np.zeros_like(self.p_pos)
+        for i, force in enumerate(self.apply_action_force([None] * len(entities))):
+            if force is not None:
+                p_force[i] = force
+        # apply environment forces
+        p_force += self.get_collision_forces()
+        # integrate physical state
+        self.integrate_arrays(p_force)
+        # update agent state
+        for agent in self.agents:
+            self.update_agent_state(agent)
+
+    # copy the physical properties of all entities into contiguous arrays
+    def gather_properties(self, entities):
+        self.mass = np.array([entity.mass for entity in entities], dtype=float)
+        self.size = np.array([entity.size for entity in entities], dtype=float)
+        self.movable = np.array([entity.movable for entity in entities], dtype=bool)
+        self.collide = np.array([entity.collide for entity in entities], dtype=bool)
+        self.max_speed = np.array(
+            [
+                np.inf if entity.max_speed is None else entity.max_speed
+                for entity in entities
+            ],
+            dtype=float,
+        )
+
+    # whether the entity states are still the rows of p_pos and p_vel
+    def state_is_bound(self, entities):
+        p_pos, p_vel = self.__dict__.get("p_pos"), self.__dict__.get("p_vel")
+        return (
+            p_pos is not None
+            and len(p_pos) == len(entities)
+            and all(
+                entity.state.p_pos.base is p_pos and entity.state.p_vel.base is p_vel
+                for entity in entities
+            )
+        )
+
+    # copy the state and properties of all entities into contiguous arrays and
+    # make the entity states views of them, so integrating updates the entities
+    def gather_state(self, entities):
+        self.gather_properties(entities)
+        self.p_pos = np.array([entity.state.p_pos for entity in entities], dtype=float)
+        self.p_vel = np.array([entity.state.p_vel for entity in entities], dtype=float)
+        for i, entity in enumerate(entities):
+            entity.state.p_pos = self.p_pos[i]
+            entity.state.p_vel = self.p_vel[i]
+
+    # softplus contact forces between all pairs of colliding entities
+    def get_collision_forces(self):
+        if self.broadphase and self.p_pos.ndim == 2:
+            return self.get_pair_collision_forces()
+        delta_pos = self.p_pos[..., :, None, :] - self.p_pos[..., None, :, :]
+        dist = np.sqrt(np.sum(np.square(delta_pos), axis=-1))
+        dist_min = self.size[:, None] + self.size[None, :]
+        contact = self.collide[:, None] & self.collide[None, :]
+        np.fill_diagonal(contact, False)
+        k = self.contact_margin
+        penetration = np.logaddexp(0, -(dist - dist_min) / k) * k
+        # entities never collide with themselves, so avoid dividing by zero there
+        dist = np.where(contact, dist, 1.0)
+        scale = np.where(contact, self.contact_force * penetration / dist, 0.0)
+        forces = np.sum(scale[..., None] * delta_pos, axis=-2)
+        forces[..., ~self.movable, :] = 0.0
+        return forces
+
+    # softplus contact forces between the pairs found by the broadphase
+    def get_pair_collision_forces(self):
+        colliders = np.flatnonzero(self.collide)
+        a, b = sweep_and_prune(
+            self.p_pos[colliders], self.size[colliders] + self.broadphase_margin / 2
+        )
+        a, b = colliders[a], colliders[b]
+        delta_pos = self.p_pos[a] - self.p_pos[b]
+        dist = np.sqrt(np.sum(np.square(delta_pos), axis=-1))
+        k = self.contact_margin
+        penetration = np.logaddexp(0, -(dist - self.size[a] - self.size[b]) / k) * k
+        force = (self.contact_force * penetration / dist)[:, None] * delta_pos
+        forces = np.zeros_like(self.p_pos)
+        np.add.at(forces, a, force)
+        np.add.at(forces, b, -force)
+        forces[~self.movable] = 0.0
+        return forces
+
+    # integrate the physical state of all movable entities at once
+    def integrate_arrays(self, p_force):
+        movable = self.movable
+        self.p_pos[..., movable, :] += self.p_vel[..., movable, :] * self.dt
+        self.p_vel[..., movable, :] *= 1 - self.damping
+        self.p_vel[..., movable, :] += (
+            p_force[..., movable, :] / self.mass[movable, None]
+        ) * self.dt
+        speed = np.sqrt(np.sum(np.square(self.p_vel), axis=-1))
+        too_fast = movable & (speed > self.max_speed)
+        max_speed = np.broadcast_to(self.max_speed, speed.shape)
+        self.p_vel[too_fast] *= (max_speed[too_fast] / speed[too_fast])[:, None]
+
+
+class BatchedWorld(VectorizedWorld):  # many independent copies of a world
+    """Simulates ``num_worlds`` independent copies of a world in lockstep.
+
+    The entities of the template ``world`` only provide the physical properties
+    and scenario attributes (e.g. ``agent.adversary``). The state of every copy
+    lives in ``p_pos`` and ``p_vel`` of shape ``(num_worlds, n_entities, dim_p)``
+    and the communication state in ``c`` of shape ``(num_worlds, n_agents, dim_c)``,
+    with agents first and landmarks after them, as in ``world.entities``.
+    """
+
+    def __init__(self, world, num_worlds):
+        self.__dict__.update(world.__dict__)
+        assert not self.scripted_agents, "Batched worlds do not support scripted agents"
+        for agent in self.agents:
+            assert (
+                agent.silent and not agent.u_noise
+            ), "Batched worlds only support silent agents without action noise"
+        self.num_worlds = num_worlds
+        self.gather_properties(self.entities)
+        n_entities = len(self.agents) + len(self.landmarks)
+        self.p_pos = np.zeros((num_worlds, n_entities, self.dim_p))
+        self.p_vel = np.zeros((num_worlds, n_entities, self.dim_p))
+        self.c = np.zeros((num_worlds, len(self.agents), self.dim_c))
+
+    @property
+    def agent_pos(self):
+        return self.p_pos[:, : len(self.agents)]
+
+    @property
+    def agent_vel(self):
+        return self.p_vel[:, : len(self.agents)]
+
+    @property
+    def landmark_pos(self):
+        return self.p_pos[:, len(self.agents) :]
+
+    # step every world with the (num_worlds, n_agents, dim_p) agent action forces
+    def step(self, action_force):
+        p_force = np.zeros_like(self.p_pos)
+        p_force[:, : len(self.agents)] = action_force
+        p_force += self.get_collision_forces()
+        self.integrate_arrays(p_force)
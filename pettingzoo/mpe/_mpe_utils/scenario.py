@@ -1,6 +1,29 @@
+import numpy as np
+
+
 class BaseScenario:  # defines scenario upon which the world is built
     def make_world(self):  # create elements of the world
         raise NotImplementedError()
 
     def reset_world(self, world, np_random):  # create initial conditions of the world
         raise NotImplementedError()
+
+    # batched simulation (see BatchedWorld), implemented by some scenarios
+    def reset_batched_world(self, world, np_random):  # reset every copy of the world
+        raise NotImplementedError()
+
+    def batched_rewards(self, world):  # (num_worlds, n_agents) rewards
+        raise NotImplementedError()
+
+    def batched_observations(self, world):  # one (num_worlds, obs_dim) array per agent
+        raise NotImplementedError()
+
+    def load_batched_world(
+        self, world, batched_world, index
+    ):  # copy world into a batch
+        batched_world.p_pos[index] = [entity.state.p_pos for entity in world.entities]
+        batched_world.p_vel[index] = [entity.state.p_vel for entity in world.entities]
+        batched_world.c[index] = [
+            np.zeros(world.dim_c) if agent.state.c is None else agent.state.c
+            for agent in world.agents
+        ]
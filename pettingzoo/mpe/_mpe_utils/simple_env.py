@@ -1,3 +1,4 @@
+import copy
 import os
 
 import gymnasium
@@ -6,28 +7,57 @@ import pygame
 from gymnasium import spaces
 from gymnasium.utils import seeding
 
-from pettingzoo import AECEnv
-from pettingzoo.mpe._mpe_utils.core import Agent
+from pettingzoo import AECEnv, ParallelEnv
+from pettingzoo.mpe._mpe_utils.core import Agent, BatchedWorld, Entity, VectorizedWorld
+from pettingzoo.mpe._mpe_utils.scenario import BaseScenario
 from pettingzoo.utils import wrappers
 from pettingzoo.utils.agent_selector import AgentSelector
+from pettingzoo.utils.env_logger import EnvLogger
 
 alphabet = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
 
+# entity attributes which scenarios set in reset_world, next to the entity state
+_EPISODE_ATTRIBUTES = ("color", "goal_a", "goal_b", "key", "index")
+
 
 def make_env(raw_env):
-    def env(**kwargs):
+    def env(validate=None, **kwargs):
+        validate = wrappers.validation_enabled(validate)
         env = raw_env(**kwargs)
         if env.continuous_actions:
             env = wrappers.ClipOutOfBoundsWrapper(env)
-        else:
+        elif validate:
             env = wrappers.AssertOutOfBoundsWrapper(env)
-        env = wrappers.OrderEnforcingWrapper(env)
+        if validate:
+            env = wrappers.OrderEnforcingWrapper(env)
         return env
 
     return env
 
 
-class SimpleEnv(AECEnv):
+def make_parallel_env(raw_env):
+    # the native parallel environments check their actions like the wrappers
+    # of make_env do, see SimpleParallelEnv._check_actions
+    def parallel_env(validate=None, **kwargs):
+        env = raw_env(**kwargs).parallel_env
+        env.validate = wrappers.validation_enabled(validate)
+        return env
+
+    return parallel_env
+
+
+def _rebuild_parallel_env(aec_env, validate):
+    parallel_env = aec_env.parallel_env
+    parallel_env.validate = validate
+    return parallel_env
+
+
+class SimpleParallelEnv(ParallelEnv):
+    """Simulates an MPE scenario, applying the actions of all agents with a single `World.step`.
+
+    `SimpleEnv` derives the AEC version of a scenario from this class.
+    """
+
     metadata = {
         "render_modes": ["human", "rgb_array"],
         "is_parallelizable": True,
@@ -43,9 +73,9 @@ class SimpleEnv(AECEnv):
         continuous_actions=False,
         local_ratio=None,
         dynamic_rescaling=False,
+        vectorized_physics=False,
     ):
-        super().__init__()
-
+        self.metadata = dict(self.metadata)
         self.render_mode = render_mode
         pygame.init()
         self.viewer = None
@@ -64,12 +94,20 @@ class SimpleEnv(AECEnv):
 
         self.max_cycles = max_cycles
         self.scenario = scenario
-        self.world = world
+        self.world = VectorizedWorld.from_world(world) if vectorized_physics else world
         self.continuous_actions = continuous_actions
         self.local_ratio = local_ratio
         self.dynamic_rescaling = dynamic_rescaling
 
         self.scenario.reset_world(self.world, self.np_random)
+        # scenarios with batched observations compute those of all agents at once
+        self._batched_world = None
+        if (
+            type(self.scenario).batched_observations
+            is not BaseScenario.batched_observations
+        ):
+            self._batched_world = BatchedWorld(self.world, 1)
+        self._state = None
 
         self.agents = [agent.name for agent in self.world.agents]
         self.possible_agents = self.agents[:]
@@ -77,11 +115,10 @@ class SimpleEnv(AECEnv):
             agent.name: idx for idx, agent in enumerate(self.world.agents)
         }
 
-        self._agent_selector = AgentSelector(self.agents)
-
         # set spaces
         self.action_spaces = dict()
         self.observation_spaces = dict()
+        self._observation_slices = dict()
         state_dim = 0
         for agent in self.world.agents:
             if agent.movable:
@@ -110,6 +147,7 @@ class SimpleEnv(AECEnv):
                 shape=(obs_dim,),
                 dtype=np.float32,
             )
+            self._observation_slices[agent.name] = slice(state_dim - obs_dim, state_dim)
 
         self.state_space = spaces.Box(
             low=-np.float32(np.inf),
@@ -124,8 +162,8 @@ class SimpleEnv(AECEnv):
         self.original_cam_range = np.max(np.abs(np.array(all_poses)))
 
         self.steps = 0
-
-        self.current_actions = [None] * self.num_agents
+        # set by make_parallel_env, asserts that discrete actions are in their space
+        self.validate = False
 
     def observation_space(self, agent):
         return self.observation_spaces[agent]
@@ -137,40 +175,152 @@ class SimpleEnv(AECEnv):
         self.np_random, seed = seeding.np_random(seed)
 
     def observe(self, agent):
-        return self.scenario.observation(
-            self.world.agents[self._index_map[agent]], self.world
-        ).astype(np.float32)
+        """Returns the observation of ``agent``.
+
+        Observations are computed once per world step and cached until the next
+        one, so the arrays returned are read-only views of a shared buffer.
+        """
+        return self._observations()[self._observation_slices[agent]]
 
     def state(self):
-        states = tuple(
-            self.scenario.observation(
-                self.world.agents[self._index_map[agent]], self.world
-            ).astype(np.float32)
-            for agent in self.possible_agents
-        )
-        return np.concatenate(states, axis=None)
+        """Returns the concatenated observations of all agents, as a new array."""
+        return self._observations().copy()
+
+    def _observations(self):
+        # the observations of all agents, computed once per world step
+        if self._state is None:
+            with self.profile_section("observations"):
+                if self._batched_world is not None:
+                    self.scenario.load_batched_world(self.world, self._batched_world, 0)
+                    observations = [
+                        obs[0]
+                        for obs in self.scenario.batched_observations(
+                            self._batched_world
+                        )
+                    ]
+                else:
+                    observations = [
+                        self.scenario.observation(agent, self.world)
+                        for agent in self.world.agents
+                    ]
+                self._state = np.concatenate(observations, axis=None).astype(np.float32)
+                self._state.flags.writeable = False
+        return self._state
 
     def reset(self, seed=None, options=None):
         if seed is not None:
             self._seed(seed=seed)
         self.scenario.reset_world(self.world, self.np_random)
+        self._state = None
 
         self.agents = self.possible_agents[:]
-        self.rewards = {name: 0.0 for name in self.agents}
-        self._cumulative_rewards = {name: 0.0 for name in self.agents}
-        self.terminations = {name: False for name in self.agents}
-        self.truncations = {name: False for name in self.agents}
-        self.infos = {name: {} for name in self.agents}
-
-        self.agent_selection = self._agent_selector.reset()
         self.steps = 0
 
-        self.current_actions = [None] * self.num_agents
+        observations = {agent: self.observe(agent) for agent in self.agents}
+        infos = {agent: {} for agent in self.agents}
+        return observations, infos
+
+    def snapshot(self):
+        """Returns the state of the world as arrays, see `ParallelEnv.snapshot`.
+
+        Positions and velocities are stacked for all entities and communication
+        states for all agents. Colors and goals, which scenarios pick in
+        ``reset_world``, are stored per entity, goals as the index of the goal
+        entity.
+        """
+        entities = self.world.entities
+        index = {id(entity): i for i, entity in enumerate(entities)}
+        values, references = {}, {}
+        for i, entity in enumerate(entities):
+            for name in _EPISODE_ATTRIBUTES:
+                if not hasattr(entity, name):
+                    continue
+                value = getattr(entity, name)
+                if isinstance(value, Entity):
+                    references[i, name] = index[id(value)]
+                else:
+                    values[i, name] = copy.deepcopy(value)
+        return (
+            np.array([entity.state.p_pos for entity in entities]),
+            np.array([entity.state.p_vel for entity in entities]),
+            np.array([agent.state.c for agent in self.world.agents]),
+            values,
+            references,
+            list(self.agents),
+            self.steps,
+            self.np_random.bit_generator.state,
+        )
+
+    def restore(self, snapshot):
+        (
+            p_pos,
+            p_vel,
+            c,
+            values,
+            references,
+            agents,
+            self.steps,
+            self.np_random.bit_generator.state,
+        ) = snapshot
+        entities = self.world.entities
+        for entity, entity_p_pos, entity_p_vel in zip(entities, p_pos, p_vel):
+            entity.state.p_pos = entity_p_pos.copy()
+            entity.state.p_vel = entity_p_vel.copy()
+        for agent, agent_c in zip(self.world.agents, c):
+            agent.state.c = agent_c.copy()
+        for (i, name), value in values.items():
+            setattr(entities[i], name, copy.deepcopy(value))
+        for (i, name), goal in references.items():
+            setattr(entities[i], name, entities[goal])
+        self.agents = list(agents)
+        self._state = None
+
+    def step(self, actions):
+        rewards = self._execute_world_step(self._check_actions(actions))
+        truncated = self.steps >= self.max_cycles
+
+        observations = {agent: self.observe(agent) for agent in self.agents}
+        terminations = {agent: False for agent in self.agents}
+        truncations = {agent: truncated for agent in self.agents}
+        infos = {agent: {} for agent in self.agents}
+        if truncated:
+            self.agents = []
+
+        if self.render_mode == "human":
+            self.render()
+        return observations, rewards, terminations, truncations, infos
+
+    def _check_actions(self, actions):
+        """Clips continuous actions to their space and, with ``validate``, asserts that discrete actions are in their space.
+
+        These are the checks of the ClipOutOfBoundsWrapper and
+        AssertOutOfBoundsWrapper which `make_env` wraps the AEC environment in.
+        """
+        if not (self.continuous_actions or self.validate):
+            return actions
+        checked = dict(actions)
+        for agent, action in actions.items():
+            space = self.action_spaces[agent]
+            if space.contains(action):
+                continue
+            assert self.continuous_actions, "action is not in action space"
+            if action is None or np.isnan(action).any():
+                EnvLogger.error_nan_action()
+            action = np.asarray(action)
+            assert (
+                space.shape == action.shape
+            ), f"action should have shape {space.shape}, has shape {action.shape}"
+            EnvLogger.warn_action_out_of_bound(
+                action=action, action_space=space, backup_policy="clipping to space"
+            )
+            checked[agent] = np.clip(action, space.low, space.high)
+        return checked
 
-    def _execute_world_step(self):
+    def _execute_world_step(self, actions):
+        """Applies the actions of all agents, steps the world once and returns the rewards."""
         # set action for each agent
-        for i, agent in enumerate(self.world.agents):
-            action = self.current_actions[i]
+        for agent in self.world.agents:
+            action = actions[agent.name]
             scenario_action = []
             if agent.movable:
                 mdim = self.world.dim_p * 2 + 1
@@ -184,23 +334,29 @@ class SimpleEnv(AECEnv):
                 scenario_action.append(action)
             self._set_action(scenario_action, agent, self.action_spaces[agent.name])
 
-        self.world.step()
+        with self.profile_section("world.step"):
+            self.world.step()
+        self._state = None
+        self.steps += 1
 
-        global_reward = 0.0
-        if self.local_ratio is not None:
-            global_reward = float(self.scenario.global_reward(self.world))
-
-        for agent in self.world.agents:
-            agent_reward = float(self.scenario.reward(agent, self.world))
+        with self.profile_section("rewards"):
+            rewards = {}
+            global_reward = 0.0
             if self.local_ratio is not None:
-                reward = (
-                    global_reward * (1 - self.local_ratio)
-                    + agent_reward * self.local_ratio
-                )
-            else:
-                reward = agent_reward
+                global_reward = float(self.scenario.global_reward(self.world))
+
+            for agent in self.world.agents:
+                agent_reward = float(self.scenario.reward(agent, self.world))
+                if self.local_ratio is not None:
+                    reward = (
+                        global_reward * (1 - self.local_ratio)
+                        + agent_reward * self.local_ratio
+                    )
+                else:
+                    reward = agent_reward
 
-            self.rewards[agent.name] = reward
+                rewards[agent.name] = reward
+        return rewards
 
     # set env action for a particular agent
     def _set_action(self, action, agent, action_space, time=None):
@@ -241,35 +397,6 @@ class SimpleEnv(AECEnv):
         # make sure we used all elements of action
         assert len(action) == 0
 
-    def step(self, action):
-        if (
-            self.terminations[self.agent_selection]
-            or self.truncations[self.agent_selection]
-        ):
-            self._was_dead_step(action)
-            return
-        cur_agent = self.agent_selection
-        current_idx = self._index_map[self.agent_selection]
-        next_idx = (current_idx + 1) % self.num_agents
-        self.agent_selection = self._agent_selector.next()
-
-        self.current_actions[current_idx] = action
-
-        if next_idx == 0:
-            self._execute_world_step()
-            self.steps += 1
-            if self.steps >= self.max_cycles:
-                for a in self.agents:
-                    self.truncations[a] = True
-        else:
-            self._clear_rewards()
-
-        self._cumulative_rewards[cur_agent] = 0
-        self._accumulate_rewards()
-
-        if self.render_mode == "human":
-            self.render()
-
     def enable_render(self, mode="human"):
         if not self.renderOn and mode == "human":
             self.screen = pygame.display.set_mode(self.screen.get_size())
@@ -285,7 +412,8 @@ class SimpleEnv(AECEnv):
 
         self.enable_render(self.render_mode)
 
-        self.draw()
+        with self.profile_section("draw"):
+            self.draw()
         if self.render_mode == "rgb_array":
             observation = np.array(pygame.surfarray.pixels3d(self.screen))
             return np.transpose(observation, axes=(1, 0, 2))
@@ -358,3 +486,161 @@ class SimpleEnv(AECEnv):
         if self.screen is not None:
             pygame.quit()
             self.screen = None
+
+    def __reduce__(self):
+        # pygame surfaces cannot be pickled, so environments created by a scenario's
+        # raw_env are rebuilt through the (EzPickle) AEC environment that owns them
+        if getattr(self, "_aec_env", None) is None:
+            return super().__reduce__()
+        return _rebuild_parallel_env, (self._aec_env, self.validate)
+
+
+class SimpleEnv(AECEnv):
+    """AEC version of an MPE scenario, which steps its `SimpleParallelEnv` once every agent has acted."""
+
+    metadata = SimpleParallelEnv.metadata
+
+    def __init__(
+        self,
+        scenario,
+        world,
+        max_cycles,
+        render_mode=None,
+        continuous_actions=False,
+        local_ratio=None,
+        dynamic_rescaling=False,
+        vectorized_physics=False,
+    ):
+        super().__init__()
+
+        self.parallel_env = SimpleParallelEnv(
+            scenario,
+            world,
+            max_cycles,
+            render_mode=render_mode,
+            continuous_actions=continuous_actions,
+            local_ratio=local_ratio,
+            dynamic_rescaling=dynamic_rescaling,
+            vectorized_physics=vectorized_physics,
+        )
+        self.parallel_env._aec_env = self
+        self.metadata = self.parallel_env.metadata
+        self.render_mode = render_mode
+
+        self.agents = self.parallel_env.possible_agents[:]
+        self.possible_agents = self.agents[:]
+        self._index_map = self.parallel_env._index_map
+        self._agent_selector = AgentSelector(self.agents)
+
+        self.action_spaces = self.parallel_env.action_spaces
+        self.observation_spaces = self.parallel_env.observation_spaces
+        self.state_space = self.parallel_env.state_space
+
+        self.current_actions = {}
+
+    @property
+    def scenario(self):
+        return self.parallel_env.scenario
+
+    @property
+    def world(self):
+        return self.parallel_env.world
+
+    @property
+    def max_cycles(self):
+        return self.parallel_env.max_cycles
+
+    @max_cycles.setter
+    def max_cycles(self, max_cycles):
+        self.parallel_env.max_cycles = max_cycles
+
+    @property
+    def steps(self):
+        return self.parallel_env.steps
+
+    @property
+    def continuous_actions(self):
+        return self.parallel_env.continuous_actions
+
+    @property
+    def _profiler(self):
+        # the sections are timed in the parallel env, which does the work
+        return self.parallel_env._profiler
+
+    @_profiler.setter
+    def _profiler(self, profiler):
+        self.parallel_env._profiler = profiler
+
+    def observation_space(self, agent):
+        return self.observation_spaces[agent]
+
+    def action_space(self, agent):
+        return self.action_spaces[agent]
+
+    def observe(self, agent):
+        return self.parallel_env.observe(agent)
+
+    def state(self):
+        return self.parallel_env.state()
+
+    def snapshot(self):
+        return (
+            self.parallel_env.snapshot(),
+            copy.deepcopy(self.current_actions),
+            self._snapshot_agents(),
+        )
+
+    def restore(self, snapshot):
+        parallel_snapshot, current_actions, agents = snapshot
+        self.parallel_env.restore(parallel_snapshot)
+        self.current_actions = copy.deepcopy(current_actions)
+        self._restore_agents(agents)
+
+    def reset(self, seed=None, options=None):
+        self.parallel_env.reset(seed=seed, options=options)
+
+        self.agents = self.possible_agents[:]
+        self.rewards = {name: 0.0 for name in self.agents}
+        self._cumulative_rewards = {name: 0.0 for name in self.agents}
+        self.terminations = {name: False for name in self.agents}
+        self.truncations = {name: False for name in self.agents}
+        self.infos = {name: {} for name in self.agents}
+
+        self.agent_selection = self._agent_selector.reset()
+        self.current_actions = {}
+
+    def step(self, action):
+        if (
+            self.terminations[self.agent_selection]
+            or self.truncations[self.agent_selection]
+        ):
+            self._was_dead_step(action)
+            return
+        cur_agent = self.agent_selection
+        current_idx = self._index_map[self.agent_selection]
+        next_idx = (current_idx + 1) % self.num_agents
+        self.agent_selection = self._agent_selector.next()
+
+        self.current_actions[cur_agent] = action
+
+        if next_idx == 0:
+            self.rewards.update(
+                self.parallel_env._execute_world_step(self.current_actions)
+            )
+            if self.steps >= self.max_cycles:
+                for a in self.agents:
+                    self.truncations[a] = True
+        else:
+            self._clear_rewards()
+
+        self._cumulative_rewards[cur_agent] = 0
+        self._accumulate_rewards()
+
+        if self.render_mode == "human":
+            self.render()
+
+    def render(self):
+        return self.parallel_env.render()
+
+    def close(self):
+        self.parallel_env.close()
@@ -31,7 +31,7 @@ Observation space: `[self_vel, landmark_rel_position]`
 ### Arguments
 
 ``` python
-simple_v3.env(max_cycles=25, continuous_actions=False, dynamic_rescaling=False)
+simple_v3.env(max_cycles=25, continuous_actions=False, dynamic_rescaling=False, vectorized_physics=False)
 ```
 
 
@@ -42,15 +42,17 @@ simple_v3.env(max_cycles=25, continuous_actions=False, dynamic_rescaling=False)
 
 `dynamic_rescaling`: Whether to rescale the size of agents and landmarks based on the screen size
 
+`vectorized_physics`: Whether to simulate the world with array-backed physics, which is much faster with many agents and landmarks
+
 """
 
 import numpy as np
 from gymnasium.utils import EzPickle
 
+from pettingzoo.mpe._mpe_utils.batched_env import make_batched_env
 from pettingzoo.mpe._mpe_utils.core import Agent, Landmark, World
 from pettingzoo.mpe._mpe_utils.scenario import BaseScenario
-from pettingzoo.mpe._mpe_utils.simple_env import SimpleEnv, make_env
-from pettingzoo.utils.conversions import parallel_wrapper_fn
+from pettingzoo.mpe._mpe_utils.simple_env import SimpleEnv, make_env, make_parallel_env
 
 
 class raw_env(SimpleEnv, EzPickle):
@@ -60,12 +62,14 @@ class raw_env(SimpleEnv, EzPickle):
         continuous_actions=False,
         render_mode=None,
         dynamic_rescaling=False,
+        vectorized_physics=False,
     ):
         EzPickle.__init__(
             self,
             max_cycles=max_cycles,
             continuous_actions=continuous_actions,
             render_mode=render_mode,
+            vectorized_physics=vectorized_physics,
         )
         scenario = Scenario()
         world = scenario.make_world()
@@ -77,12 +81,14 @@ class raw_env(SimpleEnv, EzPickle):
             max_cycles=max_cycles,
             continuous_actions=continuous_actions,
             dynamic_rescaling=dynamic_rescaling,
+            vectorized_physics=vectorized_physics,
         )
         self.metadata["name"] = "simple_v3"
 
 
 env = make_env(raw_env)
-parallel_env = parallel_wrapper_fn(env)
+parallel_env = make_parallel_env(raw_env)
+batched_env = make_batched_env(raw_env)
 
 
 class Scenario(BaseScenario):
@@ -129,3 +135,21 @@ class Scenario(BaseScenario):
         for entity in world.landmarks:
             entity_pos.append(entity.state.p_pos - agent.state.p_pos)
         return np.concatenate([agent.state.p_vel] + entity_pos)
+
+    def reset_batched_world(self, world, np_random):
+        world.p_pos[:] = np_random.uniform(-1, +1, world.p_pos.shape)
+
+    def batched_rewards(self, world):
+        delta_pos = world.agent_pos - world.landmark_pos[:, :1]
+        return -np.sum(np.square(delta_pos), axis=-1)
+
+    def batched_observations(self, world):
+        # positions of all landmarks in each agent's reference frame
+        entity_pos = world.landmark_pos[:, None] - world.agent_pos[:, :, None]
+        return [
+            np.concatenate(
+                [world.agent_vel[:, i], entity_pos[:, i].reshape(world.num_worlds, -1)],
+                axis=-1,
+            )
+            for i in range(len(world.agents))
+        ]
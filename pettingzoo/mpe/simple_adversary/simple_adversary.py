@@ -39,7 +39,7 @@ Adversary action space: `[no_action, move_left, move_right, move_down, move_up]`
 ### Arguments
 
 ``` python
-simple_adversary_v3.env(N=2, max_cycles=25, continuous_actions=False, dynamic_rescaling=False)
+simple_adversary_v3.env(N=2, max_cycles=25, continuous_actions=False, dynamic_rescaling=False, vectorized_physics=False)
 ```
 
 
@@ -52,15 +52,17 @@ simple_adversary_v3.env(N=2, max_cycles=25, continuous_actions=False, dynamic_re
 
 `dynamic_rescaling`: Whether to rescale the size of agents and landmarks based on the screen size
 
+`vectorized_physics`: Whether to simulate the world with array-backed physics, which is much faster with many agents and landmarks
+
 """
 
 import numpy as np
 from gymnasium.utils import EzPickle
 
+from pettingzoo.mpe._mpe_utils.batched_env import make_batched_env
 from pettingzoo.mpe._mpe_utils.core import Agent, Landmark, World
 from pettingzoo.mpe._mpe_utils.scenario import BaseScenario
-from pettingzoo.mpe._mpe_utils.simple_env import SimpleEnv, make_env
-from pettingzoo.utils.conversions import parallel_wrapper_fn
+from pettingzoo.mpe._mpe_utils.simple_env import SimpleEnv, make_env, make_parallel_env
 
 
 class raw_env(SimpleEnv, EzPickle):
@@ -71,6 +73,7 @@ class raw_env(SimpleEnv, EzPickle):
         continuous_actions=False,
         render_mode=None,
         dynamic_rescaling=False,
+        vectorized_physics=False,
     ):
         EzPickle.__init__(
             self,
@@ -78,6 +81,7 @@ class raw_env(SimpleEnv, EzPickle):
             max_cycles=max_cycles,
             continuous_actions=continuous_actions,
             render_mode=render_mode,
+            vectorized_physics=vectorized_physics,
         )
         scenario = Scenario()
         world = scenario.make_world(N)
@@ -89,12 +93,14 @@ class raw_env(SimpleEnv, EzPickle):
             max_cycles=max_cycles,
             continuous_actions=continuous_actions,
             dynamic_rescaling=dynamic_rescaling,
+            vectorized_physics=vectorized_physics,
         )
         self.metadata["name"] = "simple_adversary_v3"
 
 
 env = make_env(raw_env)
-parallel_env = parallel_wrapper_fn(env)
+parallel_env = make_parallel_env(raw_env)
+batched_env = make_batched_env(raw_env)
 
 
 class Scenario(BaseScenario):
@@ -258,3 +264,46 @@ class Scenario(BaseScenario):
             )
         else:
             return np.concatenate(entity_pos + other_pos)
+
+    def reset_batched_world(self, world, np_random):
+        # set goal landmark
+        world.goal = np_random.integers(len(world.landmarks), size=world.num_worlds)
+        world.p_pos[:] = np_random.uniform(-1, +1, world.p_pos.shape)
+
+    def batched_goal_dists(self, world):
+        # (num_worlds, n_agents) distance of every agent to the goal landmark
+        goal_pos = world.landmark_pos[np.arange(world.num_worlds), world.goal]
+        return np.sqrt(np.sum(np.square(world.agent_pos - goal_pos[:, None]), axis=-1))
+
+    def load_batched_world(self, world, batched_world, index):
+        super().load_batched_world(world, batched_world, index)
+        if not hasattr(batched_world, "goal"):
+            batched_world.goal = np.zeros(batched_world.num_worlds, dtype=int)
+        batched_world.goal[index] = world.landmarks.index(world.agents[0].goal_a)
+
+    def batched_rewards(self, world):
+        adversary = np.array([agent.adversary for agent in world.agents])
+        dists = self.batched_goal_dists(world)
+        # good agents: closest good agent to the goal, and how far the adversaries are
+        agent_rew = -np.min(dists[:, ~adversary], axis=-1) + np.sum(
+            dists[:, adversary], axis=-1
+        )
+        return np.where(adversary, -dists, agent_rew[:, None])
+
+    def batched_observations(self, world):
+        n = len(world.agents)
+        others = ~np.eye(n, dtype=bool)
+        goal_pos = world.landmark_pos[np.arange(world.num_worlds), world.goal]
+        # positions of all entities in each agent's reference frame
+        entity_pos = world.landmark_pos[:, None] - world.agent_pos[:, :, None]
+        other_pos = world.agent_pos[:, None] - world.agent_pos[:, :, None]
+        observations = []
+        for i, agent in enumerate(world.agents):
+            obs = [
+                entity_pos[:, i].reshape(world.num_worlds, -1),
+                other_pos[:, i, others[i]].reshape(world.num_worlds, -1),
+            ]
+            if not agent.adversary:
+                obs.insert(0, goal_pos - world.agent_pos[:, i])
+            observations.append(np.concatenate(obs, axis=-1))
+        return observations
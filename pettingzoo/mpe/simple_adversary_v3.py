@@ -1,3 +1,8 @@
-from pettingzoo.mpe.simple_adversary.simple_adversary import env, parallel_env, raw_env
+from pettingzoo.mpe.simple_adversary.simple_adversary import (
+    batched_env,
+    env,
+    parallel_env,
+    raw_env,
+)
 
-__all__ = ["env", "parallel_env", "raw_env"]
+__all__ = ["batched_env", "env", "parallel_env", "raw_env"]
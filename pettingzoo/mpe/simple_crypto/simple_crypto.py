@@ -45,7 +45,7 @@ For Bob and Eve, their communication is checked to be the 1 bit of information t
 ### Arguments
 
 ``` python
-simple_crypto_v3.env(max_cycles=25, continuous_actions=False, dynamic_rescaling=False)
+simple_crypto_v3.env(max_cycles=25, continuous_actions=False, dynamic_rescaling=False, vectorized_physics=False)
 ```
 
 
@@ -56,6 +56,8 @@ simple_crypto_v3.env(max_cycles=25, continuous_actions=False, dynamic_rescaling=
 
 `dynamic_rescaling`: Whether to rescale the size of agents and landmarks based on the screen size
 
+`vectorized_physics`: Whether to simulate the world with array-backed physics, which is much faster with many agents and landmarks
+
 """
 
 import numpy as np
@@ -63,8 +65,7 @@ from gymnasium.utils import EzPickle
 
 from pettingzoo.mpe._mpe_utils.core import Agent, Landmark, World
 from pettingzoo.mpe._mpe_utils.scenario import BaseScenario
-from pettingzoo.mpe._mpe_utils.simple_env import SimpleEnv, make_env
-from pettingzoo.utils.conversions import parallel_wrapper_fn
+from pettingzoo.mpe._mpe_utils.simple_env import SimpleEnv, make_env, make_parallel_env
 
 """Simple crypto environment.
 
@@ -81,12 +82,14 @@ class raw_env(SimpleEnv, EzPickle):
         continuous_actions=False,
         render_mode=None,
         dynamic_rescaling=False,
+        vectorized_physics=False,
     ):
         EzPickle.__init__(
             self,
             max_cycles=max_cycles,
             continuous_actions=continuous_actions,
             render_mode=render_mode,
+            vectorized_physics=vectorized_physics,
         )
         scenario = Scenario()
         world = scenario.make_world()
@@ -98,12 +101,13 @@ class raw_env(SimpleEnv, EzPickle):
             max_cycles=max_cycles,
             continuous_actions=continuous_actions,
             dynamic_rescaling=dynamic_rescaling,
+            vectorized_physics=vectorized_physics,
         )
         self.metadata["name"] = "simple_crypto_v3"
 
 
 env = make_env(raw_env)
-parallel_env = parallel_wrapper_fn(env)
+parallel_env = make_parallel_env(raw_env)
 
 
 class CryptoAgent(Agent):
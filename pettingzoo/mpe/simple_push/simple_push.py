@@ -38,7 +38,7 @@ Adversary action space: `[no_action, move_left, move_right, move_down, move_up]`
 ### Arguments
 
 ``` python
-simple_push_v3.env(max_cycles=25, continuous_actions=False, dynamic_rescaling=False)
+simple_push_v3.env(max_cycles=25, continuous_actions=False, dynamic_rescaling=False, vectorized_physics=False)
 ```
 
 
@@ -47,16 +47,18 @@ simple_push_v3.env(max_cycles=25, continuous_actions=False, dynamic_rescaling=Fa
 
 `dynamic_rescaling`: Whether to rescale the size of agents and landmarks based on the screen size
 
+`vectorized_physics`: Whether to simulate the world with array-backed physics, which is much faster with many agents and landmarks
+
 
 """
 
 import numpy as np
 from gymnasium.utils import EzPickle
 
+from pettingzoo.mpe._mpe_utils.batched_env import make_batched_env
 from pettingzoo.mpe._mpe_utils.core import Agent, Landmark, World
 from pettingzoo.mpe._mpe_utils.scenario import BaseScenario
-from pettingzoo.mpe._mpe_utils.simple_env import SimpleEnv, make_env
-from pettingzoo.utils.conversions import parallel_wrapper_fn
+from pettingzoo.mpe._mpe_utils.simple_env import SimpleEnv, make_env, make_parallel_env
 
 
 class raw_env(SimpleEnv, EzPickle):
@@ -66,12 +68,14 @@ class raw_env(SimpleEnv, EzPickle):
         continuous_actions=False,
         render_mode=None,
         dynamic_rescaling=False,
+        vectorized_physics=False,
     ):
         EzPickle.__init__(
             self,
             max_cycles=max_cycles,
             continuous_actions=continuous_actions,
             render_mode=render_mode,
+            vectorized_physics=vectorized_physics,
         )
         scenario = Scenario()
         world = scenario.make_world()
@@ -83,12 +87,14 @@ class raw_env(SimpleEnv, EzPickle):
             max_cycles=max_cycles,
             continuous_actions=continuous_actions,
             dynamic_rescaling=dynamic_rescaling,
+            vectorized_physics=vectorized_physics,
         )
         self.metadata["name"] = "simple_push_v3"
 
 
 env = make_env(raw_env)
-parallel_env = parallel_wrapper_fn(env)
+parallel_env = make_parallel_env(raw_env)
+batched_env = make_batched_env(raw_env)
 
 
 class Scenario(BaseScenario):
@@ -197,3 +203,56 @@ class Scenario(BaseScenario):
             )
         else:
             return np.concatenate([agent.state.p_vel] + entity_pos + other_pos)
+
+    def reset_batched_world(self, world, np_random):
+        # set goal landmark
+        world.goal = np_random.integers(len(world.landmarks), size=world.num_worlds)
+        world.p_pos[:] = np_random.uniform(-1, +1, world.p_pos.shape)
+
+    def load_batched_world(self, world, batched_world, index):
+        super().load_batched_world(world, batched_world, index)
+        if not hasattr(batched_world, "goal"):
+            batched_world.goal = np.zeros(batched_world.num_worlds, dtype=int)
+        batched_world.goal[index] = world.landmarks.index(world.agents[0].goal_a)
+
+    def batched_rewards(self, world):
+        adversary = np.array([agent.adversary for agent in world.agents])
+        goal_pos = world.landmark_pos[np.arange(world.num_worlds), world.goal]
+        dists = np.sqrt(np.sum(np.square(world.agent_pos - goal_pos[:, None]), axis=-1))
+        # keep the nearest good agents away from the goal
+        adversary_rew = np.min(dists[:, ~adversary], axis=-1, keepdims=True) - dists
+        return np.where(adversary, adversary_rew, -dists)
+
+    def batched_observations(self, world):
+        n = len(world.agents)
+        others = ~np.eye(n, dtype=bool)
+        goal_pos = world.landmark_pos[np.arange(world.num_worlds), world.goal]
+        # good agents are colored after their goal landmark
+        agent_color = np.full((world.num_worlds, 3), 0.25)
+        agent_color[np.arange(world.num_worlds), world.goal + 1] += 0.5
+        entity_color = np.concatenate([landmark.color for landmark in world.landmarks])
+        entity_color = np.broadcast_to(
+            entity_color, (world.num_worlds, len(entity_color))
+        )
+        # positions of all entities in each agent's reference frame
+        entity_pos = world.landmark_pos[:, None] - world.agent_pos[:, :, None]
+        other_pos = world.agent_pos[:, None] - world.agent_pos[:, :, None]
+        observations = []
+        for i, agent in enumerate(world.agents):
+            if not agent.adversary:
+                obs = [
+                    world.agent_vel[:, i],
+                    goal_pos - world.agent_pos[:, i],
+                    agent_color,
+                    entity_pos[:, i].reshape(world.num_worlds, -1),
+                    entity_color,
+                    other_pos[:, i, others[i]].reshape(world.num_worlds, -1),
+                ]
+            else:
+                obs = [
+                    world.agent_vel[:, i],
+                    entity_pos[:, i].reshape(world.num_worlds, -1),
+                    other_pos[:, i, others[i]].reshape(world.num_worlds, -1),
+                ]
+            observations.append(np.concatenate(obs, axis=-1))
+        return observations
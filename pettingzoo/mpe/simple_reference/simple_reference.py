@@ -40,7 +40,7 @@ Agent continuous action space: `[no_action, move_left, move_right, move_down, mo
 
 
 ``` python
-simple_reference_v3.env(local_ratio=0.5, max_cycles=25, continuous_actions=False, dynamic_rescaling=False)
+simple_reference_v3.env(local_ratio=0.5, max_cycles=25, continuous_actions=False, dynamic_rescaling=False, vectorized_physics=False)
 ```
 
 
@@ -53,6 +53,8 @@ simple_reference_v3.env(local_ratio=0.5, max_cycles=25, continuous_actions=False
 
 `dynamic_rescaling`: Whether to rescale the size of agents and landmarks based on the screen size
 
+`vectorized_physics`: Whether to simulate the world with array-backed physics, which is much faster with many agents and landmarks
+
 """
 
 import numpy as np
@@ -60,8 +62,7 @@ from gymnasium.utils import EzPickle
 
 from pettingzoo.mpe._mpe_utils.core import Agent, Landmark, World
 from pettingzoo.mpe._mpe_utils.scenario import BaseScenario
-from pettingzoo.mpe._mpe_utils.simple_env import SimpleEnv, make_env
-from pettingzoo.utils.conversions import parallel_wrapper_fn
+from pettingzoo.mpe._mpe_utils.simple_env import SimpleEnv, make_env, make_parallel_env
 
 
 class raw_env(SimpleEnv, EzPickle):
@@ -72,6 +73,7 @@ class raw_env(SimpleEnv, EzPickle):
         continuous_actions=False,
         render_mode=None,
         dynamic_rescaling=False,
+        vectorized_physics=False,
     ):
         EzPickle.__init__(
             self,
@@ -79,6 +81,7 @@ class raw_env(SimpleEnv, EzPickle):
             max_cycles=max_cycles,
             continuous_actions=continuous_actions,
             render_mode=render_mode,
+            vectorized_physics=vectorized_physics,
         )
         assert (
             0.0 <= local_ratio <= 1.0
@@ -94,12 +97,13 @@ class raw_env(SimpleEnv, EzPickle):
             continuous_actions=continuous_actions,
             local_ratio=local_ratio,
             dynamic_rescaling=dynamic_rescaling,
+            vectorized_physics=vectorized_physics,
         )
         self.metadata["name"] = "simple_reference_v3"
 
 
 env = make_env(raw_env)
-parallel_env = parallel_wrapper_fn(env)
+parallel_env = make_parallel_env(raw_env)
 
 
 class Scenario(BaseScenario):
@@ -36,7 +36,7 @@ Agent action space: `[no_action, move_left, move_right, move_down, move_up]`
 ### Arguments
 
 ``` python
-simple_spread_v3.env(N=3, local_ratio=0.5, max_cycles=25, continuous_actions=False, dynamic_rescaling=False)
+simple_spread_v3.env(N=3, local_ratio=0.5, max_cycles=25, continuous_actions=False, dynamic_rescaling=False, vectorized_physics=False)
 ```
 
 
@@ -51,15 +51,17 @@ simple_spread_v3.env(N=3, local_ratio=0.5, max_cycles=25, continuous_actions=Fal
 
 `dynamic_rescaling`: Whether to rescale the size of agents and landmarks based on the screen size
 
+`vectorized_physics`: Whether to simulate the world with array-backed physics, which is much faster with many agents and landmarks
+
 """
 
 import numpy as np
 from gymnasium.utils import EzPickle
 
+from pettingzoo.mpe._mpe_utils.batched_env import make_batched_env
 from pettingzoo.mpe._mpe_utils.core import Agent, Landmark, World
 from pettingzoo.mpe._mpe_utils.scenario import BaseScenario
-from pettingzoo.mpe._mpe_utils.simple_env import SimpleEnv, make_env
-from pettingzoo.utils.conversions import parallel_wrapper_fn
+from pettingzoo.mpe._mpe_utils.simple_env import SimpleEnv, make_env, make_parallel_env
 
 
 class raw_env(SimpleEnv, EzPickle):
@@ -71,6 +73,7 @@ class raw_env(SimpleEnv, EzPickle):
         continuous_actions=False,
         render_mode=None,
         dynamic_rescaling=False,
+        vectorized_physics=False,
     ):
         EzPickle.__init__(
             self,
@@ -79,6 +82,7 @@ class raw_env(SimpleEnv, EzPickle):
             max_cycles=max_cycles,
             continuous_actions=continuous_actions,
             render_mode=render_mode,
+            vectorized_physics=vectorized_physics,
         )
         assert (
             0.0 <= local_ratio <= 1.0
@@ -94,12 +98,14 @@ class raw_env(SimpleEnv, EzPickle):
             continuous_actions=continuous_actions,
             local_ratio=local_ratio,
             dynamic_rescaling=dynamic_rescaling,
+            vectorized_physics=vectorized_physics,
         )
         self.metadata["name"] = "simple_spread_v3"
 
 
 env = make_env(raw_env)
-parallel_env = parallel_wrapper_fn(env)
+parallel_env = make_parallel_env(raw_env)
+batched_env = make_batched_env(raw_env)
 
 
 class Scenario(BaseScenario):
@@ -202,3 +208,45 @@ class Scenario(BaseScenario):
         return np.concatenate(
             [agent.state.p_vel] + [agent.state.p_pos] + entity_pos + other_pos + comm
         )
+
+    def reset_batched_world(self, world, np_random):
+        world.p_pos[:] = np_random.uniform(-1, +1, world.p_pos.shape)
+
+    def batched_collisions(self, world):
+        # (num_worlds, n_agents, n_agents) collisions between distinct agents
+        n = len(world.agents)
+        delta_pos = world.agent_pos[:, :, None] - world.agent_pos[:, None]
+        dist = np.sqrt(np.sum(np.square(delta_pos), axis=-1))
+        size = world.size[:n]
+        return (dist < size[:, None] + size[None, :]) & ~np.eye(n, dtype=bool)
+
+    def batched_rewards(self, world):
+        collide = world.collide[: len(world.agents)]
+        return -1.0 * np.sum(self.batched_collisions(world), axis=-1) * collide
+
+    def batched_global_reward(self, world):
+        delta_pos = world.agent_pos[:, :, None] - world.landmark_pos[:, None]
+        dists = np.sqrt(np.sum(np.square(delta_pos), axis=-1))
+        return -np.sum(np.min(dists, axis=1), axis=-1)
+
+    def batched_observations(self, world):
+        n = len(world.agents)
+        others = ~np.eye(n, dtype=bool)
+        # positions of all entities in each agent's reference frame
+        entity_pos = world.landmark_pos[:, None] - world.agent_pos[:, :, None]
+        other_pos = world.agent_pos[:, None] - world.agent_pos[:, :, None]
+        observations = []
+        for i in range(n):
+            observations.append(
+                np.concatenate(
+                    [
+                        world.agent_vel[:, i],
+                        world.agent_pos[:, i],
+                        entity_pos[:, i].reshape(world.num_worlds, -1),
+                        other_pos[:, i, others[i]].reshape(world.num_worlds, -1),
+                        world.c[:, others[i]].reshape(world.num_worlds, -1),
+                    ],
+                    axis=-1,
+                )
+            )
+        return observations
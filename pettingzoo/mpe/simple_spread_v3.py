@@ -1,3 +1,8 @@
-from pettingzoo.mpe.simple_spread.simple_spread import env, parallel_env, raw_env
+from pettingzoo.mpe.simple_spread.simple_spread import (
+    batched_env,
+    env,
+    parallel_env,
+    raw_env,
+)
 
-__all__ = ["env", "parallel_env", "raw_env"]
+__all__ = ["batched_env", "env", "parallel_env", "raw_env"]
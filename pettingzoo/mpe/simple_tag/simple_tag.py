@@ -45,7 +45,7 @@ Agent and adversary action space: `[no_action, move_left, move_right, move_down,
 ### Arguments
 
 ``` python
-simple_tag_v3.env(num_good=1, num_adversaries=3, num_obstacles=2, max_cycles=25, continuous_actions=False, dynamic_rescaling=False)
+simple_tag_v3.env(num_good=1, num_adversaries=3, num_obstacles=2, max_cycles=25, continuous_actions=False, dynamic_rescaling=False, vectorized_physics=False)
 ```
 
 
@@ -62,15 +62,17 @@ simple_tag_v3.env(num_good=1, num_adversaries=3, num_obstacles=2, max_cycles=25,
 
 `dynamic_rescaling`: Whether to rescale the size of agents and landmarks based on the screen size
 
+`vectorized_physics`: Whether to simulate the world with array-backed physics, which is much faster with many agents and landmarks
+
 """
 
 import numpy as np
 from gymnasium.utils import EzPickle
 
+from pettingzoo.mpe._mpe_utils.batched_env import make_batched_env
 from pettingzoo.mpe._mpe_utils.core import Agent, Landmark, World
 from pettingzoo.mpe._mpe_utils.scenario import BaseScenario
-from pettingzoo.mpe._mpe_utils.simple_env import SimpleEnv, make_env
-from pettingzoo.utils.conversions import parallel_wrapper_fn
+from pettingzoo.mpe._mpe_utils.simple_env import SimpleEnv, make_env, make_parallel_env
 
 
 class raw_env(SimpleEnv, EzPickle):
@@ -83,6 +85,7 @@ class raw_env(SimpleEnv, EzPickle):
         continuous_actions=False,
         render_mode=None,
         dynamic_rescaling=False,
+        vectorized_physics=False,
     ):
         EzPickle.__init__(
             self,
@@ -92,6 +95,7 @@ class raw_env(SimpleEnv, EzPickle):
             max_cycles=max_cycles,
             continuous_actions=continuous_actions,
             render_mode=render_mode,
+            vectorized_physics=vectorized_physics,
         )
         scenario = Scenario()
         world = scenario.make_world(num_good, num_adversaries, num_obstacles)
@@ -103,12 +107,14 @@ class raw_env(SimpleEnv, EzPickle):
             max_cycles=max_cycles,
             continuous_actions=continuous_actions,
             dynamic_rescaling=dynamic_rescaling,
+            vectorized_physics=vectorized_physics,
         )
         self.metadata["name"] = "simple_tag_v3"
 
 
 env = make_env(raw_env)
-parallel_env = parallel_wrapper_fn(env)
+parallel_env = make_parallel_env(raw_env)
+batched_env = make_batched_env(raw_env)
 
 
 class Scenario(BaseScenario):
@@ -273,3 +279,62 @@ class Scenario(BaseScenario):
             + other_pos
             + other_vel
         )
+
+    def reset_batched_world(self, world, np_random):
+        world.agent_pos[:] = np_random.uniform(-1, +1, world.agent_pos.shape)
+        world.landmark_pos[:] = np_random.uniform(-0.9, +0.9, world.landmark_pos.shape)
+
+    def batched_rewards(self, world):
+        n = len(world.agents)
+        adversary = np.array([agent.adversary for agent in world.agents])
+        collide = world.collide[:n]
+        delta_pos = world.agent_pos[:, :, None] - world.agent_pos[:, None]
+        dist = np.sqrt(np.sum(np.square(delta_pos), axis=-1))
+        size = world.size[:n]
+        # (num_worlds, n_agents, n_agents) collisions between adversaries and good agents
+        caught = (dist < size[:, None] + size[None, :]) & (
+            adversary[:, None] != adversary[None, :]
+        )
+        # good agents are penalized for every adversary catching them
+        agent_rew = -10.0 * np.sum(caught & adversary[None, :], axis=-1) * collide
+        # and for exiting the screen, so that they can be caught by the adversaries
+        x = np.abs(world.agent_pos)
+        bound = np.where(
+            x < 0.9,
+            0.0,
+            np.where(x < 1.0, (x - 0.9) * 10, np.minimum(np.exp(2 * x - 2), 10)),
+        )
+        agent_rew -= np.sum(bound, axis=-1)
+        # adversaries are rewarded for every collision of an adversary with a good agent
+        adversary_rew = (
+            10.0 * np.sum(caught & adversary[:, None], axis=(1, 2))[:, None] * collide
+        )
+        return np.where(adversary, adversary_rew, agent_rew)
+
+    def batched_observations(self, world):
+        n = len(world.agents)
+        others = ~np.eye(n, dtype=bool)
+        good = np.array([not agent.adversary for agent in world.agents])
+        boundary = np.array([landmark.boundary for landmark in world.landmarks])
+        # positions of all entities in each agent's reference frame
+        entity_pos = (
+            world.landmark_pos[:, None, ~boundary] - world.agent_pos[:, :, None]
+        )
+        other_pos = world.agent_pos[:, None] - world.agent_pos[:, :, None]
+        observations = []
+        for i in range(n):
+            observations.append(
+                np.concatenate(
+                    [
+                        world.agent_vel[:, i],
+                        world.agent_pos[:, i],
+                        entity_pos[:, i].reshape(world.num_worlds, -1),
+                        other_pos[:, i, others[i]].reshape(world.num_worlds, -1),
+                        world.agent_vel[:, others[i] & good].reshape(
+                            world.num_worlds, -1
+                        ),
+                    ],
+                    axis=-1,
+                )
+            )
+        return observations
@@ -1,3 +1,3 @@
-from pettingzoo.mpe.simple_tag.simple_tag import env, parallel_env, raw_env
+from pettingzoo.mpe.simple_tag.simple_tag import batched_env, env, parallel_env, raw_env
 
-__all__ = ["env", "parallel_env", "raw_env"]
+__all__ = ["batched_env", "env", "parallel_env", "raw_env"]
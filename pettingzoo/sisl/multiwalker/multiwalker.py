@@ -129,14 +129,15 @@ from pettingzoo.utils import AgentSelector, wrappers
 from pettingzoo.utils.conversions import parallel_wrapper_fn
 
 
-def env(**kwargs):
+def env(validate=None, **kwargs):
     env = raw_env(**kwargs)
     env = wrappers.ClipOutOfBoundsWrapper(env)
-    env = wrappers.OrderEnforcingWrapper(env)
+    if wrappers.validation_enabled(validate):
+        env = wrappers.OrderEnforcingWrapper(env)
     return env
 
 
-parallel_env = parallel_wrapper_fn(env)
+parallel_env = parallel_wrapper_fn(env, fast=True)
 
 
 class raw_env(AECEnv, EzPickle):
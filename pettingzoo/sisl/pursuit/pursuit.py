@@ -28,6 +28,8 @@ the red pursuer agents. The environment terminates when every evader has been ca
 
 Observation shape takes the full form of `(obs_range, obs_range, 3)` where the first channel is 1s where there is a wall, the second channel indicates the number of allies in each coordinate and the third channel indicates the number of opponents in each coordinate.
 
+The parallel environment moves all pursuers at once and updates the state and the rewards once per cycle. In the AEC environment the pursuers move one after the other, and each agent's reward sums the rewards of the state after every move since its last turn.
+
 ### Manual Control
 
 Select different pursuers with 'J' and 'K'. The selected pursuer can be moved with the arrow keys.
@@ -82,23 +84,26 @@ import numpy as np
 import pygame
 from gymnasium.utils import EzPickle
 
-from pettingzoo import AECEnv
+from pettingzoo import AECEnv, ParallelEnv
 from pettingzoo.sisl.pursuit.manual_policy import ManualPolicy
 from pettingzoo.sisl.pursuit.pursuit_base import Pursuit as _env
 from pettingzoo.utils import AgentSelector, wrappers
-from pettingzoo.utils.conversions import parallel_wrapper_fn
 
 __all__ = ["ManualPolicy", "env", "parallel_env", "raw_env"]
 
 
-def env(**kwargs):
+def env(validate=None, **kwargs):
     env = raw_env(**kwargs)
-    env = wrappers.AssertOutOfBoundsWrapper(env)
-    env = wrappers.OrderEnforcingWrapper(env)
+    if wrappers.validation_enabled(validate):
+        env = wrappers.AssertOutOfBoundsWrapper(env)
+        env = wrappers.OrderEnforcingWrapper(env)
     return env
 
 
-parallel_env = parallel_wrapper_fn(env)
+def parallel_env(validate=None, **kwargs):
+    # the native parallel environment asserts that actions are in their space
+    # itself, like the AssertOutOfBoundsWrapper of env does
+    return parallel_raw_env(validate=wrappers.validation_enabled(validate), **kwargs)
 
 
 class raw_env(AECEnv, EzPickle):
@@ -185,3 +190,75 @@ class raw_env(AECEnv, EzPickle):
 
     def action_space(self, agent: str):
         return self.action_spaces[agent]
+
+
+class parallel_raw_env(ParallelEnv, EzPickle):
+    """Pursuit as a native parallel environment, which applies the actions of all pursuers at once."""
+
+    metadata = raw_env.metadata
+
+    def __init__(self, *args, validate=False, **kwargs):
+        EzPickle.__init__(self, *args, validate=validate, **kwargs)
+        self.env = _env(*args, **kwargs)
+        self.validate = validate
+        self.render_mode = kwargs.get("render_mode")
+        pygame.init()
+        self.agents = ["pursuer_" + str(a) for a in range(self.env.num_agents)]
+        self.possible_agents = self.agents[:]
+        self.action_spaces = dict(zip(self.agents, self.env.action_space))
+        self.observation_spaces = dict(zip(self.agents, self.env.observation_space))
+        self.steps = 0
+        self.closed = False
+
+    def _observations(self):
+        # (agent, y, x, channel) like the AEC observations, copied once for all agents
+        observations = np.ascontiguousarray(
+            self.env.collect_all_obs().transpose(0, 3, 2, 1)
+        )
+        return dict(zip(self.agents, observations))
+
+    def reset(self, seed=None, options=None):
+        if seed is not None:
+            self.env._seed(seed=seed)
+        self.steps = 0
+        self.agents = self.possible_agents[:]
+        self.env.reset()
+        return self._observations(), {agent: {} for agent in self.agents}
+
+    def step(self, actions):
+        if self.validate:
+            for agent in self.agents:
+                assert self.action_spaces[agent].contains(
+                    actions[agent]
+                ), "action is not in action space"
+        self.env.step_all(
+            np.fromiter(
+                (actions[agent] for agent in self.agents), np.int64, len(self.agents)
+            )
+        )
+        self.steps += 1
+        truncated = self.env.frames >= self.env.max_cycles
+        terminated = not truncated and self.env.is_terminal
+        observations = self._observations()
+        rewards = dict(zip(self.agents, self.env.latest_reward_state.tolist()))
+        terminations = {agent: terminated for agent in self.agents}
+        truncations = {agent: truncated for agent in self.agents}
+        infos = {agent: {} for agent in self.agents}
+        if terminated or truncated:
+            self.agents = []
+        return observations, rewards, terminations, truncations, infos
+
+    def close(self):
+        if not self.closed:
+            self.closed = True
+            self.env.close()
+
+    def render(self):
+        if not self.closed:
+            return self.env.render()
+
+    def observation_space(self, agent: str):
+        return self.observation_spaces[agent]
+
+    def action_space(self, agent: str):
+        return self.action_spaces[agent]
@@ -6,6 +6,7 @@ import numpy as np
 import pygame
 from gymnasium import spaces
 from gymnasium.utils import seeding
+from scipy.ndimage import convolve
 
 from pettingzoo.sisl.pursuit.utils import agent_utils, two_d_maps
 from pettingzoo.sisl.pursuit.utils.agent_layer import AgentLayer
@@ -87,8 +88,12 @@ class Pursuit:
             self.n_evaders, self.map_matrix, self.obs_range, self.np_random
         )
 
-        self.pursuer_layer = AgentLayer(x_size, y_size, self.pursuers)
-        self.evader_layer = AgentLayer(x_size, y_size, self.evaders)
+        self.pursuer_layer = AgentLayer(
+            x_size, y_size, self.pursuers, map_matrix=self.map_matrix
+        )
+        self.evader_layer = AgentLayer(
+            x_size, y_size, self.evaders, map_matrix=self.map_matrix
+        )
 
         self.n_catch = n_catch
 
@@ -153,8 +158,35 @@ class Pursuit:
         self.constraint_window = constraint_window
 
         self.surround_mask = np.array([[-1, 0], [1, 0], [0, 1], [0, -1]])
+        # the surround mask as a 3x3 kernel, which is symmetric so convolving
+        # with it counts the (occupied) neighbours of every cell
+        self.surround_kernel = np.zeros((3, 3), dtype=np.int32)
+        self.surround_kernel[
+            1 + self.surround_mask[:, 0], 1 + self.surround_mask[:, 1]
+        ] = 1
+        # number of open neighbours of every cell, which all have to be occupied
+        # by pursuers to surround an evader there
+        self.surround_need = convolve(
+            (self.map_matrix != -1).astype(np.int32),
+            self.surround_kernel,
+            mode="constant",
+        )
 
         self.model_state = np.zeros((4,) + self.map_matrix.shape, dtype=np.float32)
+        # |model_state| padded by obs_offset cells of wall, the observation of an
+        # agent at (x, y) is the window at (x, y) of the padded state
+        off = self.obs_offset
+        self.padded_state = np.zeros(
+            (3, self.x_size + 2 * off, self.y_size + 2 * off), dtype=np.float32
+        )
+        self.padded_state[0] = 1.0
+        # observations of all pursuers, an even obs_range leaves a last row and
+        # column of wall outside the window
+        self.obs_buffer = np.zeros(
+            (self.n_pursuers, 3, self.obs_range, self.obs_range), dtype=np.float32
+        )
+        self.obs_buffer[:, 0] = 1.0
+        self.obs_stale = True
         self.pixel_scale = 30
 
         self.frames = 0
@@ -217,7 +249,9 @@ class Pursuit:
             randinit=True,
             constraints=constraints,
         )
-        self.pursuer_layer = AgentLayer(self.x_size, self.y_size, self.pursuers)
+        self.pursuer_layer = AgentLayer(
+            self.x_size, self.y_size, self.pursuers, map_matrix=self.map_matrix
+        )
 
         self.evaders = agent_utils.create_agents(
             self.n_evaders,
@@ -227,7 +261,9 @@ class Pursuit:
             randinit=True,
             constraints=constraints,
         )
-        self.evader_layer = AgentLayer(self.x_size, self.y_size, self.evaders)
+        self.evader_layer = AgentLayer(
+            self.x_size, self.y_size, self.evaders, map_matrix=self.map_matrix
+        )
 
         self.latest_reward_state = [0 for _ in range(self.num_agents)]
         self.latest_done_state = [False for _ in range(self.num_agents)]
@@ -238,17 +274,32 @@ class Pursuit:
         self.model_state[2] = self.evader_layer.get_state_matrix()
 
         self.frames = 0
+        self.obs_stale = True
 
         return self.safely_observe(0)
 
     def step(self, action, agent_id, is_last):
-        agent_layer = self.pursuer_layer
+        # actual action application, change the pursuer layer
+        self.pursuer_layer.move_agent(agent_id, action)
+        self.update(is_last)
+
+    def step_all(self, actions):
+        """Applies the actions of all pursuers at once and ends the cycle.
+
+        The layers and the rewards are updated once, as by the last `step` of
+        a cycle.
+        """
+        self.pursuer_layer.move_all(np.asarray(actions))
+        self.update(True)
+
+    def update(self, is_last):
+        """Updates the layers and rewards after pursuers moved.
+
+        At the end of a cycle, caught evaders are removed and the others move.
+        """
         opponent_layer = self.evader_layer
         opponent_controller = self.evader_controller
 
-        # actual action application, change the pursuer layer
-        agent_layer.move_agent(agent_id, action)
-
         # Update only the pursuer layer
         self.model_state[1] = self.pursuer_layer.get_state_matrix()
 
@@ -258,10 +309,10 @@ class Pursuit:
             # Possibly change the evader layer
             ev_remove, pr_remove, pursuers_who_remove = self.remove_agents()
 
-            for i in range(opponent_layer.n_agents()):
-                # controller input should be an observation, but doesn't matter right now
-                a = opponent_controller.act(self.model_state)
-                opponent_layer.move_agent(i, a)
+            # controller input should be an observation, but doesn't matter right now
+            opponent_layer.move_all(
+                opponent_controller.act_all(self.model_state, opponent_layer.n_agents())
+            )
 
             self.latest_reward_state += self.catch_reward * pursuers_who_remove
             self.latest_reward_state += self.urgency_reward
@@ -270,6 +321,7 @@ class Pursuit:
         # Update the remaining layers
         self.model_state[0] = self.map_matrix
         self.model_state[2] = self.evader_layer.get_state_matrix()
+        self.obs_stale = True
 
         global_val = self.latest_reward_state.mean()
         local_val = self.latest_reward_state
@@ -439,27 +491,10 @@ class Pursuit:
 
     def reward(self):
         es = self.evader_layer.get_state_matrix()  # evader positions
-        rewards = [
-            self.tag_reward
-            * np.sum(
-                es[
-                    np.clip(
-                        self.pursuer_layer.get_position(i)[0]
-                        + self.surround_mask[:, 0],
-                        0,
-                        self.x_size - 1,
-                    ),
-                    np.clip(
-                        self.pursuer_layer.get_position(i)[1]
-                        + self.surround_mask[:, 1],
-                        0,
-                        self.y_size - 1,
-                    ),
-                ]
-            )
-            for i in range(self.n_pursuers)
-        ]
-        return np.array(rewards)
+        pos = self.pursuer_layer.get_positions()
+        x = np.clip(pos[:, 0:1] + self.surround_mask[:, 0], 0, self.x_size - 1)
+        y = np.clip(pos[:, 1:2] + self.surround_mask[:, 1], 0, self.y_size - 1)
+        return self.tag_reward * es[x, y].sum(axis=1)
 
     @property
     def is_terminal(self):
@@ -479,108 +514,93 @@ class Pursuit:
         return self.pursuer_layer.n_agents()
 
     def safely_observe(self, i):
-        agent_layer = self.pursuer_layer
-        obs = self.collect_obs(agent_layer, i)
-        return obs
+        assert 0 <= i < self.n_agents(), "bad index"
+        return self.collect_all_obs()[i].copy()
+
+    def refresh_padded_state(self):
+        off = self.obs_offset
+        np.abs(
+            self.model_state[0:3],
+            out=self.padded_state[:, off : off + self.x_size, off : off + self.y_size],
+        )
+
+    def obs_windows(self):
+        """Returns the (x_size, y_size, 3, w, w) observation windows of the padded state.
+
+        The windows are a view of the padded state, they are created on every
+        call (which is cheap) since copies of the environment would otherwise
+        keep a view of the padded state of the original.
+        """
+        size = 2 * self.obs_offset + 1
+        return np.lib.stride_tricks.sliding_window_view(
+            self.padded_state, (size, size), axis=(1, 2)
+        ).transpose(1, 2, 0, 3, 4)
+
+    def collect_all_obs(self):
+        """Returns the observations of all pursuers as an (n_pursuers, 3, obs_range, obs_range) array.
+
+        The observations are computed at most once per step, the array is reused.
+        """
+        if self.obs_stale:
+            self.refresh_padded_state()
+            pos = self.pursuer_layer.get_positions()
+            size = 2 * self.obs_offset + 1
+            self.obs_buffer[:, :, :size, :size] = self.obs_windows()[
+                pos[:, 0], pos[:, 1]
+            ]
+            self.obs_stale = False
+        return self.obs_buffer
 
     def collect_obs(self, agent_layer, i):
-        for j in range(self.n_agents()):
-            if i == j:
-                return self.collect_obs_by_idx(agent_layer, i)
-        assert False, "bad index"
+        assert 0 <= i < self.n_agents(), "bad index"
+        return self.collect_obs_by_idx(agent_layer, i)
 
     def collect_obs_by_idx(self, agent_layer, agent_idx):
         # returns a flattened array of all the observations
+        if self.obs_stale:
+            self.refresh_padded_state()
         obs = np.zeros((3, self.obs_range, self.obs_range), dtype=np.float32)
         obs[0].fill(1.0)  # border walls set to -0.1?
         xp, yp = agent_layer.get_position(agent_idx)
-
-        xlo, xhi, ylo, yhi, xolo, xohi, yolo, yohi = self.obs_clip(xp, yp)
-
-        obs[0:3, xolo:xohi, yolo:yohi] = np.abs(self.model_state[0:3, xlo:xhi, ylo:yhi])
+        size = 2 * self.obs_offset + 1
+        obs[:, :size, :size] = self.obs_windows()[xp, yp]
         return obs
 
-    def obs_clip(self, x, y):
-        xld = x - self.obs_offset
-        xhd = x + self.obs_offset
-        yld = y - self.obs_offset
-        yhd = y + self.obs_offset
-        xlo, xhi, ylo, yhi = (
-            np.clip(xld, 0, self.x_size - 1),
-            np.clip(xhd, 0, self.x_size - 1),
-            np.clip(yld, 0, self.y_size - 1),
-            np.clip(yhd, 0, self.y_size - 1),
-        )
-        xolo, yolo = abs(np.clip(xld, -self.obs_offset, 0)), abs(
-            np.clip(yld, -self.obs_offset, 0)
-        )
-        xohi, yohi = xolo + (xhi - xlo), yolo + (yhi - ylo)
-        return xlo, xhi + 1, ylo, yhi + 1, xolo, xohi + 1, yolo, yohi + 1
-
     def remove_agents(self):
         """Remove agents that are caught.
 
         Return tuple (n_evader_removed, n_pursuer_removed, purs_sur)
         purs_sur: bool array, which pursuers surrounded an evader
         """
-        n_pursuer_removed = 0
-        n_evader_removed = 0
-        removed_evade = []
-        removed_pursuit = []
-
-        ai = 0
-        rems = 0
-        xpur, ypur = np.nonzero(self.model_state[1])
-        purs_sur = np.zeros(self.n_pursuers, dtype=bool)
-        for i in range(self.n_evaders):
-            if self.evaders_gone[i]:
-                continue
-            x, y = self.evader_layer.get_position(ai)
-            if self.surround:
-                pos_that_catch = self.surround_mask + self.evader_layer.get_position(ai)
-                truths = np.array(
-                    [
-                        np.equal([xi, yi], pos_that_catch).all(axis=1)
-                        for xi, yi in zip(xpur, ypur)
-                    ]
+        evader_pos = self.evader_layer.get_positions()
+        pursuer_pos = self.pursuer_layer.get_positions()
+        pursuers = self.model_state[1]
+        if self.surround:
+            # an evader is caught when pursuers occupy all open cells around it
+            surrounded = (
+                convolve(
+                    (pursuers > 0).astype(np.int32),
+                    self.surround_kernel,
+                    mode="constant",
                 )
-                if np.sum(truths.any(axis=0)) == self.need_to_surround(x, y):
-                    removed_evade.append(ai - rems)
-                    self.evaders_gone[i] = True
-                    rems += 1
-                    tt = truths.any(axis=1)
-                    for j in range(self.n_pursuers):
-                        xpp, ypp = self.pursuer_layer.get_position(j)
-                        tes = np.concatenate((xpur[tt], ypur[tt])).reshape(
-                            2, len(xpur[tt])
-                        )
-                        tem = tes.T == np.array([xpp, ypp])
-                        if np.any(np.all(tem, axis=1)):
-                            purs_sur[j] = True
-                ai += 1
-            else:
-                if self.model_state[1, x, y] >= self.n_catch:
-                    # add prob remove?
-                    removed_evade.append(ai - rems)
-                    self.evaders_gone[i] = True
-                    rems += 1
-                    for j in range(self.n_pursuers):
-                        xpp, ypp = self.pursuer_layer.get_position(j)
-                        if xpp == x and ypp == y:
-                            purs_sur[j] = True
-                ai += 1
-
-        ai = 0
-        for i in range(self.pursuer_layer.n_agents()):
-            x, y = self.pursuer_layer.get_position(i)
-            # can remove pursuers probabilitcally here?
-        for ridx in removed_evade:
-            self.evader_layer.remove_agent(ridx)
-            n_evader_removed += 1
-        for ridx in removed_pursuit:
-            self.pursuer_layer.remove_agent(ridx)
-            n_pursuer_removed += 1
-        return n_evader_removed, n_pursuer_removed, purs_sur
+                == self.surround_need
+            )
+            caught = surrounded[evader_pos[:, 0], evader_pos[:, 1]]
+        else:
+            caught = pursuers[evader_pos[:, 0], evader_pos[:, 1]] >= self.n_catch
+
+        catches = np.zeros(self.map_matrix.shape, dtype=bool)
+        catches[evader_pos[caught, 0], evader_pos[caught, 1]] = True
+        if self.surround:
+            # the pursuers around a caught evader caught it
+            catches = convolve(
+                catches.astype(np.int32), self.surround_kernel, mode="constant"
+            ).astype(bool)
+        purs_sur = catches[pursuer_pos[:, 0], pursuer_pos[:, 1]]
+
+        self.evaders_gone[np.flatnonzero(~self.evaders_gone)[caught]] = True
+        self.evader_layer.remove_agents(caught)
+        return int(np.count_nonzero(caught)), 0, purs_sur
 
     def need_to_surround(self, x, y):
         """Compute the number of surrounding grid cells.
@@ -588,16 +608,4 @@ class Pursuit:
         Compute the number of surrounding grid cells in x,y position that are open
         (no wall or obstacle)
         """
-        tosur = 4
-        if x == 0 or x == (self.x_size - 1):
-            tosur -= 1
-        if y == 0 or y == (self.y_size - 1):
-            tosur -= 1
-        neighbors = self.surround_mask + np.array([x, y])
-        for n in neighbors:
-            xn, yn = n
-            if not 0 < xn < self.x_size or not 0 < yn < self.y_size:
-                continue
-            if self.model_state[0][xn, yn] == -1:
-                tosur -= 1
-        return tosur
+        return self.surround_need[x, y]
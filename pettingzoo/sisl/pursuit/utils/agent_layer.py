@@ -1,49 +1,118 @@
 import numpy as np
 
+from pettingzoo.sisl.pursuit.utils.discrete_agent import MOTION_RANGE
+
 #################################################################
 # Implements a Cooperating Agent Layer for 2D problems
 #################################################################
 
 
 class AgentLayer:
-    def __init__(self, xs, ys, allies, seed=1):
+    def __init__(self, xs, ys, allies, seed=1, map_matrix=None):
         """Initializes the AgentLayer class.
 
         xs: x size of map
         ys: y size of map
         allies: list of ally agents
         seed: seed
+        map_matrix: map of the environment (-1 are buildings), defaults to the
+            map of the allies
+
+        The positions of all agents are kept in arrays, the allies are bound to
+        their rows. Agents are indexed by their order among the agents that
+        have not been removed.
 
         Each ally agent must support:
-        - move(action)
         - current_position()
         - nactions()
-        - set_position(x, y)
+        - bind(current_pos, last_pos)
         """
-        self.allies = allies
-        self.nagents = len(allies)
+        self.xs = xs
+        self.ys = ys
+        if map_matrix is None:
+            map_matrix = (
+                allies[0].map_matrix if allies else np.zeros((xs, ys), dtype=np.int32)
+            )
+        self.map_matrix = map_matrix
+        self.all_allies = list(allies)
+        n = len(self.all_allies)
+        self.positions = np.zeros((n, 2), dtype=np.int32)
+        self.last_positions = np.zeros((n, 2), dtype=np.int32)
+        for i, ally in enumerate(self.all_allies):
+            ally.bind(self.positions[i], self.last_positions[i])
+        self.alive = np.ones(n, dtype=bool)
+        self.terminal = np.zeros(n, dtype=bool)
+        self.alive_idx = np.arange(n)
+        self.nagents = n
         self.global_state = np.zeros((xs, ys), dtype=np.int32)
 
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        # copies of the allies hold copies of their rows, bind them to the
+        # position arrays of this layer again
+        for i, ally in enumerate(self.all_allies):
+            ally.bind(self.positions[i], self.last_positions[i])
+
+    @property
+    def allies(self):
+        return [self.all_allies[i] for i in self.alive_idx]
+
     def n_agents(self):
         return self.nagents
 
     def move_agent(self, agent_idx, action):
-        return self.allies[agent_idx].step(action)
+        self.move_all(np.array([action]), self.alive_idx[[agent_idx]])
+        return self.get_position(agent_idx)
+
+    def move_all(self, actions, idx=None):
+        """Moves all agents, or the agents at rows ``idx``, by one action each.
+
+        Agents do not move out of the map or into buildings. Agents in a
+        building become terminal and stay there.
+        """
+        idx = self.alive_idx if idx is None else idx
+        pos = self.positions[idx]
+        target = pos + MOTION_RANGE[actions]
+        in_bounds = (
+            (target[:, 0] >= 0)
+            & (target[:, 0] < self.xs)
+            & (target[:, 1] >= 0)
+            & (target[:, 1] < self.ys)
+        )
+        target[~in_bounds] = pos[~in_bounds]
+        in_building = self.map_matrix[pos[:, 0], pos[:, 1]] == -1
+        self.terminal[idx[in_building]] = True
+        moves = (
+            in_bounds
+            & ~self.terminal[idx]
+            & (self.map_matrix[target[:, 0], target[:, 1]] != -1)
+        )
+        self.last_positions[idx[moves]] = pos[moves]
+        self.positions[idx[moves]] = target[moves]
 
     def set_position(self, agent_idx, x, y):
-        self.allies[agent_idx].set_position(x, y)
+        self.positions[self.alive_idx[agent_idx]] = (x, y)
 
     def get_position(self, agent_idx):
         """Returns the position of the given agent."""
-        return self.allies[agent_idx].current_position()
+        return self.positions[self.alive_idx[agent_idx]]
+
+    def get_positions(self):
+        """Returns the positions of all agents as an (n_agents, 2) array."""
+        return self.positions[self.alive_idx]
 
     def get_nactions(self, agent_idx):
-        return self.allies[agent_idx].nactions()
+        return len(MOTION_RANGE)
 
     def remove_agent(self, agent_idx):
         # idx is between zero and nagents
-        self.allies.pop(agent_idx)
-        self.nagents -= 1
+        self.remove_agents([agent_idx])
+
+    def remove_agents(self, agent_idxs):
+        """Removes the agents at the given indices (or boolean mask) at once."""
+        self.alive[self.alive_idx[agent_idxs]] = False
+        self.alive_idx = np.flatnonzero(self.alive)
+        self.nagents = len(self.alive_idx)
 
     def get_state_matrix(self):
         """Returns a matrix representing the positions of all allies.
@@ -56,15 +125,9 @@ class AgentLayer:
         """
         gs = self.global_state
         gs.fill(0)
-        for ally in self.allies:
-            x, y = ally.current_position()
-            gs[x, y] += 1
+        pos = self.get_positions()
+        np.add.at(gs, (pos[:, 0], pos[:, 1]), 1)
         return gs
 
     def get_state(self):
-        pos = np.zeros(2 * len(self.allies))
-        idx = 0
-        for ally in self.allies:
-            pos[idx : (idx + 2)] = ally.get_state()
-            idx += 2
-        return pos
+        return self.get_positions().ravel().astype(np.float64)
@@ -7,6 +7,9 @@ from pettingzoo.sisl._utils import Agent
 # Implements the Single 2D Agent Dynamics
 #################################################################
 
+# displacement of every action: left, right, up, down and stay
+MOTION_RANGE = np.array([[-1, 0], [1, 0], [0, 1], [0, -1], [0, 0]], dtype=np.int32)
+
 
 class DiscreteAgent(Agent):
     # constructor
@@ -37,7 +40,7 @@ class DiscreteAgent(Agent):
             4,
         ]  # stay
 
-        self.motion_range = [[-1, 0], [1, 0], [0, 1], [0, -1], [0, 0]]
+        self.motion_range = MOTION_RANGE
 
         self.current_pos = np.zeros(2, dtype=np.int32)  # x and y position
         self.last_pos = np.zeros(2, dtype=np.int32)
@@ -117,6 +120,13 @@ class DiscreteAgent(Agent):
         self.current_pos[0] = xs
         self.current_pos[1] = ys
 
+    def bind(self, current_pos, last_pos):
+        """Keeps the position of the agent in the given arrays, e.g. rows of an AgentLayer."""
+        current_pos[:] = self.current_pos
+        last_pos[:] = self.last_pos
+        self.current_pos = current_pos
+        self.last_pos = last_pos
+
     def current_position(self):
         return self.current_pos
 
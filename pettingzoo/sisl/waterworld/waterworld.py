@@ -145,14 +145,15 @@ from pettingzoo.utils import AgentSelector, wrappers
 from pettingzoo.utils.conversions import parallel_wrapper_fn
 
 
-def env(**kwargs):
+def env(validate=None, **kwargs):
     env = raw_env(**kwargs)
     env = wrappers.ClipOutOfBoundsWrapper(env)
-    env = wrappers.OrderEnforcingWrapper(env)
+    if wrappers.validation_enabled(validate):
+        env = wrappers.OrderEnforcingWrapper(env)
     return env
 
 
-parallel_env = parallel_wrapper_fn(env)
+parallel_env = parallel_wrapper_fn(env, fast=True)
 
 
 class raw_env(AECEnv, EzPickle):
@@ -203,6 +204,19 @@ class raw_env(AECEnv, EzPickle):
         self.truncations = dict(zip(self.agents, [False for _ in self.agents]))
         self.infos = dict(zip(self.agents, [{} for _ in self.agents]))
 
+    def restore(self, snapshot):
+        """Returns the environment to the state of a `snapshot`.
+
+        Every restore of a snapshot replays the same trajectory. It can differ from
+        the trajectory of the environment the snapshot was taken from, since the
+        copied pymunk space calls the collision callbacks, which draw from
+        ``np_random``, in a different order.
+        """
+        # the default snapshot copies the simulation, the window is kept
+        screen = self.env.screen
+        super().restore(snapshot)
+        self.env.screen = screen
+
     def close(self):
         if self.has_reset:
             self.env.close()
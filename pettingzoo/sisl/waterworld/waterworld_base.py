@@ -215,6 +215,19 @@ class WaterworldBase:
                 )
             )
 
+    def __getstate__(self):
+        # pygame's clock and screen cannot be copied, copies get their own; the
+        # collision handlers are copied with the space
+        state = self.__dict__.copy()
+        state["clock"] = None
+        state["screen"] = None
+        state["handlers"] = []
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.clock = pygame.time.Clock()
+
     def close(self):
         if self.screen is not None:
             pygame.quit()
@@ -486,141 +499,197 @@ class WaterworldBase:
         return np.array(self.last_obs[agent_id], dtype=np.float32)
 
     def observe_list(self):
-        observe_list = []
+        """Get the observations of all pursuers, computed for all of them at once."""
+        sensors = self.pursuers[0].sensors
+        sensor_range = self.pursuers[0].sensor_range
+        positions = self._body_array(self.pursuers, "position")
+        velocities = self._body_array(self.pursuers, "velocity")
+
+        def readings(objects, max_speed, exclude_self=False):
+            return self.get_all_sensor_readings(
+                sensors,
+                sensor_range,
+                positions,
+                velocities,
+                self._body_array(objects, "position"),
+                self._body_array(objects, "velocity"),
+                np.array([obj.radius for obj in objects], dtype=np.float64),
+                max_speed + self.pursuer_speed,
+                exclude_self=exclude_self,
+            )
 
-        for i, pursuer in enumerate(self.pursuers):
-            obstacle_distances = []
+        obstacle_sensor_vals, _ = readings(self.obstacles, 0.0)
+        barrier_distances = self.get_all_barrier_readings(
+            sensors, sensor_range, positions
+        )
+        evader_sensor_distance_vals, evader_sensor_velocity_vals = readings(
+            self.evaders, self.evader_speed
+        )
+        poison_sensor_distance_vals, poison_sensor_velocity_vals = readings(
+            self.poisons, self.poison_speed
+        )
 
-            evader_distances = []
-            evader_velocities = []
+        # When there is only one pursuer the sensors will not sense
+        # another pursuer
+        if self.n_pursuers > 1:
+            _pursuer_sensor_distance_vals, _pursuer_sensor_velocity_vals = readings(
+                self.pursuers, self.pursuer_speed, exclude_self=True
+            )
+        else:
+            _pursuer_sensor_distance_vals = np.zeros((1, self.n_sensors))
+            _pursuer_sensor_velocity_vals = np.zeros((1, self.n_sensors))
+
+        food_obs = np.array(
+            [[p.shape.food_touched_indicator >= 1] for p in self.pursuers],
+            dtype=np.float64,
+        )
+        poison_obs = np.array(
+            [[p.shape.poison_indicator >= 1] for p in self.pursuers], dtype=np.float64
+        )
 
-            poison_distances = []
-            poison_velocities = []
+        # concatenate all observations
+        if self.speed_features:
+            observations = np.concatenate(
+                [
+                    obstacle_sensor_vals,
+                    barrier_distances,
+                    evader_sensor_distance_vals,
+                    evader_sensor_velocity_vals,
+                    poison_sensor_distance_vals,
+                    poison_sensor_velocity_vals,
+                    _pursuer_sensor_distance_vals,
+                    _pursuer_sensor_velocity_vals,
+                    food_obs,
+                    poison_obs,
+                ],
+                axis=1,
+            )
+        else:
+            observations = np.concatenate(
+                [
+                    obstacle_sensor_vals,
+                    barrier_distances,
+                    evader_sensor_distance_vals,
+                    poison_sensor_distance_vals,
+                    _pursuer_sensor_distance_vals,
+                    food_obs,
+                    poison_obs,
+                ],
+                axis=1,
+            )
 
-            _pursuer_distances = []
-            _pursuer_velocities = []
+        return list(observations)
 
-            for obstacle in self.obstacles:
-                obstacle_distance, _ = pursuer.get_sensor_reading(
-                    obstacle.body.position, obstacle.radius, obstacle.body.velocity, 0.0
-                )
-                obstacle_distances.append(obstacle_distance)
+    @staticmethod
+    def _body_array(objects, attribute):
+        """Stack the body positions or velocities of objects, as (n_objects, 2)."""
+        return np.array(
+            [tuple(getattr(obj.body, attribute)) for obj in objects],
+            dtype=np.float64,
+        ).reshape(len(objects), 2)
 
-            obstacle_sensor_vals = self.get_sensor_readings(
-                obstacle_distances, pursuer.sensor_range
-            )
+    def get_all_sensor_readings(
+        self,
+        sensors,
+        sensor_range,
+        positions,
+        velocities,
+        object_positions,
+        object_velocities,
+        object_radii,
+        max_speed,
+        exclude_self=False,
+    ):
+        """Get the readings of the sensors of all pursuers for one kind of object.
 
-            barrier_distances = pursuer.get_sensor_barrier_readings()
+        This is Pursuers.get_sensor_reading followed by get_sensor_readings,
+        batched over (n_pursuers, n_sensors, n_objects).
 
-            for evader in self.evaders:
-                evader_distance, evader_velocity = pursuer.get_sensor_reading(
-                    evader.body.position,
-                    evader.radius,
-                    evader.body.velocity,
-                    self.evader_speed,
-                )
-                evader_distances.append(evader_distance)
-                evader_velocities.append(evader_velocity)
-
-            (
-                evader_sensor_distance_vals,
-                evader_sensor_velocity_vals,
-            ) = self.get_sensor_readings(
-                evader_distances,
-                pursuer.sensor_range,
-                velocites=evader_velocities,
-            )
+        sensors: (n_sensors, 2) unit vectors of the sensors
+        positions, velocities: (n_pursuers, 2) arrays of the pursuers
+        object_positions, object_velocities: (n_objects, 2) arrays
+        object_radii: (n_objects,) array
+        max_speed: sum of the maximum speeds of the objects and the pursuers
+        exclude_self: the objects are the pursuers, a pursuer does not sense itself
 
-            for poison in self.poisons:
-                poison_distance, poison_velocity = pursuer.get_sensor_reading(
-                    poison.body.position,
-                    poison.radius,
-                    poison.body.velocity,
-                    self.poison_speed,
-                )
-                poison_distances.append(poison_distance)
-                poison_velocities.append(poison_velocity)
-
-            (
-                poison_sensor_distance_vals,
-                poison_sensor_velocity_vals,
-            ) = self.get_sensor_readings(
-                poison_distances,
-                pursuer.sensor_range,
-                velocites=poison_velocities,
+        Returns the (n_pursuers, n_sensors) distance and velocity readings of
+        the closest object of every sensor.
+        """
+        n_pursuers, n_objects = len(positions), len(object_positions)
+        if n_objects == 0:
+            return (
+                np.ones((n_pursuers, self.n_sensors)),
+                np.zeros((n_pursuers, self.n_sensors)),
             )
 
-            # When there is only one pursuer the sensors will not sense
-            # another pursuer
-            if self.n_pursuers > 1:
-                for j, _pursuer in enumerate(self.pursuers):
-                    # Get sensor readings only for other pursuers
-                    if i == j:
-                        continue
-
-                    _pursuer_distance, _pursuer_velocity = pursuer.get_sensor_reading(
-                        _pursuer.body.position,
-                        _pursuer.radius,
-                        _pursuer.body.velocity,
-                        self.pursuer_speed,
-                    )
-                    _pursuer_distances.append(_pursuer_distance)
-                    _pursuer_velocities.append(_pursuer_velocity)
+        # (n_pursuers, n_objects, 2) offsets of the objects from the pursuers
+        offsets = object_positions[None, :, :] - positions[:, None, :]
+        distance_squared = np.sum(offsets**2, axis=2)
 
-                (
-                    _pursuer_sensor_distance_vals,
-                    _pursuer_sensor_velocity_vals,
-                ) = self.get_sensor_readings(
-                    _pursuer_distances,
-                    pursuer.sensor_range,
-                    velocites=_pursuer_velocities,
-                )
-            else:
-                _pursuer_sensor_distance_vals = np.zeros(self.n_sensors)
-                _pursuer_sensor_velocity_vals = np.zeros(self.n_sensors)
+        # Project distances to sensor vectors, (n_pursuers, n_sensors, n_objects)
+        projections = np.einsum("sd,pod->pso", sensors, offsets)
 
-            if pursuer.shape.food_touched_indicator >= 1:
-                food_obs = 1
-            else:
-                food_obs = 0
+        # Check for valid detection criterions
+        not_sensed = (
+            (projections < 0)
+            | (projections - object_radii > sensor_range)
+            | (distance_squared[:, None, :] - projections**2 > object_radii**2)
+        )
 
-            if pursuer.shape.poison_indicator >= 1:
-                poison_obs = 1
-            else:
-                poison_obs = 0
-
-            # concatenate all observations
-            if self.speed_features:
-                pursuer_observation = np.concatenate(
-                    [
-                        obstacle_sensor_vals,
-                        barrier_distances,
-                        evader_sensor_distance_vals,
-                        evader_sensor_velocity_vals,
-                        poison_sensor_distance_vals,
-                        poison_sensor_velocity_vals,
-                        _pursuer_sensor_distance_vals,
-                        _pursuer_sensor_velocity_vals,
-                        np.array([food_obs]),
-                        np.array([poison_obs]),
-                    ]
-                )
-            else:
-                pursuer_observation = np.concatenate(
-                    [
-                        obstacle_sensor_vals,
-                        barrier_distances,
-                        evader_sensor_distance_vals,
-                        poison_sensor_distance_vals,
-                        _pursuer_sensor_distance_vals,
-                        np.array([food_obs]),
-                        np.array([poison_obs]),
-                    ]
-                )
+        # Set not sensed sensor readings of position to sensor range
+        distances = np.clip(projections / sensor_range, 0, 1)
+        distances[not_sensed] = 1.0
+        if exclude_self:
+            pursuer_idx = np.arange(n_pursuers)
+            distances[pursuer_idx, :, pursuer_idx] = np.inf
+
+        # Sensor only reads the closest object
+        closest = np.argmin(distances, axis=2)[..., None]
+        sensor_distance_vals = np.take_along_axis(distances, closest, axis=2)[..., 0]
+        sensed = ~np.take_along_axis(not_sensed, closest, axis=2)[..., 0]
+
+        # Project the relative velocity of the closest object to the sensor
+        # vectors, not sensed sensor readings of velocity are zero
+        relative_velocities = (
+            object_velocities[closest[..., 0]] - velocities[:, None, :]
+        )
+        sensor_velocity_vals = np.where(
+            sensed, np.sum(sensors * relative_velocities, axis=2) / max_speed, 0.0
+        )
+
+        return sensor_distance_vals, sensor_velocity_vals
+
+    def get_all_barrier_readings(self, sensors, sensor_range, positions):
+        """Get the distances of the sensors of all pursuers to the barrier.
+
+        This is Pursuers.get_sensor_barrier_readings batched over the
+        (n_pursuers, 2) positions, returns an (n_pursuers, n_sensors) array.
+        """
+        # Get the endpoint position of each sensor
+        sensor_vectors = sensors * sensor_range
+        sensor_endpoints = positions[:, None, :] + sensor_vectors
+
+        # Clip sensor lines on the environment's barriers
+        clipped_vectors = (
+            np.clip(sensor_endpoints, 0.0, self.pixel_scale) - positions[:, None, :]
+        )
+
+        # Find the ratio of the clipped sensor vector to the original sensor vector
+        ratios = np.divide(
+            clipped_vectors,
+            sensor_vectors,
+            out=np.ones_like(clipped_vectors),
+            where=np.abs(sensor_vectors) > 1e-8,
+        )
+        sensor_values = np.amin(ratios, axis=2)
+
+        # Set values beyond sensor range to 1.0
+        sensor_values[sensor_values >= 1.0 - 1e-4] = 1.0
 
-            observe_list.append(pursuer_observation)
+        # Convert -0 to 0
+        sensor_values[sensor_values == -0] = 0
 
-        return observe_list
+        return sensor_values
 
     def get_sensor_readings(self, positions, sensor_range, velocites=None):
         """Get readings from sensors.
@@ -1,5 +1,7 @@
 from pettingzoo.test.api_test import api_test
+from pettingzoo.test.api_test_runner import run_api_tests
 from pettingzoo.test.bombardment_test import bombardment_test
+from pettingzoo.test.collision_benchmark import collision_benchmark
 from pettingzoo.test.manual_control_test import manual_control_test
 from pettingzoo.test.max_cycles_test import max_cycles_test
 from pettingzoo.test.parallel_test import parallel_api_test
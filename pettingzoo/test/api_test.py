@@ -1,14 +1,18 @@
 from __future__ import annotations
 
+import contextlib
+import random
 import re
+import time
 import warnings
 from collections import defaultdict
-from typing import Any
+from typing import Any, Iterator
 
 import gymnasium
 import numpy as np
 
 import pettingzoo
+from pettingzoo.utils.action_sampling import sample_action
 from pettingzoo.utils.conversions import (
     aec_to_parallel_wrapper,
     parallel_to_aec_wrapper,
@@ -424,7 +428,61 @@ def _test_observation_space_compatibility(
         ), f"dtype for observation at [{']['.join(recursed_keys)}] is {seen.dtype}, but observation space specifies {expected.dtype}."
 
 
-def play_test(env, observation_0, num_cycles):
+class CheckTimings:
+    """Total time spent in, and number of runs of, every check of `api_test` and `parallel_api_test`.
+
+    Example:
+        >>> timings = CheckTimings()
+        >>> with timings.measure("observation"):
+        ...     pass
+        >>> timings.calls["observation"]
+        1
+    """
+
+    def __init__(self):
+        self.seconds: dict[str, float] = defaultdict(float)
+        self.calls: dict[str, int] = defaultdict(int)
+
+    @contextlib.contextmanager
+    def measure(self, name: str) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.seconds[name] += time.perf_counter() - start
+            self.calls[name] += 1
+
+    def summary(self) -> dict[str, dict[str, float]]:
+        """Returns the seconds and calls of every check, the most expensive check first."""
+        return {
+            name: {"seconds": self.seconds[name], "calls": self.calls[name]}
+            for name in sorted(self.seconds, key=self.seconds.get, reverse=True)
+        }
+
+    def __str__(self) -> str:
+        return "\n".join(
+            f"{name}: {entry['seconds']:.3f}s ({entry['calls']} calls)"
+            for name, entry in self.summary().items()
+        )
+
+
+def _deadline(time_budget: float | None) -> float | None:
+    return None if time_budget is None else time.perf_counter() + time_budget
+
+
+def _out_of_time(deadline: float | None) -> bool:
+    return deadline is not None and time.perf_counter() > deadline
+
+
+def play_test(
+    env,
+    observation_0,
+    num_cycles,
+    check_rate=1.0,
+    deadline=None,
+    rng=None,
+    timings=None,
+):
     """
     plays through environment and does dynamic checks to make
     sure the state returned by the environment is
@@ -434,14 +492,23 @@ def play_test(env, observation_0, num_cycles):
     * Whether the agents list shrinks when agents are terminated or truncated
     * Whether the keys of the rewards, terminations, truncations, infos are equal to the agents list
     * tests that the observation is in bounds.
+
+    The structural checks run at every step. The deep checks of the
+    observation run at the first step and then at a random ``check_rate``
+    fraction of the steps. Play stops early once the ``deadline`` (of
+    ``time.perf_counter``) has passed.
     """
+    rng = random.Random() if rng is None else rng
+    timings = CheckTimings() if timings is None else timings
     env.reset()
 
     live_agents = set(env.agents[:])
     has_finished = set()
     generated_agents = set()
     accumulated_rewards = defaultdict(int)
-    for agent in env.agent_iter(env.num_agents * num_cycles):
+    for step, agent in enumerate(env.agent_iter(env.num_agents * num_cycles)):
+        if _out_of_time(deadline):
+            break
         generated_agents.add(agent)
         assert (
             agent not in has_finished
@@ -449,15 +516,12 @@ def play_test(env, observation_0, num_cycles):
         assert isinstance(
             env.infos[agent], dict
         ), "an environment agent's info must be a dictionary"
-        prev_observe, reward, terminated, truncated, info = env.last()
+        with timings.measure("last"):
+            prev_observe, reward, terminated, truncated, info = env.last()
         if terminated or truncated:
             action = None
-        elif isinstance(prev_observe, dict) and "action_mask" in prev_observe:
-            action = env.action_space(agent).sample(prev_observe["action_mask"])
-        elif "action_mask" in info:
-            action = env.action_space(agent).sample(info["action_mask"])
         else:
-            action = env.action_space(agent).sample()
+            action = sample_action(env.action_space(agent), prev_observe, info)
 
         if agent not in live_agents:
             live_agents.add(agent)
@@ -475,43 +539,50 @@ def play_test(env, observation_0, num_cycles):
         ), "reward returned by last is not the accumulated rewards in its rewards dict"
         accumulated_rewards[agent] = 0
 
-        env.step(action)
-
-        for a, rew in env.rewards.items():
-            accumulated_rewards[a] += rew
-
-        assert env.num_agents == len(
-            env.agents
-        ), "env.num_agents is not equal to len(env.agents)"
-        assert set(env.rewards.keys()) == (
-            set(env.agents)
-        ), "agents should not be given a reward if they were terminated or truncated last turn"
-        assert set(env.terminations.keys()) == (
-            set(env.agents)
-        ), "agents should not be given a termination if they were terminated or truncated last turn"
-        assert set(env.truncations.keys()) == (
-            set(env.agents)
-        ), "agents should not be given a truncation if they were terminated or truncated last turn"
-        assert set(env.infos.keys()) == (
-            set(env.agents)
-        ), "agents should not be given an info if they were terminated or truncated last turn"
-        if hasattr(env, "possible_agents"):
-            assert set(env.agents).issubset(
-                set(env.possible_agents)
-            ), "possible agents should always include all agents, if it exists"
+        with timings.measure("step"):
+            env.step(action)
+
+        with timings.measure("structure"):
+            for a, rew in env.rewards.items():
+                accumulated_rewards[a] += rew
+
+            assert env.num_agents == len(
+                env.agents
+            ), "env.num_agents is not equal to len(env.agents)"
+            assert set(env.rewards.keys()) == (
+                set(env.agents)
+            ), "agents should not be given a reward if they were terminated or truncated last turn"
+            assert set(env.terminations.keys()) == (
+                set(env.agents)
+            ), "agents should not be given a termination if they were terminated or truncated last turn"
+            assert set(env.truncations.keys()) == (
+                set(env.agents)
+            ), "agents should not be given a truncation if they were terminated or truncated last turn"
+            assert set(env.infos.keys()) == (
+                set(env.agents)
+            ), "agents should not be given an info if they were terminated or truncated last turn"
+            if hasattr(env, "possible_agents"):
+                assert set(env.agents).issubset(
+                    set(env.possible_agents)
+                ), "possible agents should always include all agents, if it exists"
 
         if not env.agents:
             break
 
-        assert env.observation_space(agent).contains(
-            prev_observe
-        ), "Out of bounds observation: " + str(prev_observe)
+        if step > 0 and rng.random() >= check_rate:
+            continue
 
-        _test_observation_space_compatibility(
-            env.observation_space(agent), prev_observe, recursed_keys=[]
-        )
+        with timings.measure("observation_space"):
+            assert env.observation_space(agent).contains(
+                prev_observe
+            ), "Out of bounds observation: " + str(prev_observe)
 
-        test_observation(prev_observe, observation_0, str(env.unwrapped))
+            _test_observation_space_compatibility(
+                env.observation_space(agent), prev_observe, recursed_keys=[]
+            )
+
+        with timings.measure("observation"):
+            test_observation(prev_observe, observation_0, str(env.unwrapped))
         if not isinstance(env.infos[env.agent_selection], dict):
             warnings.warn(
                 "The info of each agent should be a dict, use {} if you aren't using info"
@@ -524,31 +595,34 @@ def play_test(env, observation_0, num_cycles):
 
     env.reset()
     for agent in env.agent_iter(env.num_agents * 2):
-        obs, reward, terminated, truncated, info = env.last()
+        with timings.measure("last"):
+            obs, reward, terminated, truncated, info = env.last()
         if terminated or truncated:
             action = None
-        elif isinstance(obs, dict) and "action_mask" in obs:
-            action = env.action_space(agent).sample(obs["action_mask"])
-        elif "action_mask" in info:
-            action = env.action_space(agent).sample(info["action_mask"])
         else:
-            action = env.action_space(agent).sample()
-        assert isinstance(terminated, bool), "terminated from last is not True or False"
-        assert isinstance(truncated, bool), "terminated from last is not True or False"
-        assert (
-            terminated == env.terminations[agent]
-        ), "terminated from last() and terminations[agent] do not match"
-        assert (
-            truncated == env.truncations[agent]
-        ), "truncated from last() and truncations[agent] do not match"
-        assert (
-            info == env.infos[agent]
-        ), "Info from last() and infos[agent] do not match"
-        float(
-            env.rewards[agent]
-        )  # "Rewards for each agent must be convertible to float
-        test_reward(reward)
-        observation = env.step(action)
+            action = sample_action(env.action_space(agent), obs, info)
+        with timings.measure("last_consistency"):
+            assert isinstance(
+                terminated, bool
+            ), "terminated from last is not True or False"
+            assert isinstance(
+                truncated, bool
+            ), "terminated from last is not True or False"
+            assert (
+                terminated == env.terminations[agent]
+            ), "terminated from last() and terminations[agent] do not match"
+            assert (
+                truncated == env.truncations[agent]
+            ), "truncated from last() and truncations[agent] do not match"
+            assert (
+                info == env.infos[agent]
+            ), "Info from last() and infos[agent] do not match"
+            float(
+                env.rewards[agent]
+            )  # "Rewards for each agent must be convertible to float
+            test_reward(reward)
+        with timings.measure("step"):
+            observation = env.step(action)
         assert observation is None, "step() must not return anything"
 
 
@@ -561,10 +635,8 @@ def test_action_flexibility(env):
         obs, reward, terminated, truncated, info = env.last()
         if terminated or truncated:
             action = None
-        elif isinstance(obs, dict) and "action_mask" in obs:
-            action = env.action_space(agent).sample(obs["action_mask"])
-        elif "action_mask" in info:
-            action = env.action_space(agent).sample(info["action_mask"])
+        elif isinstance(obs, dict) and "action_mask" in obs or "action_mask" in info:
+            action = sample_action(action_space, obs, info)
         else:
             action = 0
         env.step(action)
@@ -576,7 +648,25 @@ def test_action_flexibility(env):
         env.step(np.zeros_like(action_space.low))
 
 
-def api_test(env, num_cycles=1000, verbose_progress=False):
+def api_test(
+    env,
+    num_cycles=1000,
+    verbose_progress=False,
+    check_rate=1.0,
+    time_budget=None,
+    seed=None,
+):
+    """Checks that ``env`` follows the AEC API and returns the `CheckTimings` of the checks.
+
+    The structural checks run at every step of the ``num_cycles`` cycles. The
+    deep checks of the observations, which can dominate the test on
+    environments with large observations, run at a random ``check_rate``
+    fraction of the steps, drawn with ``seed``. With a ``time_budget`` (in
+    seconds), playing the environment stops early once the budget is spent.
+    """
+    deadline = _deadline(time_budget)
+    timings = CheckTimings()
+
     def progress_report(msg):
         if verbose_progress:
             print(msg)
@@ -609,7 +699,8 @@ def api_test(env, num_cycles=1000, verbose_progress=False):
     if isinstance(observation_0, dict) and "observation" in observation_0:
         observation_0 = observation_0["observation"]
 
-    test_observation(observation_0, observation_0, str(env.unwrapped))
+    with timings.measure("observation"):
+        test_observation(observation_0, observation_0, str(env.unwrapped))
 
     non_observe, *_ = env.last(observe=False)
     assert non_observe is None, "last must return a None when observe=False"
@@ -618,11 +709,20 @@ def api_test(env, num_cycles=1000, verbose_progress=False):
 
     agent_0 = env.agent_selection
 
-    test_observation_action_spaces(env, agent_0)
+    with timings.measure("spaces"):
+        test_observation_action_spaces(env, agent_0)
 
     progress_report("Finished test_observation_action_spaces")
 
-    play_test(env, observation_0, num_cycles)
+    play_test(
+        env,
+        observation_0,
+        num_cycles,
+        check_rate=check_rate,
+        deadline=deadline,
+        rng=random.Random(seed),
+        timings=timings,
+    )
 
     progress_report("Finished play test")
 
@@ -641,7 +741,8 @@ def api_test(env, num_cycles=1000, verbose_progress=False):
 
     test_rewards_terminations_truncations(env, agent_0)
 
-    test_action_flexibility(env)
+    with timings.measure("action_flexibility"):
+        test_action_flexibility(env)
 
     progress_report("Finished test_rewards_terminations_truncations")
 
@@ -660,4 +761,6 @@ def api_test(env, num_cycles=1000, verbose_progress=False):
     else:
         warnings.warn("Environment has not defined a render() method")
 
+    progress_report(str(timings))
     print("Passed API test")
+    return timings
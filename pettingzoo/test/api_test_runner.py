@@ -0,0 +1,151 @@
+from __future__ import annotations
+
+import concurrent.futures
+import contextlib
+import importlib
+import io
+import multiprocessing
+import os
+import time
+import traceback
+import warnings
+from typing import Any, Callable, Mapping, Sequence, Union
+
+from pettingzoo.test.api_test import api_test
+from pettingzoo.test.parallel_test import parallel_api_test
+from pettingzoo.utils.env import AECEnv, ParallelEnv
+
+# an environment factory, or the "module:attribute" path of one
+EnvFn = Union[Callable[[], Union[AECEnv, ParallelEnv]], str]
+
+
+def _env_name(env_fn: EnvFn) -> str:
+    if isinstance(env_fn, str):
+        return env_fn
+    return f"{env_fn.__module__}.{getattr(env_fn, '__qualname__', repr(env_fn))}"
+
+
+def _resolve(env_fn: EnvFn) -> Callable[[], AECEnv | ParallelEnv]:
+    if isinstance(env_fn, str):
+        module, _, attribute = env_fn.partition(":")
+        return getattr(importlib.import_module(module), attribute)
+    return env_fn
+
+
+# the environment factories of a worker process, passed to _init_worker or,
+# with the "fork" start method, inherited from the parent process
+_worker_env_fns: dict[str, EnvFn] = {}
+
+
+def _init_worker(env_fns: dict[str, EnvFn]) -> None:
+    _worker_env_fns.update(env_fns)
+
+
+def _run_worker_api_test(name: str, test_kwargs: dict[str, Any]) -> dict[str, Any]:
+    return _run_api_test(name, _worker_env_fns[name], test_kwargs)
+
+
+def _run_api_test(
+    name: str, env_fn: EnvFn, test_kwargs: dict[str, Any]
+) -> dict[str, Any]:
+    result: dict[str, Any] = {"name": name, "passed": False, "error": None}
+    start = time.perf_counter()
+    with warnings.catch_warnings(record=True) as caught, contextlib.redirect_stdout(
+        io.StringIO()
+    ):
+        warnings.simplefilter("always")
+        try:
+            env = _resolve(env_fn)()
+            try:
+                if isinstance(env, ParallelEnv):
+                    timings = parallel_api_test(env, **test_kwargs)
+                else:
+                    timings = api_test(env, **test_kwargs)
+            finally:
+                env.close()
+            result["passed"] = True
+            result["timings"] = timings.summary()
+        except Exception:
+            result["error"] = traceback.format_exc()
+    result["seconds"] = time.perf_counter() - start
+    result["warnings"] = sorted({str(warning.message) for warning in caught})
+    return result
+
+
+def run_api_tests(
+    env_fns: Mapping[str, EnvFn] | Sequence[EnvFn],
+    num_cycles: int = 1000,
+    check_rate: float = 1.0,
+    time_budget: float | None = None,
+    seed: int | None = 0,
+    num_workers: int | None = None,
+    context: str | None = None,
+) -> dict[str, dict[str, Any]]:
+    """Runs `api_test`, or `parallel_api_test` for parallel environments, on the environments created by ``env_fns`` in worker processes.
+
+    ``env_fns`` maps names to environment factories, a sequence of factories
+    is named after them. A factory can also be given by its
+    ``"module:attribute"`` path, e.g. ``"pettingzoo.classic.rps_v2:env"``,
+    which is imported in the worker. ``num_cycles``, ``check_rate``,
+    ``time_budget`` and ``seed`` are passed to every test, so e.g.
+    ``check_rate=0.1`` and ``time_budget=10`` bound the time of a large test
+    suite. ``num_workers`` defaults to the number of CPUs, with
+    ``num_workers=0`` the tests run in this process.
+
+    With the ``"fork"`` start method the workers inherit the factories, so
+    any callable works. With ``"spawn"`` or ``"forkserver"`` (the default on
+    some platforms) the factories are pickled, which fails for closures and
+    lambdas, including the ``parallel_env`` of environments built with
+    ``parallel_wrapper_fn``; pass their ``"module:attribute"`` paths instead.
+
+    Failures do not stop the other tests. Every result is a dict with
+    ``passed``, the ``error`` traceback of a failed test, the ``seconds`` the
+    test took, the deduplicated ``warnings`` and, for passed tests, the
+    ``timings`` of every check, as returned by `CheckTimings.summary`.
+
+    Example:
+        >>> from pettingzoo.classic import rps_v2
+        >>> results = run_api_tests(
+        ...     {"rps": rps_v2.env, "rps_parallel": rps_v2.parallel_env},
+        ...     num_cycles=100,
+        ...     num_workers=0,
+        ... )
+        >>> all(result["passed"] for result in results.values())
+        True
+    """
+    if not isinstance(env_fns, Mapping):
+        env_fns = {_env_name(env_fn): env_fn for env_fn in env_fns}
+    test_kwargs = dict(
+        num_cycles=num_cycles, check_rate=check_rate, time_budget=time_budget, seed=seed
+    )
+    names = list(env_fns)
+    fns = [env_fns[name] for name in names]
+    if num_workers is None:
+        num_workers = os.cpu_count() or 1
+    if num_workers == 0:
+        results = [
+            _run_api_test(name, env_fn, test_kwargs) for name, env_fn in zip(names, fns)
+        ]
+    else:
+        mp_context = multiprocessing.get_context(context)
+        if mp_context.get_start_method() == "fork":
+            # forked workers inherit the factories, they are not pickled
+            _worker_env_fns.update(zip(names, fns))
+            initargs: tuple[dict[str, EnvFn]] = ({},)
+        else:
+            initargs = (dict(zip(names, fns)),)
+        try:
+            with concurrent.futures.ProcessPoolExecutor(
+                max_workers=min(num_workers, max(1, len(names))),
+                mp_context=mp_context,
+                initializer=_init_worker,
+                initargs=initargs,
+            ) as executor:
+                results = list(
+                    executor.map(
+                        _run_worker_api_test, names, [test_kwargs] * len(names)
+                    )
+                )
+        finally:
+            _worker_env_fns.clear()
+    return {result["name"]: result for result in results}
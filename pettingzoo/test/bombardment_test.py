@@ -1,9 +1,7 @@
-import random
 from copy import copy
 
-import numpy as np
-
 from pettingzoo.test.api_test import test_observation
+from pettingzoo.utils.action_sampling import sample_action
 
 try:
     import pytest
@@ -47,10 +45,8 @@ def bombardment_test(env, cycles=10000):
             obs, reward, termination, truncation, info = env.last()
             if termination or truncation:
                 action = None
-            elif isinstance(obs, dict) and "action_mask" in obs:
-                action = random.choice(np.flatnonzero(obs["action_mask"]).tolist())
             else:
-                action = env.action_space(agent).sample()
+                action = sample_action(env.action_space(agent), obs, info)
             next_observe = env.step(action)
             assert env.observation_space(agent).contains(
                 prev_observe
@@ -0,0 +1,54 @@
+import time
+
+import numpy as np
+
+from pettingzoo.mpe._mpe_utils.core import Agent, VectorizedWorld, World
+
+
+def make_swarm_world(num_entities, world_class=World, broadphase=False, seed=0):
+    # agents spread at constant density, so the number of contacts grows linearly
+    rng = np.random.default_rng(seed)
+    world = world_class()
+    world.broadphase = broadphase
+    world.agents = [Agent() for _ in range(num_entities)]
+    extent = 0.1 * np.sqrt(num_entities)
+    for agent in world.agents:
+        agent.silent = True
+        agent.state.p_pos = rng.uniform(-extent, extent, world.dim_p)
+        agent.state.p_vel = np.zeros(world.dim_p)
+        agent.state.c = np.zeros(world.dim_c)
+        agent.action.u = rng.uniform(-1, 1, world.dim_p)
+        agent.action.c = np.zeros(world.dim_c)
+    return world
+
+
+def collision_benchmark(num_entities=(10, 100, 1000), min_time=1.0):
+    """Prints the world steps per second of every MPE collision backend.
+
+    Each backend is stepped for at least ``min_time`` seconds, and at least once,
+    for every swarm size in ``num_entities``.
+    """
+    print("Starting collision benchmark")
+    backends = [
+        ("World", World, False),
+        ("World + broadphase", World, True),
+        ("VectorizedWorld", VectorizedWorld, False),
+        ("VectorizedWorld + broadphase", VectorizedWorld, True),
+    ]
+    for n in num_entities:
+        for name, world_class, broadphase in backends:
+            world = make_swarm_world(n, world_class, broadphase)
+            steps = 0
+            start = time.time()
+            while True:
+                world.step()
+                steps += 1
+                length = time.time() - start
+                if length >= min_time:
+                    break
+            print(f"{n} entities, {name}: {steps / length:.1f} steps per second")
+    print("Finished collision benchmark")
+
+
+if __name__ == "__main__":
+    collision_benchmark()
@@ -1,43 +1,16 @@
-import random
-import time
-
-import numpy as np
+from pettingzoo.bench import benchmark_env
 
 
 def performance_benchmark(env):
-    print("Starting performance benchmark")
-    cycles = 0
-    turn = 0
-    env.reset()
-    start = time.time()
-    end = 0
-
-    while True:
-        cycles += 1
-        for agent in env.agent_iter(
-            env.num_agents
-        ):  # step through every agent once with observe=True
-            obs, reward, termination, truncation, info = env.last()
-            if termination or truncation:
-                action = None
-            elif isinstance(obs, dict) and "action_mask" in obs:
-                action = random.choice(np.flatnonzero(obs["action_mask"]).tolist())
-            else:
-                action = env.action_space(agent).sample()
-            env.step(action)
-            turn += 1
+    """Prints the turns and cycles per second of ``env`` over a five second random rollout.
 
-            if all(env.terminations.values()) or all(env.truncations.values()):
-                env.reset()
-
-        if time.time() - start > 5:
-            end = time.time()
-            break
-
-    length = end - start
+    See `pettingzoo.bench` for the full benchmark suite.
+    """
+    print("Starting performance benchmark")
+    result = benchmark_env(env, api="aec", seconds=5, alloc_steps=0, seed=None)
 
-    turns_per_time = turn / length
-    cycles_per_time = cycles / length
+    turns_per_time = result["steps_per_second"]
+    cycles_per_time = turns_per_time / max(len(env.possible_agents), 1)
     print(str(turns_per_time) + " turns per second")
     print(str(cycles_per_time) + " cycles per second")
     print("Finished performance benchmark")
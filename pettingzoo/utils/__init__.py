@@ -1,3 +1,5 @@
+from pettingzoo.utils.action_sampling import sample_action, sample_masked
+from pettingzoo.utils.agent_registry import AgentArrays, AgentRegistry
 from pettingzoo.utils.agent_selector import AgentSelector
 from pettingzoo.utils.average_total_reward import average_total_reward
 from pettingzoo.utils.conversions import (
@@ -6,14 +8,25 @@ from pettingzoo.utils.conversions import (
     turn_based_aec_to_parallel,
 )
 from pettingzoo.utils.env import AECEnv, ParallelEnv
+from pettingzoo.utils.episode_storage import EpisodeReader, EpisodeWriter
+from pettingzoo.utils.evaluation import EvaluationResult, evaluate
+from pettingzoo.utils.profiler import Profiler
 from pettingzoo.utils.random_demo import random_demo
 from pettingzoo.utils.save_observation import save_observation
+from pettingzoo.utils.vector import AsyncVectorParallelEnv, VectorParallelEnv
 from pettingzoo.utils.wrappers import (
     AssertOutOfBoundsWrapper,
     BaseParallelWrapper,
     BaseWrapper,
     CaptureStdoutWrapper,
     ClipOutOfBoundsWrapper,
+    CompiledWrapper,
+    EpisodeRecorderParallelWrapper,
+    EpisodeRecorderWrapper,
     OrderEnforcingWrapper,
+    ProfilingParallelWrapper,
+    ProfilingWrapper,
     TerminateIllegalWrapper,
+    compile_wrappers,
+    set_validation,
 )
@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+from typing import Any
+
+import gymnasium.spaces
+import numpy as np
+
+# used when no generator is given, created once since creating one is slow
+_default_rng = np.random.default_rng()
+
+
+def sample_masked(
+    mask: np.ndarray,
+    rng: np.random.Generator | None = None,
+    logits: np.ndarray | None = None,
+) -> int | np.ndarray:
+    """Samples the index of a legal action from an action mask, or one per row of a ``(batch, n_actions)`` stack of masks.
+
+    Nonzero entries of ``mask`` are legal. Without ``logits`` every legal
+    action is equally likely. With ``logits`` (of the same shape as ``mask``)
+    actions are sampled from the softmax of the logits of the legal actions,
+    with the Gumbel-max trick, so no probabilities are computed. Masks without
+    legal actions give 0, like ``Discrete.sample`` does.
+
+    A single mask returns an ``int``, a stack of masks an integer array.
+
+    Example:
+        >>> rng = np.random.default_rng(42)
+        >>> sample_masked(np.array([0, 1, 0, 0], dtype=np.int8), rng)
+        1
+        >>> masks = np.array([[1, 0, 0], [0, 0, 1]], dtype=np.int8)
+        >>> sample_masked(masks, rng)
+        array([0, 2])
+    """
+    mask = np.asarray(mask)
+    rng = _default_rng if rng is None else rng
+    if logits is None and mask.ndim == 1:
+        legal = np.flatnonzero(mask)
+        if len(legal) == 0:
+            return 0
+        return int(legal[rng.integers(len(legal))])
+    # Gumbel-max trick: the argmax of the perturbed logits is a sample of their
+    # softmax, with equal logits the noise only has to be uniform
+    if logits is None:
+        noise = rng.random(mask.shape)
+    else:
+        noise = logits + rng.gumbel(size=mask.shape)
+    choice = np.where(mask != 0, noise, -np.inf).argmax(axis=-1)
+    if mask.ndim == 1:
+        return int(choice)
+    return choice
+
+
+def _action_mask(observation: Any, info: dict[str, Any] | None) -> np.ndarray | None:
+    if isinstance(observation, dict) and "action_mask" in observation:
+        return observation["action_mask"]
+    if info is not None:
+        return info.get("action_mask")
+    return None
+
+
+def sample_action(
+    space: gymnasium.spaces.Space,
+    observation: Any = None,
+    info: dict[str, Any] | None = None,
+    rng: np.random.Generator | None = None,
+) -> Any:
+    """Samples a random action from ``space``, respecting an ``action_mask`` in the observation or info.
+
+    Masked ``Discrete`` actions are drawn with `sample_masked` from ``rng``, which
+    defaults to the generator of the space, so seeding the space makes the
+    actions reproducible. Other spaces are sampled by the space itself.
+
+    Example:
+        >>> from gymnasium.spaces import Discrete
+        >>> space = Discrete(3, seed=42)
+        >>> sample_action(space, {"action_mask": np.array([0, 0, 1], dtype=np.int8)})
+        2
+    """
+    mask = _action_mask(observation, info)
+    if mask is None:
+        return space.sample()
+    if isinstance(space, gymnasium.spaces.Discrete):
+        index = sample_masked(mask, space.np_random if rng is None else rng)
+        return int(space.start) + index
+    return space.sample(mask)
@@ -0,0 +1,215 @@
+from __future__ import annotations
+
+from typing import Any, Generic, Iterable, Iterator
+
+import numpy as np
+
+from pettingzoo.utils.env import AgentID
+
+
+class AgentRegistry(Generic[AgentID]):
+    """Maps agent names to stable integer indices.
+
+    The index of an agent is its position in ``possible_agents`` and does not
+    change when agents die or are removed from ``env.agents``.
+
+    Example:
+        >>> registry = AgentRegistry(["piston_0", "piston_1"])
+        >>> registry.index("piston_1")
+        1
+        >>> registry.name(0)
+        'piston_0'
+        >>> registry.indices(["piston_1", "piston_0"])
+        array([1, 0])
+    """
+
+    def __init__(self, possible_agents: Iterable[AgentID]):
+        self.names: list[AgentID] = list(possible_agents)
+        self._index: dict[AgentID, int] = {
+            agent: i for i, agent in enumerate(self.names)
+        }
+        assert len(self._index) == len(self.names), "agent names must be unique"
+
+    def index(self, agent: AgentID) -> int:
+        return self._index[agent]
+
+    def name(self, index: int) -> AgentID:
+        return self.names[index]
+
+    def indices(self, agents: Iterable[AgentID]) -> np.ndarray:
+        """Returns the indices of ``agents`` as an integer array, in the given order."""
+        return np.fromiter((self._index[agent] for agent in agents), dtype=np.intp)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def __contains__(self, agent: Any) -> bool:
+        return agent in self._index
+
+    def __iter__(self) -> Iterator[AgentID]:
+        return iter(self.names)
+
+
+class AgentArrayDict(dict):
+    """A dict view of an array which is indexed by agent name.
+
+    The view holds the names of the agents it contains (mapped to their index
+    in the registry), the values are read from and written to ``array``. It is
+    a ``dict`` so it can be used wherever the API expects ``env.rewards`` and
+    friends. Deleting an agent only removes it from the view. Values are
+    returned as Python scalars.
+    """
+
+    def __init__(
+        self,
+        registry: AgentRegistry[AgentID],
+        array: np.ndarray,
+        agents: Iterable[AgentID] = (),
+    ):
+        super().__init__((agent, registry.index(agent)) for agent in agents)
+        self.registry = registry
+        self.array = array
+
+    def __getitem__(self, agent: AgentID) -> Any:
+        return self.array.item(dict.__getitem__(self, agent))
+
+    def __setitem__(self, agent: AgentID, value: Any) -> None:
+        index = dict.get(self, agent)
+        if index is None:
+            index = self.registry.index(agent)
+            dict.__setitem__(self, agent, index)
+        self.array[index] = value
+
+    # overriding __iter__ makes dict(view) and {**view} go through keys() and __getitem__
+    def __iter__(self) -> Iterator[AgentID]:
+        return dict.__iter__(self)
+
+    def get(self, agent: AgentID, default: Any = None) -> Any:
+        index = dict.get(self, agent)
+        return default if index is None else self.array.item(index)
+
+    def values(self):
+        array = self.array
+        return [array.item(index) for index in dict.values(self)]
+
+    def items(self):
+        array = self.array
+        return [(agent, array.item(index)) for agent, index in dict.items(self)]
+
+    def pop(self, agent: AgentID, *default: Any) -> Any:
+        if agent not in self and default:
+            return default[0]
+        value = self[agent]
+        dict.__delitem__(self, agent)
+        return value
+
+    def popitem(self) -> tuple[AgentID, Any]:
+        agent, index = dict.popitem(self)
+        return agent, self.array.item(index)
+
+    def setdefault(self, agent: AgentID, default: Any = None) -> Any:
+        if agent not in self:
+            self[agent] = default
+        return self[agent]
+
+    def update(self, *args, **kwargs) -> None:
+        for agent, value in dict(*args, **kwargs).items():
+            self[agent] = value
+
+    def copy(self) -> dict[AgentID, Any]:
+        """Returns a plain dict with the current values."""
+        return dict(self.items())
+
+    def indices(self) -> np.ndarray:
+        """Returns the registry indices of the agents in the view."""
+        return np.fromiter(dict.values(self), dtype=np.intp, count=len(self))
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, dict):
+            return NotImplemented
+        return self.copy() == dict(other.items())
+
+    def __ne__(self, other: Any) -> bool:
+        equal = self.__eq__(other)
+        return equal if equal is NotImplemented else not equal
+
+    __hash__ = None
+
+    def __or__(self, other: Any) -> dict[AgentID, Any]:
+        if not isinstance(other, dict):
+            return NotImplemented
+        return {**self.copy(), **other}
+
+    def __ior__(self, other: Any) -> AgentArrayDict:
+        self.update(other)
+        return self
+
+    def __repr__(self) -> str:
+        return repr(self.copy())
+
+    def __reduce__(self):
+        return (
+            self.__class__,
+            (self.registry, self.array, list(dict.__iter__(self))),
+        )
+
+
+class AgentArrays(Generic[AgentID]):
+    """Array-backed rewards, cumulative rewards, terminations and truncations.
+
+    Element ``i`` of every array belongs to ``registry.name(i)``. Environments
+    write to the arrays directly and expose dict views of them
+    (see `AgentArrayDict`) as ``env.rewards``, ``env._cumulative_rewards``,
+    ``env.terminations`` and ``env.truncations``, so the string keyed API
+    keeps working while trainers can index the arrays by integer.
+
+    Example:
+        >>> arrays = AgentArrays(["piston_0", "piston_1"])
+        >>> rewards, cumulative_rewards, terminations, truncations = arrays.reset(
+        ...     ["piston_0", "piston_1"]
+        ... )
+        >>> arrays.rewards[:] = [1.0, 2.0]
+        >>> arrays.accumulate_rewards()
+        >>> cumulative_rewards["piston_1"]
+        2.0
+        >>> terminations["piston_0"]
+        False
+    """
+
+    def __init__(self, possible_agents: Iterable[AgentID]):
+        self.registry = AgentRegistry(possible_agents)
+        num_agents = len(self.registry)
+        self.rewards = np.zeros(num_agents, dtype=np.float64)
+        self.cumulative_rewards = np.zeros(num_agents, dtype=np.float64)
+        self.terminations = np.zeros(num_agents, dtype=bool)
+        self.truncations = np.zeros(num_agents, dtype=bool)
+
+    def reset(
+        self, agents: Iterable[AgentID]
+    ) -> tuple[AgentArrayDict, AgentArrayDict, AgentArrayDict, AgentArrayDict]:
+        """Zeroes the arrays and returns new dict views of rewards, cumulative rewards, terminations and truncations for ``agents``."""
+        agents = list(agents)
+        self.rewards[:] = 0
+        self.cumulative_rewards[:] = 0
+        self.terminations[:] = False
+        self.truncations[:] = False
+        return tuple(
+            AgentArrayDict(self.registry, array, agents)
+            for array in (
+                self.rewards,
+                self.cumulative_rewards,
+                self.terminations,
+                self.truncations,
+            )
+        )
+
+    def clear_rewards(self) -> None:
+        self.rewards[:] = 0
+
+    def accumulate_rewards(self) -> None:
+        """Adds the rewards to the cumulative rewards.
+
+        Removed agents are accumulated as well, their values are not visible
+        through the dict views and are overwritten when they are set again.
+        """
+        self.cumulative_rewards += self.rewards
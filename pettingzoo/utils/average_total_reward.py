@@ -1,12 +1,15 @@
 from __future__ import annotations
 
-import random
-
-import numpy as np
+import gymnasium.spaces
 
+from pettingzoo.utils.action_sampling import sample_action
 from pettingzoo.utils.env import AECEnv
 
 
+def _has_action_mask(space: gymnasium.spaces.Space) -> bool:
+    return isinstance(space, gymnasium.spaces.Dict) and "action_mask" in space.spaces
+
+
 def average_total_reward(
     env: AECEnv, max_episodes: int = 100, max_steps: int = 10000000000
 ) -> float:
@@ -28,13 +31,14 @@ def average_total_reward(
         env.reset()
         for agent in env.agent_iter():
             # Because we call env.last() this function only works with AEC envs
-            obs, reward, termination, truncation, _ = env.last(observe=False)
+            # the observation is only computed if it holds an action mask
+            obs, reward, termination, truncation, _ = env.last(lazy=True)
             total_reward += reward
             total_steps += 1
             if termination or truncation:
                 action = None
-            elif isinstance(obs, dict) and "action_mask" in obs:
-                action = random.choice(np.flatnonzero(obs["action_mask"]).tolist())
+            elif _has_action_mask(env.observation_space(agent)):
+                action = sample_action(env.action_space(agent), obs.get())
             else:
                 action = env.action_space(agent).sample()
             env.step(action)
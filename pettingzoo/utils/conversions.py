@@ -4,15 +4,31 @@ import warnings
 from collections import defaultdict
 from typing import Callable, Dict, Optional
 
+import numpy as np
+
 from pettingzoo.utils import AgentSelector
-from pettingzoo.utils.env import ActionType, AECEnv, AgentID, ObsType, ParallelEnv
+from pettingzoo.utils.env import (
+    ActionType,
+    AECEnv,
+    AgentID,
+    ObsType,
+    ParallelEnv,
+    _snapshot_attributes,
+)
 from pettingzoo.utils.wrappers import OrderEnforcingWrapper
 
 
-def parallel_wrapper_fn(env_fn: Callable) -> Callable:
+def parallel_wrapper_fn(env_fn: Callable, fast: bool = False) -> Callable:
+    """Converts an AEC environment factory into a Parallel environment factory.
+
+    Args:
+        env_fn: The AEC environment factory to be wrapped.
+        fast: Enables the fast path of `aec_to_parallel_wrapper` (see its documentation).
+    """
+
     def par_fn(**kwargs):
         env = env_fn(**kwargs)
-        env = aec_to_parallel_wrapper(env)
+        env = aec_to_parallel_wrapper(env, fast=fast)
         return env
 
     return par_fn
@@ -103,9 +119,18 @@ def from_parallel(
 
 
 class aec_to_parallel_wrapper(ParallelEnv[AgentID, ObsType, ActionType]):
-    """Converts an AEC environment into a Parallel environment."""
+    """Converts an AEC environment into a Parallel environment.
+
+    With ``fast=True`` the wrapper steps and observes the AEC environment through its
+    wrappers, but reads rewards, terminations, truncations and infos directly from the
+    unwrapped environment. It does not build the per-agent observations that `last()`
+    would throw away, accumulates the rewards of a cycle into a preallocated array and
+    observes every agent once per cycle. This is only valid when the wrappers around
+    the AEC environment do not change what it reports, as is the case for the
+    validation wrappers applied by the built-in environments.
+    """
 
-    def __init__(self, aec_env):
+    def __init__(self, aec_env, fast=False):
         assert aec_env.metadata.get("is_parallelizable", False), (
             "Converting from an AEC environment to a Parallel environment "
             "with the to_parallel wrapper is not generally safe "
@@ -116,6 +141,8 @@ class aec_to_parallel_wrapper(ParallelEnv[AgentID, ObsType, ActionType]):
         )
 
         self.aec_env = aec_env
+        self.fast = fast
+        self._reward_buffer = np.zeros(0)
 
         try:
             self.possible_agents = aec_env.possible_agents
@@ -188,6 +215,8 @@ class aec_to_parallel_wrapper(ParallelEnv[AgentID, ObsType, ActionType]):
         return observations, infos
 
     def step(self, actions):
+        if self.fast:
+            return self._fast_step(actions)
         rewards = defaultdict(int)
         terminations = {}
         truncations = {}
@@ -203,7 +232,6 @@ class aec_to_parallel_wrapper(ParallelEnv[AgentID, ObsType, ActionType]):
                     raise AssertionError(
                         f"expected agent {agent} got agent {self.aec_env.agent_selection}, Parallel environment wrapper expects agents to step in a cycle."
                     )
-            obs, rew, termination, truncation, info = self.aec_env.last()
             self.aec_env.step(actions[agent])
             for agent in self.aec_env.agents:
                 rewards[agent] += self.aec_env.rewards[agent]
@@ -223,12 +251,65 @@ class aec_to_parallel_wrapper(ParallelEnv[AgentID, ObsType, ActionType]):
         self.agents = self.aec_env.agents
         return observations, rewards, terminations, truncations, infos
 
+    def _fast_step(self, actions):
+        raw_env = self.aec_env.unwrapped
+        agents = raw_env.agents[:]
+        num_agents = len(agents)
+        if len(self._reward_buffer) < num_agents:
+            self._reward_buffer = np.zeros(num_agents)
+        rewards = self._reward_buffer[:num_agents]
+        rewards.fill(0)
+
+        for agent in agents:
+            if agent != raw_env.agent_selection:
+                # agents which were removed during the cycle died as well
+                if raw_env.terminations.get(agent, True) or raw_env.truncations.get(
+                    agent, True
+                ):
+                    raise AssertionError(
+                        f"expected agent {agent} got termination or truncation agent {raw_env.agent_selection}. Parallel environment wrapper expects all agent death (setting an agent's self.terminations or self.truncations entry to True) to happen only at the end of a cycle."
+                    )
+                else:
+                    raise AssertionError(
+                        f"expected agent {agent} got agent {raw_env.agent_selection}, Parallel environment wrapper expects agents to step in a cycle."
+                    )
+            self.aec_env.step(actions[agent])
+            try:
+                rewards += np.fromiter(
+                    map(raw_env.rewards.__getitem__, agents), float, num_agents
+                )
+            except KeyError as e:
+                raise AssertionError(
+                    f"agent {e.args[0]} was removed after agent {agent} stepped. Parallel environment wrapper expects all agent death (setting an agent's self.terminations or self.truncations entry to True) to happen only at the end of a cycle."
+                ) from None
+
+        rewards = dict(zip(agents, rewards.tolist()))
+        terminations = dict(raw_env.terminations)
+        truncations = dict(raw_env.truncations)
+        infos = dict(raw_env.infos)
+        observations = {agent: self.aec_env.observe(agent) for agent in raw_env.agents}
+        while raw_env.agents and (
+            raw_env.terminations[raw_env.agent_selection]
+            or raw_env.truncations[raw_env.agent_selection]
+        ):
+            self.aec_env.step(None)
+
+        self.agents = raw_env.agents
+        return observations, rewards, terminations, truncations, infos
+
     def render(self):
         return self.aec_env.render()
 
     def state(self):
         return self.aec_env.state()
 
+    def snapshot(self):
+        return self.aec_env.snapshot()
+
+    def restore(self, snapshot):
+        self.aec_env.restore(snapshot)
+        self.agents = self.aec_env.agents
+
     def close(self):
         return self.aec_env.close()
 
@@ -337,6 +418,17 @@ class parallel_to_aec_wrapper(AECEnv[AgentID, ObsType, Optional[ActionType]]):
     def state(self):
         return self.env.state()
 
+    def snapshot(self):
+        return (
+            self.env.snapshot(),
+            _snapshot_attributes(self, self._snapshot_exclude | {"env"}),
+        )
+
+    def restore(self, snapshot):
+        env_snapshot, attributes = snapshot
+        self.env.restore(env_snapshot)
+        self.__dict__.update(copy.deepcopy(attributes))
+
     def add_new_agent(self, new_agent):
         self._agent_selector._current_agent = len(self._agent_selector.agent_order)
         self._agent_selector.agent_order.append(new_agent)
@@ -387,17 +479,6 @@ class parallel_to_aec_wrapper(AECEnv[AgentID, ObsType, Optional[ActionType]]):
 
             self.agent_selection = self._agent_selector.next()
 
-    def last(self, observe=True):
-        agent = self.agent_selection
-        observation = self.observe(agent) if observe else None
-        return (
-            observation,
-            self._cumulative_rewards[agent],
-            self.terminations[agent],
-            self.truncations[agent],
-            self.infos[agent],
-        )
-
     def render(self):
         return self.env.render()
 
@@ -519,5 +600,12 @@ class turn_based_aec_to_parallel_wrapper(
     def state(self):
         return self.aec_env.state()
 
+    def snapshot(self):
+        return self.aec_env.snapshot()
+
+    def restore(self, snapshot):
+        self.aec_env.restore(snapshot)
+        self.agents = self.aec_env.agents
+
     def close(self):
         return self.aec_env.close()
@@ -1,11 +1,16 @@
 from __future__ import annotations
 
+import copy
+import functools
+import inspect
 import warnings
-from typing import Any, Dict, Generic, Iterable, Iterator, TypeVar
+from typing import Any, Callable, Dict, Generic, Iterable, Iterator, TypeVar
 
 import gymnasium.spaces
 import numpy as np
 
+from pettingzoo.utils.profiler import NULL_SECTION, Profiler
+
 ObsType = TypeVar("ObsType")
 ActionType = TypeVar("ActionType")
 AgentID = TypeVar("AgentID")
@@ -16,6 +21,7 @@ ObsDict = Dict[AgentID, ObsType]
 # deprecated
 ActionDict = Dict[AgentID, ActionType]
 
+
 """
 Base environment definitions
 
@@ -24,6 +30,65 @@ See docs/dev_docs.md for additional documentation and an example environment.
 """
 
 
+@functools.lru_cache(maxsize=None)
+def _accepts_out(observe: Callable) -> bool:
+    return "out" in inspect.signature(observe).parameters
+
+
+# attributes which the default snapshot() leaves out: rendering resources,
+# which usually cannot be copied, and attributes which never change
+_SNAPSHOT_EXCLUDE = frozenset(
+    {
+        "screen",
+        "clock",
+        "window",
+        "viewer",
+        "renderer",
+        "render_mode",
+        "metadata",
+        "possible_agents",
+        "observation_spaces",
+        "action_spaces",
+        "state_space",
+        "_profiler",
+        "_state_version",
+    }
+)
+
+
+def _counts_state_changes(method: Callable) -> Callable:
+    """Wraps ``step``, ``reset`` or ``restore`` to count the calls in ``_state_version``."""
+
+    @functools.wraps(method)
+    def counted(self, *args, **kwargs):
+        self._state_version += 1
+        return method(self, *args, **kwargs)
+
+    return counted
+
+
+def _snapshot_attributes(env: Any, exclude: frozenset[str]) -> dict[str, Any]:
+    """Deep copies the attributes of ``env`` which are not in ``exclude``."""
+    attributes = {
+        name: value for name, value in vars(env).items() if name not in exclude
+    }
+    try:
+        return copy.deepcopy(attributes)
+    except TypeError as e:
+        raise NotImplementedError(
+            f"{env} does not implement snapshot() and its state cannot be copied: {e}"
+        ) from e
+
+
+def _rng_state(rng: np.random.Generator | None) -> dict[str, Any] | None:
+    return None if rng is None else rng.bit_generator.state
+
+
+def _set_rng_state(rng: np.random.Generator | None, state: dict | None) -> None:
+    if rng is not None and state is not None:
+        rng.bit_generator.state = state
+
+
 class AECEnv(Generic[AgentID, ObsType, ActionType]):
     """The AECEnv steps agents one at a time.
 
@@ -55,6 +120,22 @@ class AECEnv(Generic[AgentID, ObsType, ActionType]):
 
     agent_selection: AgentID  # The agent currently being stepped
 
+    # Attached by the ProfilingWrapper, None when profiling is disabled
+    _profiler: Profiler | None = None
+
+    # Attributes which the default `snapshot` does not copy
+    _snapshot_exclude: frozenset[str] = _SNAPSHOT_EXCLUDE
+
+    # Number of calls to step(), reset() and restore(), a LazyObservation is only
+    # valid while it does not change
+    _state_version: int = 0
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        for name in ("step", "reset", "restore"):
+            if inspect.isfunction(cls.__dict__.get(name)):
+                setattr(cls, name, _counts_state_changes(cls.__dict__[name]))
+
     def __init__(self):
         pass
 
@@ -77,10 +158,24 @@ class AECEnv(Generic[AgentID, ObsType, ActionType]):
     def observe(self, agent: AgentID) -> ObsType | None:
         """Returns the observation an agent currently can make.
 
-        `last()` calls this function.
+        `last()` calls this function. Environments may accept an ``out`` array
+        keyword argument, to write the observation into it instead of allocating
+        a new array (see `observe_into`).
         """
         raise NotImplementedError
 
+    def observe_into(self, agent: AgentID, out: np.ndarray) -> np.ndarray:
+        """Writes the observation of ``agent`` into the preallocated array ``out`` and returns it.
+
+        ``out`` must have the shape and dtype of the observation space. If the
+        environment's ``observe`` accepts an ``out`` argument, it writes the
+        observation directly, otherwise the observation is copied into ``out``.
+        """
+        if _accepts_out(type(self).observe):
+            return self.observe(agent, out=out)
+        np.copyto(out, self.observe(agent))
+        return out
+
     def render(self) -> None | np.ndarray | str | list:
         """Renders the environment as specified by self.render_mode.
 
@@ -142,6 +237,106 @@ class AECEnv(Generic[AgentID, ObsType, ActionType]):
     def max_num_agents(self) -> int:
         return len(self.possible_agents)
 
+    def profile_section(self, name: str):
+        """Returns a context manager which times an internal section of the environment, e.g. ``space.step``.
+
+        Does nothing unless a `Profiler` is attached by a profiling wrapper.
+        """
+        if self._profiler is None:
+            return NULL_SECTION
+        return self._profiler.section(name)
+
+    def snapshot(self) -> Any:
+        """Returns a snapshot of the state of the environment, including its random number generator.
+
+        `restore` returns the environment to the state of the snapshot, after
+        which the same actions give the same observations, rewards and
+        terminations. Search based agents (e.g. MCTS) use it to explore from a
+        state without copying the whole environment. Snapshots are picklable,
+        do not share mutable data with the environment and can be restored any
+        number of times, but only into the environment they were taken from or
+        one created with the same arguments.
+
+        By default, every attribute except rendering resources and spaces is
+        deep copied. Environments override this with a compact representation
+        of their state, e.g. the board of board games. Environments whose state
+        cannot be copied raise NotImplementedError, currently multiwalker, whose
+        Box2D world cannot be copied. In waterworld, restores of a snapshot replay
+        the same trajectory as each other, but not necessarily the one which
+        followed the snapshot (see its `restore`).
+
+        Example:
+            >>> from pettingzoo.classic import tictactoe_v3
+            >>> env = tictactoe_v3.env()
+            >>> env.reset(seed=42)
+            >>> snapshot = env.snapshot()
+            >>> env.step(4)
+            >>> env.agent_selection
+            'player_2'
+            >>> env.restore(snapshot)
+            >>> env.agent_selection
+            'player_1'
+        """
+        return _snapshot_attributes(self, self._snapshot_exclude)
+
+    def restore(self, snapshot: Any) -> None:
+        """Returns the environment to the state of a `snapshot`."""
+        self.__dict__.update(copy.deepcopy(snapshot))
+
+    def _snapshot_agents(self) -> tuple:
+        """Copies the agent bookkeeping of the AEC API, the agent selector and ``np_random``.
+
+        Compact `snapshot` implementations store it next to their game state and
+        pass it to `_restore_agents`.
+        """
+        selector = getattr(self, "_agent_selector", None)
+        return (
+            list(self.agents),
+            self.agent_selection,
+            getattr(self, "_skip_agent_selection", None),
+            dict(self.rewards),
+            dict(self._cumulative_rewards),
+            dict(self.terminations),
+            dict(self.truncations),
+            copy.deepcopy(self.infos),
+            None
+            if selector is None
+            else (
+                list(selector.agent_order),
+                selector._current_agent,
+                selector.selected_agent,
+            ),
+            _rng_state(getattr(self, "np_random", None)),
+        )
+
+    def _restore_agents(self, state: tuple) -> None:
+        (
+            agents,
+            self.agent_selection,
+            skip_agent_selection,
+            rewards,
+            cumulative_rewards,
+            terminations,
+            truncations,
+            infos,
+            selector,
+            rng_state,
+        ) = state
+        self.agents = list(agents)
+        if skip_agent_selection is not None:
+            self._skip_agent_selection = skip_agent_selection
+        self.rewards = dict(rewards)
+        self._cumulative_rewards = dict(cumulative_rewards)
+        self.terminations = dict(terminations)
+        self.truncations = dict(truncations)
+        self.infos = copy.deepcopy(infos)
+        if selector is not None:
+            agent_order, current_agent, selected_agent = selector
+            self._agent_selector.agent_order = list(agent_order)
+            self._agent_selector._current_agent = current_agent
+            self._agent_selector.selected_agent = selected_agent
+        _set_rng_state(getattr(self, "np_random", None), rng_state)
+
     def _deads_step_first(self) -> AgentID:
         """Makes .agent_selection point to first terminated agent.
 
@@ -178,12 +373,24 @@ class AECEnv(Generic[AgentID, ObsType, ActionType]):
         return AECIterable(self, max_iter)
 
     def last(
-        self, observe: bool = True
-    ) -> tuple[ObsType | None, float, bool, bool, dict[str, Any]]:
-        """Returns observation, cumulative reward, terminated, truncated, info for the current agent (specified by self.agent_selection)."""
+        self, observe: bool = True, lazy: bool = False
+    ) -> tuple[
+        ObsType | LazyObservation[ObsType] | None, float, bool, bool, dict[str, Any]
+    ]:
+        """Returns observation, cumulative reward, terminated, truncated, info for the current agent (specified by self.agent_selection).
+
+        With ``lazy=True`` the observation is a `LazyObservation`, which only calls
+        ``observe()`` when it is used. Using it after the next ``step()``, ``reset()``
+        or ``restore()`` raises a RuntimeError.
+        """
         agent = self.agent_selection
         assert agent is not None
-        observation = self.observe(agent) if observe else None
+        if not observe:
+            observation = None
+        elif lazy:
+            observation = LazyObservation(self.observe, agent, self)
+        else:
+            observation = self.observe(agent)
         return (
             observation,
             self._cumulative_rewards[agent],
@@ -254,6 +461,79 @@ class AECEnv(Generic[AgentID, ObsType, ActionType]):
         return self
 
 
+class LazyObservation(Generic[ObsType]):
+    """An observation which is computed by ``observe(agent)`` the first time it is used.
+
+    It is returned by `AECEnv.last` with ``lazy=True``. ``get()`` returns the
+    observation, which is also computed when the proxy is indexed, converted
+    with ``np.asarray`` or when one of its attributes is read. It observes the
+    current state, so computing it after the environment is stepped, reset or
+    restored raises a RuntimeError.
+
+    Example:
+        >>> from pettingzoo.butterfly import pistonball_v6
+        >>> env = pistonball_v6.env()
+        >>> env.reset(seed=42)
+        >>> observation, *_ = env.last(lazy=True)
+        >>> observation.shape
+        (457, 120, 3)
+    """
+
+    __slots__ = ("_observe", "_agent", "_observation", "_observed", "_env", "_version")
+
+    def __init__(
+        self, observe: Callable[[Any], ObsType], agent: Any, env: AECEnv | None = None
+    ):
+        self._observe = observe
+        self._agent = agent
+        self._observation = None
+        self._observed = False
+        # the environment whose state is observed, and its state when last() was called
+        self._env = env
+        self._version = None if env is None else env._state_version
+
+    @property
+    def observed(self) -> bool:
+        """Whether the observation has been computed."""
+        return self._observed
+
+    def get(self) -> ObsType:
+        if not self._observed:
+            if self._env is not None and self._env._state_version != self._version:
+                raise RuntimeError(
+                    f"The observation of {self._agent} from last(lazy=True) was used "
+                    "after the environment was stepped, reset or restored"
+                )
+            self._observation = self._observe(self._agent)
+            self._observed = True
+        return self._observation
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return getattr(self.get(), name)
+
+    def __getitem__(self, key: Any) -> Any:
+        return self.get()[key]
+
+    def __contains__(self, key: Any) -> bool:
+        return key in self.get()
+
+    def __len__(self) -> int:
+        return len(self.get())
+
+    def __iter__(self) -> Iterator:
+        return iter(self.get())
+
+    def __array__(self, dtype=None, copy=None) -> np.ndarray:
+        return np.array(self.get(), dtype=dtype, copy=copy)
+
+    def __repr__(self) -> str:
+        if not self._observed:
+            return f"LazyObservation(agent={self._agent!r})"
+        return f"LazyObservation({self._observation!r})"
+
+
 class AECIterable(Iterable[AgentID], Generic[AgentID, ObsType, ActionType]):
     def __init__(self, env, max_iter):
         self.env = env
@@ -295,6 +575,12 @@ class ParallelEnv(Generic[AgentID, ObsType, ActionType]):
     ]  # Observation space for each agent
     action_spaces: dict[AgentID, gymnasium.spaces.Space]
 
+    # Attached by the ProfilingParallelWrapper, None when profiling is disabled
+    _profiler: Profiler | None = None
+
+    # Attributes which the default `snapshot` does not copy
+    _snapshot_exclude: frozenset[str] = _SNAPSHOT_EXCLUDE
+
     def reset(
         self,
         seed: int | None = None,
@@ -380,6 +666,26 @@ class ParallelEnv(Generic[AgentID, ObsType, ActionType]):
     def max_num_agents(self) -> int:
         return len(self.possible_agents)
 
+    def profile_section(self, name: str):
+        """Returns a context manager which times an internal section of the environment, e.g. ``space.step``.
+
+        Does nothing unless a `Profiler` is attached by a profiling wrapper.
+        """
+        if self._profiler is None:
+            return NULL_SECTION
+        return self._profiler.section(name)
+
+    def snapshot(self) -> Any:
+        """Returns a snapshot of the state of the environment, including its random number generator.
+
+        See `AECEnv.snapshot`, `restore` returns the environment to this state.
+        """
+        return _snapshot_attributes(self, self._snapshot_exclude)
+
+    def restore(self, snapshot: Any) -> None:
+        """Returns the environment to the state of a `snapshot`."""
+        self.__dict__.update(copy.deepcopy(snapshot))
+
     def __str__(self) -> str:
         """Returns the name.
 
@@ -105,6 +105,11 @@ class EnvLogger:
         """Error: ``reset() needs to be called before state.``."""
         assert False, "reset() needs to be called before state."
 
+    @staticmethod
+    def error_snapshot_before_reset() -> None:
+        """Error: ``reset() needs to be called before snapshot() or restore().``."""
+        assert False, "reset() needs to be called before snapshot() or restore()."
+
 
 class EnvWarningHandler(logging.Handler):
     def __init__(self, *args, mqueue, **kwargs):
@@ -0,0 +1,299 @@
+"""Chunked, memory-mapped storage of recorded episodes.
+
+A dataset is a directory holding:
+
+* ``metadata.json``: the chunk size and, for every agent, its directory and
+  the name, shape and dtype of each column,
+* ``episodes.jsonl``: one line per finished episode, with the range of rows
+  of every agent which belong to it,
+* ``<agent dir>/<column>/<chunk>.npy``: ``chunk_size`` rows of one column.
+
+Every row is one transition of one agent: the observation the agent acted on,
+its action and the reward, termination and truncation that followed. Dict
+observation and action spaces are stored as one column per key, e.g.
+``observation.action_mask``.
+"""
+from __future__ import annotations
+
+import json
+import os
+import queue
+import threading
+from typing import Any, Hashable, Iterator
+
+import gymnasium.spaces
+import numpy as np
+
+
+def _space_columns(space: gymnasium.spaces.Space, name: str) -> list[dict[str, Any]]:
+    if isinstance(space, gymnasium.spaces.Dict):
+        columns = []
+        for key, subspace in space.spaces.items():
+            columns.extend(_space_columns(subspace, f"{name}.{key}"))
+        return columns
+    if space.shape is None or space.dtype is None:
+        raise NotImplementedError(
+            f"{type(space).__name__} spaces cannot be recorded, only spaces with a fixed shape and dtype and Dicts of them"
+        )
+    return [{"name": name, "shape": list(space.shape), "dtype": space.dtype.str}]
+
+
+def _leaves(value: Any, name: str) -> Iterator[tuple[str, Any]]:
+    """Yields the column name and value of every leaf of a (nested dict) observation or action."""
+    if isinstance(value, dict):
+        for key, item in value.items():
+            yield from _leaves(item, f"{name}.{key}")
+    else:
+        yield name, value
+
+
+def _nest(columns: dict[str, np.ndarray]) -> dict[str, Any]:
+    """Turns ``observation.action_mask`` style column names back into nested dicts."""
+    nested: dict[str, Any] = {}
+    for name, array in columns.items():
+        *parents, key = name.split(".")
+        target = nested
+        for parent in parents:
+            target = target.setdefault(parent, {})
+        target[key] = array
+    return nested
+
+
+class _Flusher(threading.Thread):
+    """Flushes full chunks to disk in the background, so appending never waits for IO."""
+
+    def __init__(self):
+        super().__init__(name="pettingzoo-episode-flusher", daemon=True)
+        self.chunks: queue.Queue = queue.Queue()
+
+    def run(self):
+        while True:
+            chunk = self.chunks.get()
+            if chunk is None:
+                return
+            for array in chunk.values():
+                array.flush()
+
+
+class _AgentColumns:
+    """The open chunk of every column of one agent."""
+
+    def __init__(self, root: str, columns: list[dict[str, Any]], chunk_size: int):
+        self.root = root
+        self.columns = columns
+        self.chunk_size = chunk_size
+        self.num_rows = 0
+        self.chunk: dict[str, np.ndarray] = {}
+
+    def _open_chunk(self) -> None:
+        index = self.num_rows // self.chunk_size
+        self.chunk = {}
+        for column in self.columns:
+            directory = os.path.join(self.root, column["name"])
+            os.makedirs(directory, exist_ok=True)
+            self.chunk[column["name"]] = np.lib.format.open_memmap(
+                os.path.join(directory, f"{index:06d}.npy"),
+                mode="w+",
+                dtype=np.dtype(column["dtype"]),
+                shape=(self.chunk_size, *column["shape"]),
+            )
+
+    def append(self, values: Iterator[tuple[str, Any]]) -> dict[str, np.ndarray] | None:
+        """Writes one row, returns the previous chunk when the row starts a new one."""
+        full = None
+        offset = self.num_rows % self.chunk_size
+        if offset == 0:
+            full = self.chunk or None
+            self._open_chunk()
+        chunk = self.chunk
+        for name, value in values:
+            chunk[name][offset] = value
+        self.num_rows += 1
+        return full
+
+
+class EpisodeWriter:
+    """Appends transitions of any number of agents to a chunked, memory-mapped dataset in ``path``.
+
+    Columns are preallocated from the observation and action space of each
+    agent, in chunks of ``chunk_size`` rows. Full chunks are flushed to disk on
+    a background thread. Read the dataset with `EpisodeReader`.
+
+    Example:
+        >>> from gymnasium.spaces import Box, Discrete
+        >>> writer = EpisodeWriter("dataset")
+        >>> writer.add_agent("player_0", Box(0, 1, (2,)), Discrete(3))
+        >>> writer.append("player_0", np.zeros(2), 1, 1.0, True, False)
+        >>> writer.end_episode()
+        >>> writer.close()
+    """
+
+    def __init__(self, path: str | os.PathLike, chunk_size: int = 1024):
+        assert chunk_size > 0, "chunk_size must be positive"
+        self.path = os.fspath(path)
+        if os.path.exists(os.path.join(self.path, "metadata.json")):
+            raise FileExistsError(f"{self.path} already contains a recorded dataset")
+        os.makedirs(self.path, exist_ok=True)
+        self.chunk_size = chunk_size
+        self.agents: dict[Hashable, _AgentColumns] = {}
+        self._metadata: dict[str, Any] = {"chunk_size": chunk_size, "agents": []}
+        self._episode_start: dict[Hashable, int] = {}
+        self.num_episodes = 0
+        self._episodes_file = open(os.path.join(self.path, "episodes.jsonl"), "a")
+        self._flusher = _Flusher()
+        self._flusher.start()
+        self._write_metadata()
+
+    def _write_metadata(self) -> None:
+        path = os.path.join(self.path, "metadata.json")
+        with open(path + ".tmp", "w") as f:
+            json.dump(self._metadata, f, indent=2)
+        os.replace(path + ".tmp", path)
+
+    def add_agent(
+        self,
+        agent: Hashable,
+        observation_space: gymnasium.spaces.Space,
+        action_space: gymnasium.spaces.Space,
+    ) -> None:
+        """Creates the columns of ``agent``, it has to be called before its first `append`."""
+        assert agent not in self.agents, f"agent {agent} was already added"
+        columns = _space_columns(observation_space, "observation")
+        columns += _space_columns(action_space, "action")
+        columns += [
+            {"name": "reward", "shape": [], "dtype": np.dtype(np.float64).str},
+            {"name": "terminated", "shape": [], "dtype": np.dtype(bool).str},
+            {"name": "truncated", "shape": [], "dtype": np.dtype(bool).str},
+        ]
+        directory = str(len(self.agents))
+        self.agents[agent] = _AgentColumns(
+            os.path.join(self.path, directory), columns, self.chunk_size
+        )
+        self._episode_start[agent] = 0
+        self._metadata["agents"].append(
+            {"name": str(agent), "directory": directory, "columns": columns}
+        )
+        self._write_metadata()
+
+    def append(
+        self,
+        agent: Hashable,
+        observation: Any,
+        action: Any,
+        reward: float,
+        terminated: bool,
+        truncated: bool,
+    ) -> None:
+        """Appends one transition of ``agent`` to the current episode."""
+        values = (
+            *_leaves(observation, "observation"),
+            *_leaves(0 if action is None else action, "action"),
+            ("reward", reward),
+            ("terminated", terminated),
+            ("truncated", truncated),
+        )
+        full = self.agents[agent].append(values)
+        if full is not None:
+            self._flusher.chunks.put(full)
+
+    def end_episode(self) -> None:
+        """Closes the current episode, unless no transitions were appended to it."""
+        ranges = {}
+        for agent, columns in self.agents.items():
+            if columns.num_rows > self._episode_start[agent]:
+                ranges[str(agent)] = [self._episode_start[agent], columns.num_rows]
+                self._episode_start[agent] = columns.num_rows
+        if not ranges:
+            return
+        self._episodes_file.write(
+            json.dumps({"episode": self.num_episodes, "agents": ranges}) + "\n"
+        )
+        self._episodes_file.flush()
+        self.num_episodes += 1
+
+    def close(self) -> None:
+        """Ends the current episode and writes everything to disk."""
+        if self._episodes_file.closed:
+            return
+        self.end_episode()
+        self._episodes_file.close()
+        self._flusher.chunks.put(None)
+        self._flusher.join()
+        for columns in self.agents.values():
+            for array in columns.chunk.values():
+                array.flush()
+
+
+class EpisodeReader:
+    """Iterates over the episodes of a dataset written by `EpisodeWriter`, without loading the whole dataset.
+
+    An episode is a dict which maps every agent to its columns: ``observation``,
+    ``action``, ``reward``, ``terminated`` and ``truncated``. Dict spaces become
+    nested dicts of columns. Columns are read-only memory maps unless an episode
+    spans several chunks.
+
+    Example:
+        >>> reader = EpisodeReader("dataset")
+        >>> for episode in reader:
+        ...     rewards = episode["player_0"]["reward"]
+    """
+
+    def __init__(self, path: str | os.PathLike):
+        self.path = os.fspath(path)
+        with open(os.path.join(self.path, "metadata.json")) as f:
+            metadata = json.load(f)
+        self.chunk_size: int = metadata["chunk_size"]
+        self._agents = {agent["name"]: agent for agent in metadata["agents"]}
+        self.episodes: list[dict[str, list[int]]] = []
+        with open(os.path.join(self.path, "episodes.jsonl")) as f:
+            for line in f:
+                if line.strip():
+                    self.episodes.append(json.loads(line)["agents"])
+        self._chunks: dict[str, np.ndarray] = {}
+
+    @property
+    def agents(self) -> list[str]:
+        return list(self._agents)
+
+    def __len__(self) -> int:
+        return len(self.episodes)
+
+    def __getitem__(self, index: int) -> dict[str, dict[str, Any]]:
+        return {
+            agent: self._read(agent, start, stop)
+            for agent, (start, stop) in self.episodes[index].items()
+        }
+
+    def __iter__(self) -> Iterator[dict[str, dict[str, Any]]]:
+        for index in range(len(self)):
+            yield self[index]
+
+    def _chunk(self, agent: str, column: str, index: int) -> np.ndarray:
+        path = os.path.join(
+            self.path, self._agents[agent]["directory"], column, f"{index:06d}.npy"
+        )
+        chunk = self._chunks.get(path)
+        if chunk is None:
+            chunk = self._chunks[path] = np.load(path, mmap_mode="r")
+        return chunk
+
+    def _read(self, agent: str, start: int, stop: int) -> dict[str, Any]:
+        columns = {}
+        for column in self._agents[agent]["columns"]:
+            name = column["name"]
+            parts = []
+            row = start
+            while row < stop:
+                index, offset = divmod(row, self.chunk_size)
+                length = min(stop - row, self.chunk_size - offset)
+                parts.append(self._chunk(agent, name, index)[offset : offset + length])
+                row += length
+            if len(parts) == 1:
+                columns[name] = parts[0]
+            elif parts:
+                columns[name] = np.concatenate(parts)
+            else:
+                columns[name] = np.empty(
+                    (0, *column["shape"]), dtype=np.dtype(column["dtype"])
+                )
+        return _nest(columns)
@@ -0,0 +1,306 @@
+from __future__ import annotations
+
+import concurrent.futures
+import math
+import multiprocessing
+import os
+import random
+import statistics
+from typing import Any, Callable, Dict, Union
+
+import numpy as np
+
+from pettingzoo.utils.action_sampling import sample_action
+from pettingzoo.utils.env import AECEnv, AgentID, ParallelEnv
+
+# maps the observation of an agent (and the agent) to its action
+Policy = Callable[[Any, Any], Any]
+Policies = Union[Policy, Dict[Any, Policy], None]
+
+
+def _act(
+    env: AECEnv | ParallelEnv,
+    policies: Policies,
+    agent: Any,
+    observation: Any,
+    info: dict[str, Any],
+) -> Any:
+    policy = policies.get(agent) if isinstance(policies, dict) else policies
+    if policy is None:
+        return sample_action(env.action_space(agent), observation, info)
+    return policy(observation, agent)
+
+
+def _seed_episode(env: AECEnv | ParallelEnv, seed: int) -> None:
+    # policies which draw from the global generators are reproducible as well
+    random.seed(seed)
+    np.random.seed(seed % 2**32)
+    for i, agent in enumerate(env.possible_agents):
+        env.action_space(agent).seed(seed + i)
+
+
+def run_episode(
+    env: AECEnv | ParallelEnv,
+    policies: Policies = None,
+    seed: int | None = None,
+    max_cycles: int | None = None,
+) -> tuple[dict[AgentID, float], int]:
+    """Plays one episode of ``env`` and returns the total reward of every agent and the number of actions taken.
+
+    ``policies`` is a policy, which plays every agent, or a dict with one policy
+    per agent. A policy maps ``(observation, agent)`` to an action, agents
+    without a policy take random legal actions. With a ``seed``, the
+    environment, the action spaces and the global ``random`` and
+    ``np.random`` generators are seeded, so the episode is reproducible. At most
+    ``max_cycles`` actions are taken per agent.
+    """
+    if seed is not None:
+        _seed_episode(env, seed)
+    returns: dict[AgentID, float] = {}
+    actions: dict[AgentID, int] = {}
+    if isinstance(env, ParallelEnv):
+        observations, infos = env.reset(seed=seed)
+        for agent in env.agents:
+            returns[agent] = 0.0
+        cycles = 0
+        while env.agents and (max_cycles is None or cycles < max_cycles):
+            step_actions = {
+                agent: _act(env, policies, agent, observations[agent], infos[agent])
+                for agent in env.agents
+            }
+            observations, rewards, _, _, infos = env.step(step_actions)
+            for agent, reward in rewards.items():
+                returns[agent] = returns.get(agent, 0.0) + float(reward)
+            for agent in step_actions:
+                actions[agent] = actions.get(agent, 0) + 1
+            cycles += 1
+        return returns, sum(actions.values())
+
+    env.reset(seed=seed)
+    for agent in env.agent_iter():
+        observation, reward, termination, truncation, info = env.last()
+        returns[agent] = returns.get(agent, 0.0) + float(reward)
+        if termination or truncation:
+            action = None
+        elif max_cycles is not None and actions.get(agent, 0) >= max_cycles:
+            break
+        else:
+            action = _act(env, policies, agent, observation, info)
+            actions[agent] = actions.get(agent, 0) + 1
+        env.step(action)
+    return returns, sum(actions.values())
+
+
+# the environment and policies of a worker process, created once by _init_worker
+_worker: dict[str, Any] = {}
+
+
+def _init_worker(
+    env_fn: Callable[[], AECEnv | ParallelEnv],
+    policies: Policies,
+    max_cycles: int | None,
+) -> None:
+    _worker["env"] = env_fn()
+    _worker["policies"] = policies
+    _worker["max_cycles"] = max_cycles
+
+
+def _run_worker_episode(seed: int) -> tuple[dict[AgentID, float], int]:
+    return run_episode(_worker["env"], _worker["policies"], seed, _worker["max_cycles"])
+
+
+def _normal_quantile(confidence: float) -> float:
+    return statistics.NormalDist().inv_cdf(0.5 + confidence / 2)
+
+
+def _mean_interval(values: np.ndarray, confidence: float) -> tuple[float, float, float]:
+    """The mean of ``values`` with a normal approximation confidence interval, NaNs are left out."""
+    values = values[~np.isnan(values)]
+    if len(values) == 0:
+        return math.nan, math.nan, math.nan
+    mean = float(np.mean(values))
+    if len(values) == 1:
+        return mean, mean, mean
+    standard_error = float(np.std(values, ddof=1)) / math.sqrt(len(values))
+    half_width = _normal_quantile(confidence) * standard_error
+    return mean, mean - half_width, mean + half_width
+
+
+def _wilson_interval(
+    successes: int, trials: int, confidence: float
+) -> tuple[float, float, float]:
+    """The rate of ``successes`` with a Wilson score confidence interval, which stays within [0, 1]."""
+    if trials == 0:
+        return math.nan, math.nan, math.nan
+    z = _normal_quantile(confidence)
+    rate = successes / trials
+    denominator = 1 + z**2 / trials
+    center = (rate + z**2 / (2 * trials)) / denominator
+    half_width = (
+        z
+        * math.sqrt(rate * (1 - rate) / trials + z**2 / (4 * trials**2))
+        / denominator
+    )
+    # rounding can move a bound past the rate when it is 0 or 1
+    low = min(max(0.0, center - half_width), rate)
+    high = max(min(1.0, center + half_width), rate)
+    return rate, low, high
+
+
+class EvaluationResult:
+    """The returns and lengths of the episodes played by `evaluate`, with summary statistics.
+
+    ``returns[agent][i]`` is the total reward of ``agent`` in episode ``i``,
+    NaN if the agent did not take part in it. An agent wins an episode if its
+    return is strictly higher than the return of every other agent, episodes
+    without a single best agent are draws. Statistics are returned as
+    ``(estimate, low, high)`` with a ``confidence`` interval.
+    """
+
+    def __init__(
+        self,
+        seeds: list[int],
+        returns: dict[AgentID, np.ndarray],
+        lengths: np.ndarray,
+        confidence: float = 0.95,
+    ):
+        self.seeds = seeds
+        self.returns = returns
+        self.lengths = lengths
+        self.confidence = confidence
+
+    @property
+    def num_episodes(self) -> int:
+        return len(self.seeds)
+
+    @property
+    def winners(self) -> list[AgentID | None]:
+        """The winner of every episode, None for draws."""
+        agents = list(self.returns)
+        winners = []
+        for i in range(self.num_episodes):
+            episode_returns = [self.returns[agent][i] for agent in agents]
+            best = np.nanmax(episode_returns)
+            best_agents = [
+                agent for agent, value in zip(agents, episode_returns) if value == best
+            ]
+            winners.append(best_agents[0] if len(best_agents) == 1 else None)
+        return winners
+
+    def mean_returns(self) -> dict[AgentID, tuple[float, float, float]]:
+        return {
+            agent: _mean_interval(returns, self.confidence)
+            for agent, returns in self.returns.items()
+        }
+
+    def mean_length(self) -> tuple[float, float, float]:
+        return _mean_interval(self.lengths.astype(float), self.confidence)
+
+    def win_rates(self) -> dict[AgentID, tuple[float, float, float]]:
+        winners = self.winners
+        return {
+            agent: _wilson_interval(
+                winners.count(agent),
+                int(np.count_nonzero(~np.isnan(self.returns[agent]))),
+                self.confidence,
+            )
+            for agent in self.returns
+        }
+
+    def draw_rate(self) -> tuple[float, float, float]:
+        return _wilson_interval(
+            self.winners.count(None), self.num_episodes, self.confidence
+        )
+
+    def summary(self) -> dict[str, Any]:
+        """Returns the statistics as a JSON serializable dict."""
+        return {
+            "num_episodes": self.num_episodes,
+            "confidence": self.confidence,
+            "mean_returns": {
+                str(agent): list(interval)
+                for agent, interval in self.mean_returns().items()
+            },
+            "win_rates": {
+                str(agent): list(interval)
+                for agent, interval in self.win_rates().items()
+            },
+            "draw_rate": list(self.draw_rate()),
+            "mean_length": list(self.mean_length()),
+        }
+
+
+def evaluate(
+    env_fn: Callable[[], AECEnv | ParallelEnv],
+    policies: Policies = None,
+    num_episodes: int = 100,
+    seed: int = 0,
+    num_workers: int | None = None,
+    max_cycles: int | None = None,
+    confidence: float = 0.95,
+    context: str | None = None,
+) -> EvaluationResult:
+    """Plays ``num_episodes`` episodes of the environments created by ``env_fn`` on a pool of worker processes.
+
+    Episode ``i`` is played by `run_episode` with seed ``seed + i``, so the
+    results do not depend on the number of workers or on which worker plays
+    which episode. Every worker creates one environment and reuses it for all
+    its episodes. ``num_workers`` defaults to the number of CPUs, with
+    ``num_workers=0`` the episodes are played in this process. With the
+    ``"spawn"`` or ``"forkserver"`` contexts, ``env_fn`` and ``policies`` must
+    be picklable, e.g. the ``env`` factory of an environment module.
+
+    Unlike `average_total_reward`, returns are kept per agent, so zero-sum
+    games can be evaluated as well.
+
+    Example:
+        >>> from pettingzoo.classic import connect_four_v3
+        >>> def first_legal_column(observation, agent):
+        ...     return int(np.flatnonzero(observation["action_mask"])[0])
+        >>> result = evaluate(
+        ...     connect_four_v3.env,
+        ...     {"player_0": first_legal_column},
+        ...     num_episodes=20,
+        ...     num_workers=2,
+        ... )
+        >>> rate, low, high = result.win_rates()["player_0"]
+    """
+    seeds = [seed + i for i in range(num_episodes)]
+    if num_workers is None:
+        num_workers = os.cpu_count() or 1
+    if num_workers == 0:
+        _init_worker(env_fn, policies, max_cycles)
+        try:
+            episodes = [_run_worker_episode(episode_seed) for episode_seed in seeds]
+        finally:
+            _worker.pop("env").close()
+            _worker.clear()
+    else:
+        with concurrent.futures.ProcessPoolExecutor(
+            max_workers=num_workers,
+            mp_context=multiprocessing.get_context(context),
+            initializer=_init_worker,
+            initargs=(env_fn, policies, max_cycles),
+        ) as executor:
+            episodes = list(
+                executor.map(
+                    _run_worker_episode,
+                    seeds,
+                    chunksize=max(1, num_episodes // (4 * num_workers)),
+                )
+            )
+
+    agents: dict[AgentID, None] = {}
+    for returns, _ in episodes:
+        agents.update(dict.fromkeys(returns))
+    return EvaluationResult(
+        seeds,
+        {
+            agent: np.array(
+                [returns.get(agent, math.nan) for returns, _ in episodes], dtype=float
+            )
+            for agent in agents
+        },
+        np.array([length for _, length in episodes], dtype=int),
+        confidence=confidence,
+    )
@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import contextlib
+import time
+from typing import Any, Hashable
+
+# returned instead of a timed section when profiling is disabled, it is reusable
+NULL_SECTION = contextlib.nullcontext()
+
+
+class _Section:
+    __slots__ = ("profiler", "name", "agent", "start")
+
+    def __init__(self, profiler: Profiler, name: str, agent: Hashable | None):
+        self.profiler = profiler
+        self.name = name
+        self.agent = agent
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.profiler.record(
+            self.name, time.perf_counter() - self.start, agent=self.agent
+        )
+        return False
+
+
+class Profiler:
+    """Accumulates the number of calls and the time spent in named sections of an environment.
+
+    Sections are recorded per agent when an agent is given. The counters can be
+    exported as a dict with `as_dict` or as Prometheus text with `to_prometheus`.
+
+    Example:
+        >>> profiler = Profiler()
+        >>> with profiler.section("draw"):
+        ...     pass
+        >>> profiler.as_dict()["draw"]["calls"]
+        1
+    """
+
+    def __init__(self, enabled: bool = True):
+        self.enabled = enabled
+        # (section name, agent or None) -> [calls, total seconds]
+        self.counters: dict[tuple[str, Hashable | None], list] = {}
+
+    def section(self, name: str, agent: Hashable | None = None):
+        """Returns a context manager which records the time spent inside it under ``name``."""
+        if not self.enabled:
+            return NULL_SECTION
+        return _Section(self, name, agent)
+
+    def record(self, name: str, seconds: float, agent: Hashable | None = None) -> None:
+        counter = self.counters.get((name, agent))
+        if counter is None:
+            self.counters[(name, agent)] = [1, seconds]
+        else:
+            counter[0] += 1
+            counter[1] += seconds
+
+    def reset(self) -> None:
+        self.counters.clear()
+
+    def as_dict(self) -> dict[str, dict[str, Any]]:
+        """Returns the ``calls``, ``total_seconds`` and ``mean_seconds`` of every section.
+
+        Sections recorded per agent also have an ``agents`` dict with the same
+        statistics for every agent, the top level values are summed over agents.
+        """
+        sections = {}
+        for (name, agent), (calls, seconds) in self.counters.items():
+            section = sections.setdefault(name, {"calls": 0, "total_seconds": 0.0})
+            section["calls"] += calls
+            section["total_seconds"] += seconds
+            if agent is not None:
+                section.setdefault("agents", {})[str(agent)] = _stats(calls, seconds)
+        for section in sections.values():
+            section["mean_seconds"] = section["total_seconds"] / section["calls"]
+        return sections
+
+    def to_prometheus(self, prefix: str = "pettingzoo") -> str:
+        """Returns the counters in the Prometheus text exposition format."""
+        metrics = [
+            (f"{prefix}_section_calls_total", "Number of calls of a section.", 0),
+            (
+                f"{prefix}_section_seconds_total",
+                "Total time spent in a section in seconds.",
+                1,
+            ),
+        ]
+        lines = []
+        for metric, description, index in metrics:
+            lines.append(f"# HELP {metric} {description}")
+            lines.append(f"# TYPE {metric} counter")
+            for (name, agent), counter in self.counters.items():
+                labels = f'section="{_escape(name)}"'
+                if agent is not None:
+                    labels += f',agent="{_escape(str(agent))}"'
+                lines.append(f"{metric}{{{labels}}} {counter[index]}")
+        return "\n".join(lines) + "\n"
+
+
+def _stats(calls: int, seconds: float) -> dict[str, Any]:
+    return {"calls": calls, "total_seconds": seconds, "mean_seconds": seconds / calls}
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
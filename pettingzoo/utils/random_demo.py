@@ -1,9 +1,6 @@
 from __future__ import annotations
 
-import random
-
-import numpy as np
-
+from pettingzoo.utils.action_sampling import sample_action
 from pettingzoo.utils.env import AECEnv
 
 
@@ -18,14 +15,12 @@ def random_demo(env: AECEnv, render: bool = True, episodes: int = 1) -> float:
             if render:
                 env.render()
 
-            obs, reward, termination, truncation, _ = env.last()
+            obs, reward, termination, truncation, info = env.last()
             total_reward += reward
             if termination or truncation:
                 action = None
-            elif isinstance(obs, dict) and "action_mask" in obs:
-                action = random.choice(np.flatnonzero(obs["action_mask"]).tolist())
             else:
-                action = env.action_space(agent).sample()
+                action = sample_action(env.action_space(agent), obs, info)
             env.step(action)
 
         completed_episodes += 1
@@ -0,0 +1,6 @@
+from pettingzoo.utils.vector.async_vector_parallel_env import AsyncVectorParallelEnv
+from pettingzoo.utils.vector.vector_parallel_env import (
+    AgentLayout,
+    StackedBuffers,
+    VectorParallelEnv,
+)
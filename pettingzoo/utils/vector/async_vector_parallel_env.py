@@ -0,0 +1,291 @@
+from __future__ import annotations
+
+import multiprocessing
+import traceback
+from multiprocessing import shared_memory
+from typing import Any, Callable, Sequence
+
+import gymnasium.spaces
+import numpy as np
+
+from pettingzoo.utils.env import AgentID, ParallelEnv
+from pettingzoo.utils.vector.vector_parallel_env import (
+    AgentLayout,
+    StackedBuffers,
+    _env_seeds,
+    reset_sub_env,
+    step_sub_env,
+)
+
+
+class AsyncVectorParallelEnv:
+    """Runs ``num_envs`` copies of a ParallelEnv in worker processes.
+
+    Returns the same stacked arrays as `VectorParallelEnv`, but every sub-environment
+    lives in its own process and writes its observations, rewards and done flags
+    straight into buffers in ``multiprocessing.shared_memory``, which are preallocated
+    from ``observation_space(agent)``. Only actions, seeds and info dicts go through
+    the pipes.
+
+    `step_async` and `step_wait` let the caller overlap computing the next actions
+    with the simulation. With the ``"spawn"`` or ``"forkserver"`` contexts, ``env_fns``
+    must be picklable, e.g. the ``parallel_env`` factory of an environment module.
+
+    Example:
+        >>> from pettingzoo.butterfly import pistonball_v6
+        >>> from pettingzoo.utils import AsyncVectorParallelEnv
+        >>> envs = AsyncVectorParallelEnv([pistonball_v6.parallel_env] * 4)
+        >>> observations, infos = envs.reset(seed=42)
+        >>> actions = np.zeros((envs.num_envs, envs.num_agents, 1), dtype=np.float32)
+        >>> envs.step_async(actions)
+        >>> # ... compute something else while the workers simulate ...
+        >>> observations, rewards, terminations, truncations, infos = envs.step_wait()
+    """
+
+    def __init__(
+        self,
+        env_fns: Sequence[Callable[[], ParallelEnv]],
+        context: str | None = None,
+        copy: bool = True,
+    ):
+        assert (
+            len(env_fns) > 0
+        ), "AsyncVectorParallelEnv requires at least one environment"
+        self.num_envs = len(env_fns)
+        self.copy = copy
+
+        dummy_env = env_fns[0]()
+        self.metadata = dummy_env.metadata
+        self.layout = AgentLayout(dummy_env)
+        self._observation_spaces = {
+            agent: dummy_env.observation_space(agent)
+            for agent in self.layout.possible_agents
+        }
+        self._action_spaces = {
+            agent: dummy_env.action_space(agent)
+            for agent in self.layout.possible_agents
+        }
+        self._name = str(dummy_env)
+        dummy_env.close()
+        del dummy_env
+
+        self.possible_agents = self.layout.possible_agents
+        self.num_agents = self.layout.num_agents
+
+        specs = StackedBuffers.specs(self.layout, self.num_envs)
+        self._shared_memories = [
+            shared_memory.SharedMemory(
+                create=True, size=max(1, int(np.prod(shape)) * dtype.itemsize)
+            )
+            for shape, dtype in specs
+        ]
+        self.buffers = _attach_buffers(
+            [shm.buf for shm in self._shared_memories], specs
+        )
+
+        ctx = multiprocessing.get_context(context)
+        self.parent_pipes, self.processes = [], []
+        try:
+            for i, env_fn in enumerate(env_fns):
+                parent_pipe, child_pipe = ctx.Pipe()
+                process = ctx.Process(
+                    target=_worker,
+                    name=f"Worker<{type(self).__name__}>-{i}",
+                    args=(
+                        i,
+                        env_fn,
+                        child_pipe,
+                        parent_pipe,
+                        [shm.name for shm in self._shared_memories],
+                        specs,
+                    ),
+                    daemon=True,
+                )
+                self.parent_pipes.append(parent_pipe)
+                self.processes.append(process)
+                process.start()
+                child_pipe.close()
+        except Exception:
+            for process in self.processes:
+                if process.is_alive():
+                    process.terminate()
+            self.buffers = None
+            for shm in self._shared_memories:
+                shm.close()
+                shm.unlink()
+            raise
+
+        self._waiting: str | None = None
+        self.closed = False
+
+    @property
+    def agents_mask(self) -> np.ndarray:
+        return self.buffers.agents_mask
+
+    def observation_space(self, agent: AgentID) -> gymnasium.spaces.Space:
+        return self._observation_spaces[agent]
+
+    def action_space(self, agent: AgentID) -> gymnasium.spaces.Space:
+        return self._action_spaces[agent]
+
+    def reset_async(
+        self,
+        seed: int | list[int | None] | None = None,
+        options: dict | None = None,
+    ) -> None:
+        """Sends the reset command to every worker without waiting for the results."""
+        self._assert_not_waiting()
+        for pipe, env_seed in zip(self.parent_pipes, _env_seeds(seed, self.num_envs)):
+            pipe.send(("reset", (env_seed, options)))
+        self._waiting = "reset"
+
+    def reset_wait(self) -> tuple[np.ndarray, list[dict]]:
+        """Waits for the workers to finish `reset_async`."""
+        infos = self._receive("reset")
+        return self._maybe_copy(self.buffers.observations), infos
+
+    def reset(
+        self,
+        seed: int | list[int | None] | None = None,
+        options: dict | None = None,
+    ) -> tuple[np.ndarray, list[dict]]:
+        """Resets every sub-environment.
+
+        An integer ``seed`` seeds the sub-environments with ``seed``, ``seed + 1``, ...
+        """
+        self.reset_async(seed=seed, options=options)
+        return self.reset_wait()
+
+    def step_async(self, actions: np.ndarray) -> None:
+        """Sends ``actions`` of shape ``(num_envs, num_agents, *action_shape)`` to the workers without waiting."""
+        self._assert_not_waiting()
+        actions = np.asarray(actions)
+        for pipe, env_actions in zip(self.parent_pipes, actions):
+            pipe.send(("step", env_actions))
+        self._waiting = "step"
+
+    def step_wait(
+        self,
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, list[dict]]:
+        """Waits for the workers to finish `step_async`."""
+        infos = self._receive("step")
+        return (
+            self._maybe_copy(self.buffers.observations),
+            self._maybe_copy(self.buffers.rewards),
+            self._maybe_copy(self.buffers.terminations),
+            self._maybe_copy(self.buffers.truncations),
+            infos,
+        )
+
+    def step(
+        self, actions: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, list[dict]]:
+        """Steps every sub-environment, see `VectorParallelEnv.step`."""
+        self.step_async(actions)
+        return self.step_wait()
+
+    def close(self) -> None:
+        if self.closed:
+            return
+        if self._waiting is not None:
+            self._receive(self._waiting)
+        for pipe in self.parent_pipes:
+            pipe.send(("close", None))
+        for pipe in self.parent_pipes:
+            pipe.recv()
+            pipe.close()
+        for process in self.processes:
+            process.join()
+        # drop the views into shared memory before releasing it
+        self.buffers = None
+        for shm in self._shared_memories:
+            try:
+                shm.close()
+            except BufferError:
+                # arrays returned with copy=False still reference the memory
+                pass
+            shm.unlink()
+        self.closed = True
+
+    def _maybe_copy(self, array: np.ndarray) -> np.ndarray:
+        return array.copy() if self.copy else array
+
+    def _assert_not_waiting(self) -> None:
+        assert not self.closed, "Cannot use a closed AsyncVectorParallelEnv"
+        assert (
+            self._waiting is None
+        ), f"Call `{self._waiting}_wait` before sending a new command to the workers"
+
+    def _receive(self, command: str) -> list[Any]:
+        assert (
+            self._waiting == command
+        ), f"`{command}_wait` called without a matching `{command}_async`"
+        results = [pipe.recv() for pipe in self.parent_pipes]
+        self._waiting = None
+        for i, (result, success) in enumerate(results):
+            if not success:
+                raise RuntimeError(
+                    f"Sub-environment {i} raised an exception:\n{result}"
+                )
+        return [result for result, _ in results]
+
+    def __del__(self):
+        if not getattr(self, "closed", True):
+            self.close()
+
+    def __str__(self) -> str:
+        return f"{type(self).__name__}<{self.num_envs}x{self._name}>"
+
+
+def _attach_buffers(
+    memories: list[Any], specs: list[tuple[tuple[int, ...], np.dtype]]
+) -> StackedBuffers:
+    return StackedBuffers(
+        *[
+            np.ndarray(shape, dtype=dtype, buffer=memory)
+            for memory, (shape, dtype) in zip(memories, specs)
+        ]
+    )
+
+
+def _worker(
+    index: int,
+    env_fn: Callable[[], ParallelEnv],
+    pipe: Any,
+    parent_pipe: Any,
+    shm_names: list[str],
+    specs: list[tuple[tuple[int, ...], np.dtype]],
+) -> None:
+    parent_pipe.close()
+    memories = [shared_memory.SharedMemory(name=name) for name in shm_names]
+    buffers = _attach_buffers([shm.buf for shm in memories], specs)
+    env = env_fn()
+    layout = AgentLayout(env)
+    try:
+        while True:
+            command, data = pipe.recv()
+            try:
+                if command == "reset":
+                    seed, options = data
+                    pipe.send(
+                        (
+                            reset_sub_env(env, layout, buffers, index, seed, options),
+                            True,
+                        )
+                    )
+                elif command == "step":
+                    pipe.send((step_sub_env(env, layout, buffers, index, data), True))
+                elif command == "close":
+                    pipe.send((None, True))
+                    break
+                else:
+                    raise RuntimeError(f"Received unknown command `{command}`")
+            except Exception:
+                pipe.send((traceback.format_exc(), False))
+    except (KeyboardInterrupt, EOFError):
+        pass
+    finally:
+        env.close()
+        del buffers
+        for shm in memories:
+            shm.close()
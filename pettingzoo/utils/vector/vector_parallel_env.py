@@ -0,0 +1,286 @@
+from __future__ import annotations
+
+from typing import Any, Callable, Iterable, Sequence
+
+import gymnasium.spaces
+import numpy as np
+
+from pettingzoo.utils.env import AgentID, ParallelEnv
+
+
+class AgentLayout:
+    """Maps the agents of a ParallelEnv onto the agent axis of stacked arrays.
+
+    Agent ``i`` of the stacked arrays is ``possible_agents[i]``. Observations
+    (and actions) of agents with smaller spaces are zero padded up to the
+    largest shape of any agent, so every agent shares one array layout.
+    """
+
+    def __init__(self, env: ParallelEnv):
+        assert hasattr(
+            env, "possible_agents"
+        ), "Vectorized environments require the `possible_agents` attribute"
+        self.possible_agents: list[AgentID] = list(env.possible_agents)
+        self.agent_index = {agent: i for i, agent in enumerate(self.possible_agents)}
+
+        obs_spaces = [env.observation_space(agent) for agent in self.possible_agents]
+        act_spaces = [env.action_space(agent) for agent in self.possible_agents]
+        self.observation_shape, self.observation_dtype = _padded_layout(obs_spaces)
+        self.action_shape, self.action_dtype = _padded_layout(act_spaces)
+        self.observation_slices = [
+            tuple(slice(0, n) for n in space.shape) for space in obs_spaces
+        ]
+        self.action_slices = [
+            tuple(slice(0, n) for n in space.shape) for space in act_spaces
+        ]
+
+    @property
+    def num_agents(self) -> int:
+        return len(self.possible_agents)
+
+    def write_observations(
+        self, out: np.ndarray, observations: dict[AgentID, Any]
+    ) -> None:
+        """Writes an observation dict into ``out`` of shape ``(num_agents, *observation_shape)``."""
+        out.fill(0)
+        for agent, obs in observations.items():
+            i = self.agent_index.get(agent)
+            if i is not None:
+                out[i][self.observation_slices[i]] = obs
+
+    def write_flags(
+        self, out: np.ndarray, values: dict[AgentID, Any], default: Any = 0
+    ) -> None:
+        """Writes a reward, termination or truncation dict into ``out`` of shape ``(num_agents,)``."""
+        out.fill(default)
+        for agent, value in values.items():
+            i = self.agent_index.get(agent)
+            if i is not None:
+                out[i] = value
+
+    def write_mask(self, out: np.ndarray, agents: Iterable[AgentID]) -> None:
+        """Sets the entries of ``agents`` in the boolean ``out`` of shape ``(num_agents,)``."""
+        out.fill(False)
+        for agent in agents:
+            i = self.agent_index.get(agent)
+            if i is not None:
+                out[i] = True
+
+    def actions_to_dict(
+        self, actions: np.ndarray, agents: list[AgentID]
+    ) -> dict[AgentID, Any]:
+        """Converts a ``(num_agents, *action_shape)`` array into an action dict for the live ``agents``."""
+        action_dict = {}
+        for agent in agents:
+            i = self.agent_index[agent]
+            action_dict[agent] = actions[i][self.action_slices[i]]
+        return action_dict
+
+
+def _padded_layout(
+    spaces: list[gymnasium.spaces.Space],
+) -> tuple[tuple[int, ...], np.dtype]:
+    for space in spaces:
+        assert isinstance(
+            space,
+            (
+                gymnasium.spaces.Box,
+                gymnasium.spaces.Discrete,
+                gymnasium.spaces.MultiDiscrete,
+                gymnasium.spaces.MultiBinary,
+            ),
+        ), f"Only Box, Discrete, MultiDiscrete and MultiBinary spaces can be stacked, got {space}"
+    ndims = {len(space.shape) for space in spaces}
+    assert (
+        len(ndims) == 1
+    ), "All agents' spaces must have the same number of dimensions to be stacked"
+    shape = tuple(int(n) for n in np.max([space.shape for space in spaces], axis=0))
+    dtype = np.result_type(*[space.dtype for space in spaces])
+    return shape, dtype
+
+
+class StackedBuffers:
+    """The arrays that a vectorized environment writes its sub-environments' outputs into.
+
+    ``observations`` has shape ``(num_envs, num_agents, *observation_shape)`` and
+    ``rewards``, ``terminations``, ``truncations`` and ``agents_mask`` have shape
+    ``(num_envs, num_agents)``. The arrays may live in ordinary or shared memory.
+    """
+
+    def __init__(
+        self,
+        observations: np.ndarray,
+        rewards: np.ndarray,
+        terminations: np.ndarray,
+        truncations: np.ndarray,
+        agents_mask: np.ndarray,
+    ):
+        self.observations = observations
+        self.rewards = rewards
+        self.terminations = terminations
+        self.truncations = truncations
+        self.agents_mask = agents_mask
+
+    @staticmethod
+    def specs(
+        layout: AgentLayout, num_envs: int
+    ) -> list[tuple[tuple[int, ...], np.dtype]]:
+        """Returns the ``(shape, dtype)`` of every buffer, in constructor order."""
+        flags_shape = (num_envs, layout.num_agents)
+        return [
+            (flags_shape + layout.observation_shape, layout.observation_dtype),
+            (flags_shape, np.dtype(np.float64)),
+            (flags_shape, np.dtype(np.bool_)),
+            (flags_shape, np.dtype(np.bool_)),
+            (flags_shape, np.dtype(np.bool_)),
+        ]
+
+    @classmethod
+    def allocate(cls, layout: AgentLayout, num_envs: int) -> StackedBuffers:
+        return cls(
+            *[
+                np.zeros(shape, dtype=dtype)
+                for shape, dtype in cls.specs(layout, num_envs)
+            ]
+        )
+
+
+def reset_sub_env(
+    env: ParallelEnv,
+    layout: AgentLayout,
+    buffers: StackedBuffers,
+    i: int,
+    seed: int | None = None,
+    options: dict | None = None,
+) -> dict:
+    """Resets ``env`` and writes its observations into slot ``i`` of ``buffers``."""
+    obs, info = env.reset(seed=seed, options=options)
+    layout.write_observations(buffers.observations[i], obs)
+    layout.write_mask(buffers.agents_mask[i], env.agents)
+    return dict(info)
+
+
+def step_sub_env(
+    env: ParallelEnv,
+    layout: AgentLayout,
+    buffers: StackedBuffers,
+    i: int,
+    actions: np.ndarray,
+) -> dict:
+    """Steps ``env`` with the ``(num_agents, *action_shape)`` ``actions`` and writes its outputs into slot ``i`` of ``buffers``.
+
+    If the episode is over, ``env`` is reset and the final observations and infos
+    are returned in the info dict under ``"final_observation"`` and ``"final_info"``.
+    """
+    obs, rew, term, trunc, info = env.step(layout.actions_to_dict(actions, env.agents))
+    layout.write_observations(buffers.observations[i], obs)
+    layout.write_flags(buffers.rewards[i], rew)
+    layout.write_flags(buffers.terminations[i], term, False)
+    layout.write_flags(buffers.truncations[i], trunc, False)
+    layout.write_mask(buffers.agents_mask[i], obs)
+
+    if env.agents:
+        return info
+    final_observation = buffers.observations[i].copy()
+    reset_info = reset_sub_env(env, layout, buffers, i)
+    reset_info["final_observation"] = final_observation
+    reset_info["final_info"] = info
+    return reset_info
+
+
+class VectorParallelEnv:
+    """Steps ``num_envs`` copies of a ParallelEnv and stacks their outputs into NumPy arrays.
+
+    Observations are returned with shape ``(num_envs, num_agents, *obs_shape)``
+    and rewards, terminations and truncations with shape ``(num_envs, num_agents)``,
+    where agent ``i`` is ``possible_agents[i]`` (see `AgentLayout`). Agents which are
+    not live in a sub-environment get zero-filled entries; ``agents_mask`` tells which
+    entries of the last returned arrays belong to live agents.
+
+    A sub-environment is reset as soon as it has no agents left. The observations of
+    the new episode are returned in its slot, while the final observations and infos
+    are stored in ``infos[i]["final_observation"]`` and ``infos[i]["final_info"]``.
+
+    Example:
+        >>> from pettingzoo.butterfly import pistonball_v6
+        >>> from pettingzoo.utils import VectorParallelEnv
+        >>> envs = VectorParallelEnv([pistonball_v6.parallel_env] * 4)
+        >>> observations, infos = envs.reset(seed=42)
+        >>> observations.shape
+        (4, 20, 457, 120, 3)
+    """
+
+    def __init__(self, env_fns: Sequence[Callable[[], ParallelEnv]]):
+        assert len(env_fns) > 0, "VectorParallelEnv requires at least one environment"
+        self.envs: list[ParallelEnv] = [env_fn() for env_fn in env_fns]
+        self.num_envs = len(self.envs)
+        self.metadata = self.envs[0].metadata
+
+        self.layout = AgentLayout(self.envs[0])
+        self.possible_agents = self.layout.possible_agents
+        self.num_agents = self.layout.num_agents
+        self.buffers = StackedBuffers.allocate(self.layout, self.num_envs)
+
+    @property
+    def agents_mask(self) -> np.ndarray:
+        return self.buffers.agents_mask
+
+    def observation_space(self, agent: AgentID) -> gymnasium.spaces.Space:
+        return self.envs[0].observation_space(agent)
+
+    def action_space(self, agent: AgentID) -> gymnasium.spaces.Space:
+        return self.envs[0].action_space(agent)
+
+    def reset(
+        self,
+        seed: int | list[int | None] | None = None,
+        options: dict | None = None,
+    ) -> tuple[np.ndarray, list[dict]]:
+        """Resets every sub-environment.
+
+        An integer ``seed`` seeds the sub-environments with ``seed``, ``seed + 1``, ...
+        """
+        seeds = _env_seeds(seed, self.num_envs)
+        infos = [
+            reset_sub_env(env, self.layout, self.buffers, i, seeds[i], options)
+            for i, env in enumerate(self.envs)
+        ]
+        return self.buffers.observations.copy(), infos
+
+    def step(
+        self, actions: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, list[dict]]:
+        """Steps every sub-environment with ``actions`` of shape ``(num_envs, num_agents, *action_shape)``.
+
+        Actions of agents which are not live are ignored.
+        """
+        actions = np.asarray(actions)
+        infos = [
+            step_sub_env(env, self.layout, self.buffers, i, actions[i])
+            for i, env in enumerate(self.envs)
+        ]
+        return (
+            self.buffers.observations.copy(),
+            self.buffers.rewards.copy(),
+            self.buffers.terminations.copy(),
+            self.buffers.truncations.copy(),
+            infos,
+        )
+
+    def render(self) -> list:
+        return [env.render() for env in self.envs]
+
+    def close(self) -> None:
+        for env in self.envs:
+            env.close()
+
+    def __str__(self) -> str:
+        return f"{type(self).__name__}<{self.num_envs}x{str(self.envs[0])}>"
+
+
+def _env_seeds(seed: int | list[int | None] | None, num_envs: int) -> list[int | None]:
+    if seed is None or isinstance(seed, int):
+        return [None if seed is None else seed + i for i in range(num_envs)]
+    seeds = list(seed)
+    assert len(seeds) == num_envs, "Expected one seed per environment"
+    return seeds
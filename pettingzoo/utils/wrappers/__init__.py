@@ -1,9 +1,22 @@
 from pettingzoo.utils.wrappers.assert_out_of_bounds import AssertOutOfBoundsWrapper
-from pettingzoo.utils.wrappers.base import BaseWrapper
+from pettingzoo.utils.wrappers.base import (
+    BaseWrapper,
+    CompiledWrapper,
+    compile_wrappers,
+)
 from pettingzoo.utils.wrappers.base_parallel import BaseParallelWrapper
 from pettingzoo.utils.wrappers.capture_stdout import CaptureStdoutWrapper
 from pettingzoo.utils.wrappers.clip_out_of_bounds import ClipOutOfBoundsWrapper
+from pettingzoo.utils.wrappers.episode_recorder import (
+    EpisodeRecorderParallelWrapper,
+    EpisodeRecorderWrapper,
+)
 from pettingzoo.utils.wrappers.multi_episode_env import MultiEpisodeEnv
 from pettingzoo.utils.wrappers.multi_episode_parallel_env import MultiEpisodeParallelEnv
 from pettingzoo.utils.wrappers.order_enforcing import OrderEnforcingWrapper
+from pettingzoo.utils.wrappers.profiling import (
+    ProfilingParallelWrapper,
+    ProfilingWrapper,
+)
 from pettingzoo.utils.wrappers.terminate_illegal import TerminateIllegalWrapper
+from pettingzoo.utils.wrappers.validation import set_validation, validation_enabled
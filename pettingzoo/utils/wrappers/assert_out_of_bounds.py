@@ -7,6 +7,8 @@ from pettingzoo.utils.wrappers.base import BaseWrapper
 class AssertOutOfBoundsWrapper(BaseWrapper[AgentID, ObsType, ActionType]):
     """Asserts if the action given to step is outside of the action space."""
 
+    checks_only = True
+
     def __init__(self, env: AECEnv[AgentID, ObsType, ActionType]):
         assert isinstance(
             env, AECEnv
@@ -1,11 +1,23 @@
 from __future__ import annotations
 
+import inspect
 from typing import Any
 
 import gymnasium.spaces
 import numpy as np
 
-from pettingzoo.utils.env import ActionType, AECEnv, AgentID, ObsType
+from pettingzoo.utils.env import ActionType, AECEnv, AECIterable, AgentID, ObsType
+
+# attributes read on every iteration of an `agent_iter`/`last` loop
+_FORWARDED_STATE = (
+    "agents",
+    "agent_selection",
+    "rewards",
+    "terminations",
+    "truncations",
+    "infos",
+    "_cumulative_rewards",
+)
 
 
 class BaseWrapper(AECEnv[AgentID, ObsType, ActionType]):
@@ -14,6 +26,10 @@ class BaseWrapper(AECEnv[AgentID, ObsType, ActionType]):
     All AECEnv wrappers should inherit from this base class
     """
 
+    # True for wrappers which only validate calls and do not change the
+    # environment, `compile_wrappers` can skip them with ``skip_checks=True``
+    checks_only: bool = False
+
     def __init__(self, env: AECEnv[AgentID, ObsType, ActionType]):
         super().__init__()
         self.env = env
@@ -40,9 +56,21 @@ class BaseWrapper(AECEnv[AgentID, ObsType, ActionType]):
     def observe(self, agent: AgentID) -> ObsType | None:
         return self.env.observe(agent)
 
+    def observe_into(self, agent: AgentID, out: np.ndarray) -> np.ndarray:
+        # wrappers which change observe() get a copy of their observation
+        if type(self).observe is BaseWrapper.observe:
+            return self.env.observe_into(agent, out)
+        return super().observe_into(agent, out)
+
     def state(self) -> np.ndarray:
         return self.env.state()
 
+    def snapshot(self) -> Any:
+        return self.env.snapshot()
+
+    def restore(self, snapshot: Any) -> None:
+        self.env.restore(snapshot)
+
     def step(self, action: ActionType) -> None:
         self.env.step(action)
 
@@ -55,3 +83,159 @@ class BaseWrapper(AECEnv[AgentID, ObsType, ActionType]):
     def __str__(self) -> str:
         """Returns a name which looks like: "max_observation<space_invaders_v1>"."""
         return f"{type(self).__name__}<{str(self.env)}>"
+
+
+def _resolve_owner(env: AECEnv, name: str) -> AECEnv:
+    """Returns the layer of a wrapper stack which defines ``name``, i.e. the one `BaseWrapper.__getattr__` would end at."""
+    while (
+        isinstance(env, BaseWrapper)
+        and name not in vars(env)
+        and not hasattr(type(env), name)
+    ):
+        env = env.env
+    return env
+
+
+class _ForwardedAttribute:
+    """Reads an attribute directly from the layer of the stack which defines it, once `CompiledWrapper` has bound it."""
+
+    def __set_name__(self, owner: type, name: str):
+        self.name = name
+
+    def __get__(self, wrapper: CompiledWrapper | None, objtype: type | None = None):
+        if wrapper is None:
+            return self
+        owner = wrapper._owners.get(self.name)
+        if owner is None:
+            return getattr(wrapper._target, self.name)
+        return getattr(owner, self.name)
+
+
+class CompiledWrapper(BaseWrapper[AgentID, ObsType, ActionType]):
+    """Flattens a stack of wrappers, see `compile_wrappers`."""
+
+    agents = _ForwardedAttribute()
+    agent_selection = _ForwardedAttribute()
+    rewards = _ForwardedAttribute()
+    terminations = _ForwardedAttribute()
+    truncations = _ForwardedAttribute()
+    infos = _ForwardedAttribute()
+    _cumulative_rewards = _ForwardedAttribute()
+
+    def __init__(
+        self, env: AECEnv[AgentID, ObsType, ActionType], skip_checks: bool = False
+    ):
+        assert isinstance(
+            env, AECEnv
+        ), "CompiledWrapper is only compatible with AEC environments"
+        super().__init__(env)
+        self.skip_checks = skip_checks
+        # the outermost layer which is called, leading check wrappers are skipped in release mode
+        target = env
+        if skip_checks:
+            while isinstance(target, BaseWrapper) and target.checks_only:
+                target = target.env
+        self._target = target
+
+        layers = [target]
+        while isinstance(layers[-1], BaseWrapper):
+            layers.append(layers[-1].env)
+        # last() and agent_iter() run on this wrapper unless a layer customizes them
+        self._own_last = all(type(layer).last is AECEnv.last for layer in layers)
+        self._own_agent_iter = all(
+            type(layer).agent_iter is AECEnv.agent_iter for layer in layers
+        )
+        self._owners: dict[str, AECEnv] = {}
+
+    def _bind(self) -> None:
+        """Finds the layers which define the forwarded attributes, they only move when an environment is reset."""
+        self._owners = {
+            name: _resolve_owner(self.env, name) for name in _FORWARDED_STATE
+        }
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("_"):
+            raise AttributeError(f"accessing private attribute '{name}' is prohibited")
+        if not self._owners:
+            # until the first reset, lookups go through the layers so that
+            # checks like the ones of OrderEnforcingWrapper still run
+            return getattr(self._target, name)
+        value = getattr(_resolve_owner(self.env, name), name)
+        if inspect.ismethod(value):
+            # bound methods do not change, later lookups hit the instance dict
+            self.__dict__[name] = value
+        return value
+
+    def reset(self, seed: int | None = None, options: dict | None = None) -> None:
+        self._target.reset(seed=seed, options=options)
+        self._bind()
+
+    def step(self, action: ActionType) -> None:
+        self._target.step(action)
+
+    def observe(self, agent: AgentID) -> ObsType | None:
+        return self._target.observe(agent)
+
+    def observe_into(self, agent: AgentID, out: np.ndarray) -> np.ndarray:
+        return self._target.observe_into(agent, out)
+
+    def last(self, observe: bool = True, lazy: bool = False) -> tuple:
+        if self._own_last and self._owners:
+            return super().last(observe, lazy)
+        return self._target.last(observe, lazy)
+
+    def agent_iter(self, max_iter: int = 2**63) -> AECIterable:
+        if self._own_agent_iter and self._owners:
+            return AECIterable(self, max_iter)
+        return self._target.agent_iter(max_iter)
+
+    def state(self) -> np.ndarray:
+        return self._target.state()
+
+    def snapshot(self) -> Any:
+        return self._target.snapshot()
+
+    def restore(self, snapshot: Any) -> None:
+        self._target.restore(snapshot)
+
+    def render(self) -> None | np.ndarray | str | list:
+        return self._target.render()
+
+    def close(self) -> None:
+        self._target.close()
+
+    def observation_space(self, agent: AgentID) -> gymnasium.spaces.Space:
+        return self._target.observation_space(agent)
+
+    def action_space(self, agent: AgentID) -> gymnasium.spaces.Space:
+        return self._target.action_space(agent)
+
+    def __str__(self) -> str:
+        return str(self.env)
+
+
+def compile_wrappers(
+    env: AECEnv[AgentID, ObsType, ActionType], skip_checks: bool = False
+) -> CompiledWrapper[AgentID, ObsType, ActionType]:
+    """Flattens the wrapper stack of ``env`` so attribute lookups and calls no longer walk every wrapper.
+
+    After each reset, ``agents``, ``agent_selection``, ``rewards``,
+    ``terminations``, ``truncations``, ``infos`` and ``_cumulative_rewards``
+    are read directly from the layer which defines them (usually the
+    unwrapped environment), and other forwarded methods are bound to the
+    compiled wrapper the first time they are looked up. ``last()`` and
+    ``agent_iter()`` read through these bindings unless a wrapper overrides them.
+
+    With ``skip_checks=True`` (release mode) the outermost wrappers which only
+    validate calls, such as `OrderEnforcingWrapper` and
+    `AssertOutOfBoundsWrapper`, are not called at all. Invalid calls are then
+    no longer reported.
+
+    Example:
+        >>> from pettingzoo.butterfly import pistonball_v6
+        >>> env = compile_wrappers(pistonball_v6.env(), skip_checks=True)
+        >>> env.reset(seed=42)
+        >>> env.agent_selection
+        'piston_0'
+    """
+    return CompiledWrapper(env, skip_checks=skip_checks)
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from typing import Any
+
 import gymnasium.spaces
 import numpy as np
 
@@ -46,6 +48,12 @@ class BaseParallelWrapper(ParallelEnv[AgentID, ObsType, ActionType]):
     def state(self) -> np.ndarray:
         return self.env.state()
 
+    def snapshot(self) -> Any:
+        return self.env.snapshot()
+
+    def restore(self, snapshot: Any) -> None:
+        self.env.restore(snapshot)
+
     def observation_space(self, agent: AgentID) -> gymnasium.spaces.Space:
         return self.env.observation_space(agent)
 
@@ -0,0 +1,172 @@
+from __future__ import annotations
+
+import os
+from typing import Any
+
+import gymnasium.spaces
+import numpy as np
+
+from pettingzoo.utils.env import ActionType, AECEnv, AgentID, ObsType, ParallelEnv
+from pettingzoo.utils.episode_storage import EpisodeWriter
+from pettingzoo.utils.wrappers.base import BaseWrapper
+from pettingzoo.utils.wrappers.base_parallel import BaseParallelWrapper
+
+
+def _empty(space: gymnasium.spaces.Space) -> Any:
+    if isinstance(space, gymnasium.spaces.Dict):
+        return {key: _empty(subspace) for key, subspace in space.spaces.items()}
+    return np.empty(space.shape, dtype=space.dtype)
+
+
+def _copy_into(buffer: Any, value: Any) -> None:
+    if isinstance(buffer, dict):
+        for key, item in buffer.items():
+            _copy_into(item, value[key])
+    else:
+        np.copyto(buffer, value, casting="unsafe")
+
+
+def _own(action: Any) -> Any:
+    # the caller may reuse its action array before the transition is written
+    return action.copy() if isinstance(action, np.ndarray) else action
+
+
+class _Recorder:
+    """Holds the observation of every agent until the outcome of its action is known."""
+
+    def __init__(self, env, path: str | os.PathLike, chunk_size: int):
+        self.env = env
+        self.writer = EpisodeWriter(path, chunk_size=chunk_size)
+        # one preallocated buffer per agent, reused for every transition
+        self.observations: dict[Any, Any] = {}
+
+    def hold(self, agent: Any, observation: Any) -> None:
+        buffer = self.observations.get(agent)
+        if buffer is None:
+            observation_space = self.env.observation_space(agent)
+            self.writer.add_agent(
+                agent, observation_space, self.env.action_space(agent)
+            )
+            buffer = self.observations[agent] = _empty(observation_space)
+        _copy_into(buffer, observation)
+
+
+class EpisodeRecorderWrapper(BaseWrapper[AgentID, ObsType, ActionType]):
+    """Records every transition of an AEC environment into a memory-mapped dataset in ``path``.
+
+    A transition is the observation an agent acted on, its action and the
+    (cumulative) reward, termination and truncation it gets at its next turn.
+    The observation returned by ``last()`` is reused, so recording does not
+    observe again. Episodes are closed when every agent is done, on reset and
+    on close. Read the dataset with `pettingzoo.utils.episode_storage.EpisodeReader`.
+    """
+
+    def __init__(
+        self,
+        env: AECEnv[AgentID, ObsType, ActionType],
+        path: str | os.PathLike,
+        chunk_size: int = 1024,
+    ):
+        assert isinstance(
+            env, AECEnv
+        ), "EpisodeRecorderWrapper is only compatible with AEC environments"
+        super().__init__(env)
+        self._recorder = _Recorder(env, path, chunk_size)
+        self.writer = self._recorder.writer
+        # actions of the agents whose transition is waiting for its outcome
+        self._actions: dict[AgentID, Any] = {}
+        self._num_steps = 0
+        # (step, agent, observation) of the last observation of the selected agent
+        self._turn_observation: tuple[int, AgentID, Any] | None = None
+
+    def reset(self, seed: int | None = None, options: dict | None = None) -> None:
+        self.writer.end_episode()
+        self._actions.clear()
+        self._turn_observation = None
+        super().reset(seed=seed, options=options)
+
+    def observe(self, agent: AgentID) -> ObsType | None:
+        observation = super().observe(agent)
+        if agent == self.env.agent_selection:
+            self._turn_observation = (self._num_steps, agent, observation)
+        return observation
+
+    def step(self, action: ActionType) -> None:
+        agent = self.env.agent_selection
+        _, reward, terminated, truncated, _ = self.env.last(observe=False)
+        if agent in self._actions:
+            self.writer.append(
+                agent,
+                self._recorder.observations[agent],
+                self._actions.pop(agent),
+                reward,
+                terminated,
+                truncated,
+            )
+        if not (terminated or truncated):
+            turn = self._turn_observation
+            if turn is not None and turn[0] == self._num_steps and turn[1] == agent:
+                observation = turn[2]
+            else:
+                observation = self.env.observe(agent)
+            self._recorder.hold(agent, observation)
+            self._actions[agent] = _own(action)
+        self._num_steps += 1
+        super().step(action)
+        if not self.env.agents:
+            self.writer.end_episode()
+
+    def close(self) -> None:
+        self.writer.close()
+        super().close()
+
+
+class EpisodeRecorderParallelWrapper(BaseParallelWrapper[AgentID, ObsType, ActionType]):
+    """Records every transition of a parallel environment into a memory-mapped dataset in ``path``.
+
+    A transition is the observation an agent acted on, its action and the
+    reward, termination and truncation returned by that ``step()``. Episodes
+    are closed when every agent is done, on reset and on close. Read the
+    dataset with `pettingzoo.utils.episode_storage.EpisodeReader`.
+    """
+
+    def __init__(
+        self,
+        env: ParallelEnv[AgentID, ObsType, ActionType],
+        path: str | os.PathLike,
+        chunk_size: int = 1024,
+    ):
+        super().__init__(env)
+        self._recorder = _Recorder(env, path, chunk_size)
+        self.writer = self._recorder.writer
+
+    def _hold(self, observations: dict[AgentID, ObsType]) -> None:
+        for agent, observation in observations.items():
+            self._recorder.hold(agent, observation)
+
+    def reset(self, seed: int | None = None, options: dict | None = None):
+        self.writer.end_episode()
+        observations, infos = super().reset(seed=seed, options=options)
+        self._hold(observations)
+        return observations, infos
+
+    def step(self, actions: dict[AgentID, ActionType]):
+        observations, rewards, terminations, truncations, infos = super().step(actions)
+        for agent, action in actions.items():
+            if agent in rewards:
+                self.writer.append(
+                    agent,
+                    self._recorder.observations[agent],
+                    action,
+                    rewards[agent],
+                    terminations[agent],
+                    truncations[agent],
+                )
+        self._hold(observations)
+        if not self.env.agents:
+            self.writer.end_episode()
+        return observations, rewards, terminations, truncations, infos
+
+    def close(self) -> None:
+        self.writer.close()
+        super().close()
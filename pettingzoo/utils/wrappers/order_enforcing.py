@@ -15,6 +15,19 @@ from pettingzoo.utils.env import (
 from pettingzoo.utils.env_logger import EnvLogger
 from pettingzoo.utils.wrappers.base import BaseWrapper
 
+# attributes which cannot be accessed before reset
+_RESET_ATTRIBUTES = frozenset(
+    {
+        "rewards",
+        "terminations",
+        "truncations",
+        "infos",
+        "agent_selection",
+        "num_agents",
+        "agents",
+    }
+)
+
 
 class OrderEnforcingWrapper(BaseWrapper[AgentID, ObsType, ActionType]):
     """Checks if function calls or attribute access are in a disallowed order.
@@ -24,10 +37,12 @@ class OrderEnforcingWrapper(BaseWrapper[AgentID, ObsType, ActionType]):
       rewards, terminations, truncations, infos, agent_selection,
       num_agents, agents.
     * An error if any of the following are called before reset:
-      render(), step(), observe(), state(), agent_iter()
+      render(), step(), observe(), state(), snapshot(), restore(), agent_iter()
     * A warning if step() is called when there are no agents remaining.
     """
 
+    checks_only = True
+
     def __init__(self, env: AECEnv[AgentID, ObsType, ActionType]):
         assert isinstance(
             env, AECEnv
@@ -38,19 +53,7 @@ class OrderEnforcingWrapper(BaseWrapper[AgentID, ObsType, ActionType]):
 
     def __getattr__(self, value: str) -> Any:
         """Raises an error if certain data is accessed before reset."""
-        if (
-            value
-            in {
-                "rewards",
-                "terminations",
-                "truncations",
-                "infos",
-                "agent_selection",
-                "num_agents",
-                "agents",
-            }
-            and not self._has_reset
-        ):
+        if value in _RESET_ATTRIBUTES and not self._has_reset:
             raise AttributeError(f"{value} cannot be accessed before reset")
         return super().__getattr__(value)
 
@@ -74,11 +77,27 @@ class OrderEnforcingWrapper(BaseWrapper[AgentID, ObsType, ActionType]):
             EnvLogger.error_observe_before_reset()
         return super().observe(agent)
 
+    def observe_into(self, agent: AgentID, out: np.ndarray) -> np.ndarray:
+        if not self._has_reset:
+            EnvLogger.error_observe_before_reset()
+        return self.env.observe_into(agent, out)
+
     def state(self) -> np.ndarray:
         if not self._has_reset:
             EnvLogger.error_state_before_reset()
         return super().state()
 
+    def snapshot(self) -> Any:
+        if not self._has_reset:
+            EnvLogger.error_snapshot_before_reset()
+        return super().snapshot()
+
+    def restore(self, snapshot: Any) -> None:
+        if not self._has_reset:
+            EnvLogger.error_snapshot_before_reset()
+        self._has_updated = True
+        super().restore(snapshot)
+
     def agent_iter(
         self, max_iter: int = 2**63
     ) -> AECOrderEnforcingIterable[AgentID, ObsType, ActionType]:
@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import numpy as np
+
+from pettingzoo.utils.env import ActionType, AECEnv, AgentID, ObsType, ParallelEnv
+from pettingzoo.utils.profiler import Profiler
+from pettingzoo.utils.wrappers.base import BaseWrapper
+from pettingzoo.utils.wrappers.base_parallel import BaseParallelWrapper
+
+
+class ProfilingWrapper(BaseWrapper[AgentID, ObsType, ActionType]):
+    """Times ``step``, ``observe``, ``last``, ``reset``, ``state`` and ``render`` per agent.
+
+    The profiler is also attached to the unwrapped environment, so the internal
+    sections it marks with `AECEnv.profile_section` are recorded too. The counters
+    are read from ``wrapper.profiler``, e.g. with ``wrapper.profiler.as_dict()``.
+    """
+
+    def __init__(
+        self,
+        env: AECEnv[AgentID, ObsType, ActionType],
+        profiler: Profiler | None = None,
+    ):
+        assert isinstance(
+            env, AECEnv
+        ), "ProfilingWrapper is only compatible with AEC environments"
+        super().__init__(env)
+        self.profiler = Profiler() if profiler is None else profiler
+        self.env.unwrapped._profiler = self.profiler
+
+    def step(self, action: ActionType) -> None:
+        with self.profiler.section("step", self.env.agent_selection):
+            self.env.step(action)
+
+    def observe(self, agent: AgentID) -> ObsType | None:
+        with self.profiler.section("observe", agent):
+            return self.env.observe(agent)
+
+    def observe_into(self, agent: AgentID, out: np.ndarray) -> np.ndarray:
+        with self.profiler.section("observe", agent):
+            return self.env.observe_into(agent, out)
+
+    def last(self, observe: bool = True, lazy: bool = False):
+        with self.profiler.section("last", self.env.agent_selection):
+            return super().last(observe, lazy)
+
+    def reset(self, seed: int | None = None, options: dict | None = None):
+        with self.profiler.section("reset"):
+            self.env.reset(seed=seed, options=options)
+
+    def state(self) -> np.ndarray:
+        with self.profiler.section("state"):
+            return self.env.state()
+
+    def render(self) -> None | np.ndarray | str | list:
+        with self.profiler.section("render"):
+            return self.env.render()
+
+    def close(self) -> None:
+        self.env.unwrapped._profiler = None
+        self.env.close()
+
+
+class ProfilingParallelWrapper(BaseParallelWrapper[AgentID, ObsType, ActionType]):
+    """Times ``step``, ``reset``, ``state`` and ``render`` of a parallel environment.
+
+    Like `ProfilingWrapper`, the profiler is attached to the unwrapped environment
+    to record its internal sections.
+    """
+
+    def __init__(
+        self,
+        env: ParallelEnv[AgentID, ObsType, ActionType],
+        profiler: Profiler | None = None,
+    ):
+        super().__init__(env)
+        self.profiler = Profiler() if profiler is None else profiler
+        self.env.unwrapped._profiler = self.profiler
+
+    def reset(self, seed: int | None = None, options: dict | None = None):
+        with self.profiler.section("reset"):
+            return self.env.reset(seed=seed, options=options)
+
+    def step(self, actions: dict[AgentID, ActionType]):
+        with self.profiler.section("step"):
+            return self.env.step(actions)
+
+    def state(self) -> np.ndarray:
+        with self.profiler.section("state"):
+            return self.env.state()
+
+    def render(self) -> None | np.ndarray | str | list:
+        with self.profiler.section("render"):
+            return self.env.render()
+
+    def close(self) -> None:
+        self.env.unwrapped._profiler = None
+        self.env.close()
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from typing import Any
+
 from pettingzoo.utils.env import ActionType, AECEnv, AgentID, ObsType
 from pettingzoo.utils.env_logger import EnvLogger
 from pettingzoo.utils.wrappers.base import BaseWrapper
@@ -27,6 +29,15 @@ class TerminateIllegalWrapper(BaseWrapper[AgentID, ObsType, ActionType]):
         self._prev_info = None
         super().reset(seed=seed, options=options)
 
+    def snapshot(self) -> Any:
+        return super().snapshot(), self._terminated
+
+    def restore(self, snapshot: Any) -> None:
+        env_snapshot, self._terminated = snapshot
+        self._prev_obs = None
+        self._prev_info = None
+        super().restore(env_snapshot)
+
     def observe(self, agent: AgentID) -> ObsType | None:
         obs = super().observe(agent)
         if agent == self.agent_selection:
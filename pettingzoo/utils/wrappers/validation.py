@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+import os
+
+# Validation wrappers (AssertOutOfBoundsWrapper, OrderEnforcingWrapper) are
+# applied by the env() factories unless this is False. PETTINGZOO_VALIDATE=0
+# disables them for the whole process.
+_FALSE_VALUES = {"0", "false", "no", "off"}
+_validation_enabled = (
+    os.environ.get("PETTINGZOO_VALIDATE", "1").strip().lower() not in _FALSE_VALUES
+)
+
+
+def set_validation(enabled: bool) -> None:
+    """Enables or disables the validation wrappers for environments created from now on.
+
+    Validation wrappers (`AssertOutOfBoundsWrapper` and `OrderEnforcingWrapper`)
+    only report invalid use of an environment, they do not change its behavior.
+    Wrappers which do, e.g. `TerminateIllegalWrapper` and
+    `ClipOutOfBoundsWrapper`, are always applied.
+    """
+    global _validation_enabled
+    _validation_enabled = enabled
+
+
+def validation_enabled(validate: bool | None = None) -> bool:
+    """Returns ``validate`` if it is given, otherwise the global setting (see `set_validation`)."""
+    return _validation_enabled if validate is None else validate
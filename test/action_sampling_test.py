@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+from gymnasium.spaces import Box, Discrete
+
+from pettingzoo.utils import sample_action, sample_masked
+
+
+def test_sample_masked_is_legal():
+    rng = np.random.default_rng(0)
+    mask = np.array([0, 1, 0, 1, 1], dtype=np.int8)
+    samples = {sample_masked(mask, rng) for _ in range(200)}
+    assert samples == {1, 3, 4}
+    assert sample_masked(np.zeros(5, dtype=np.int8), rng) == 0
+
+
+def test_sample_masked_batch():
+    rng = np.random.default_rng(0)
+    masks = np.zeros((64, 6), dtype=np.int8)
+    legal = rng.integers(6, size=64)
+    masks[np.arange(64), legal] = 1
+    np.testing.assert_array_equal(sample_masked(masks, rng), legal)
+    np.testing.assert_array_equal(
+        sample_masked(masks, rng, logits=rng.normal(size=masks.shape)), legal
+    )
+
+
+@pytest.mark.parametrize("logits", [None, np.zeros(4)])
+def test_sample_masked_seeded(logits):
+    mask = np.array([1, 1, 0, 1], dtype=np.int8)
+    first = [sample_masked(mask, np.random.default_rng(7), logits) for _ in range(5)]
+    assert len(set(first)) == 1
+
+
+def test_sample_masked_logits():
+    rng = np.random.default_rng(0)
+    mask = np.ones((20000, 3), dtype=np.int8)
+    logits = np.log(np.broadcast_to([0.2, 0.3, 0.5], mask.shape))
+    counts = np.bincount(sample_masked(mask, rng, logits), minlength=3)
+    np.testing.assert_allclose(counts / len(mask), [0.2, 0.3, 0.5], atol=0.02)
+
+
+def test_sample_action():
+    space = Discrete(4, start=10, seed=0)
+    mask = np.array([0, 0, 1, 0], dtype=np.int8)
+    assert sample_action(space, {"action_mask": mask}) == 12
+    assert sample_action(space, np.zeros(3), {"action_mask": mask}) == 12
+    assert space.contains(sample_action(space))
+    box = Box(-1, 1, (2,), seed=0)
+    assert box.contains(sample_action(box, None, {}))
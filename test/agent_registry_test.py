@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+import copy
+import pickle
+
+import numpy as np
+
+from pettingzoo.butterfly import pistonball_v6
+from pettingzoo.test import api_test
+from pettingzoo.utils import AgentArrays
+
+
+def test_agent_array_dict_views():
+    arrays = AgentArrays(["a", "b", "c"])
+    rewards, cumulative_rewards, terminations, truncations = arrays.reset(
+        ["a", "b", "c"]
+    )
+    assert isinstance(rewards, dict)
+    assert rewards == {"a": 0.0, "b": 0.0, "c": 0.0}
+
+    arrays.rewards[:] = [1.0, 2.0, 3.0]
+    arrays.accumulate_rewards()
+    assert cumulative_rewards["c"] == 3.0
+    assert dict(rewards) == {"a": 1.0, "b": 2.0, "c": 3.0}
+    assert {**rewards}["b"] == 2.0
+
+    terminations["b"] = True
+    assert arrays.terminations.tolist() == [False, True, False]
+    assert isinstance(terminations["b"], bool)
+
+    del rewards["b"]
+    assert list(rewards) == ["a", "c"]
+    assert rewards.get("b") is None
+    np.testing.assert_array_equal(rewards.indices(), [0, 2])
+    rewards["b"] = 5.0
+    assert rewards["b"] == 5.0
+
+    restored = pickle.loads(pickle.dumps(rewards))
+    assert restored == rewards
+    assert copy.deepcopy(truncations) == truncations
+
+
+def test_pistonball_agent_arrays():
+    env = pistonball_v6.env()
+    api_test(env, num_cycles=30)
+
+    env.reset(seed=0)
+    arrays = env.unwrapped.agent_arrays
+    for agent in env.agent_iter(100):
+        _, reward, termination, truncation, _ = env.last()
+        index = arrays.registry.index(agent)
+        assert reward == arrays.cumulative_rewards[index]
+        assert termination == arrays.terminations[index]
+        assert truncation == arrays.truncations[index]
+        action = None if termination or truncation else env.action_space(agent).sample()
+        env.step(action)
+    assert env.rewards == {
+        agent: arrays.rewards[arrays.registry.index(agent)] for agent in env.agents
+    }
+    env.close()
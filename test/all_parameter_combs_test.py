@@ -327,6 +327,16 @@ parameterized_envs = [
         simple_spread_v3,
         dict(N=5, continuous_actions=True, max_cycles=50),
     ],
+    [
+        "mpe/simple_spread_v3",
+        simple_spread_v3,
+        dict(N=5, vectorized_physics=True, max_cycles=50),
+    ],
+    [
+        "mpe/simple_world_comm_v3",
+        simple_world_comm_v3,
+        dict(vectorized_physics=True, max_cycles=50),
+    ],
     ["sisl/multiwalker_v9", multiwalker_v9, dict(n_walkers=10, max_cycles=50)],
     ["sisl/multiwalker_v9", multiwalker_v9, dict(shared_reward=False, max_cycles=50)],
     [
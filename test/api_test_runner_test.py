@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+import pytest
+
+from pettingzoo.classic import rps_v2, tictactoe_v3
+from pettingzoo.mpe import simple_spread_v3
+from pettingzoo.test import api_test, parallel_api_test, run_api_tests
+
+
+def test_sampled_checks():
+    full = api_test(simple_spread_v3.env(max_cycles=50), num_cycles=50)
+    sampled = api_test(
+        simple_spread_v3.env(max_cycles=50), num_cycles=50, check_rate=0.1, seed=0
+    )
+    assert sampled.calls["structure"] == full.calls["structure"]
+    assert 0 < sampled.calls["observation_space"] < full.calls["observation_space"]
+    assert set(full.summary()) >= {"last", "step", "structure", "observation"}
+
+
+def test_time_budget():
+    timings = parallel_api_test(
+        simple_spread_v3.parallel_env(max_cycles=1000), num_cycles=1000, time_budget=0
+    )
+    assert timings.calls["step"] == 0
+
+
+def broken_env():
+    env = tictactoe_v3.env()
+    env.possible_agents = ["player_1"]
+    return env
+
+
+@pytest.mark.parametrize("num_workers", [0, 2])
+def test_run_api_tests(num_workers):
+    results = run_api_tests(
+        {
+            "rps": rps_v2.env,
+            "rps_parallel": rps_v2.parallel_env,
+            "rps_lambda": lambda: rps_v2.env(max_cycles=5),
+            "rps_path": "pettingzoo.classic.rps_v2:parallel_env",
+            "broken": broken_env,
+        },
+        num_cycles=20,
+        num_workers=num_workers,
+    )
+    assert list(results) == [
+        "rps",
+        "rps_parallel",
+        "rps_lambda",
+        "rps_path",
+        "broken",
+    ]
+    for name in ["rps", "rps_parallel", "rps_lambda", "rps_path"]:
+        assert results[name]["passed"], results[name]["error"]
+    assert "step" in results["rps_parallel"]["timings"]
+    assert not results["broken"]["passed"]
+    assert "AssertionError" in results["broken"]["error"]
+
+
+def test_run_api_tests_spawn():
+    results = run_api_tests(
+        ["pettingzoo.classic.rps_v2:parallel_env"],
+        num_cycles=20,
+        num_workers=1,
+        context="spawn",
+    )
+    assert results["pettingzoo.classic.rps_v2:parallel_env"]["passed"]
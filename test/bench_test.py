@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import json
+import random
+import sys
+
+from pettingzoo.bench import benchmark_env, main, run_benchmarks, select_environments
+from pettingzoo.mpe import simple_spread_v3
+
+
+def test_bench_cli_writes_results(tmp_path):
+    output = tmp_path / "results.json"
+    main(
+        [
+            "mpe/simple_spread_v3",
+            "classic/tictactoe_v3",
+            "--kwargs",
+            "{}",
+            "--kwargs",
+            '{"N": 5}',
+            "--seconds",
+            "0.1",
+            "--alloc-steps",
+            "5",
+            "--output",
+            str(output),
+        ]
+    )
+    report = json.loads(output.read_text())
+    results = {
+        (result["env"], result["api"], json.dumps(result["kwargs"])): result
+        for result in report["results"]
+    }
+    # tictactoe has no N argument and no parallel API
+    assert len(results) == 6
+    assert "error" in results[("classic/tictactoe_v3", "aec", '{"N": 5}')]
+    result = results[("mpe/simple_spread_v3", "parallel", '{"N": 5}')]
+    assert result["steps"] > 0
+    assert result["step_latency_p50_ms"] <= result["step_latency_p99_ms"]
+    assert result["alloc_bytes_per_step"] > 0
+    assert result["raw_env_ms_per_step"] + result["wrapper_ms_per_step"] > 0
+
+
+def test_benchmark_env_leaves_env_and_global_rng():
+    env = simple_spread_v3.env()
+    random.seed(123)
+    expected = random.random()
+    random.seed(123)
+    result = benchmark_env(env, seconds=0.05, alloc_steps=2)
+    assert result["raw_env_ms_per_step"] > 0
+    assert random.random() == expected
+    assert "step" not in vars(env.unwrapped)
+    assert "observe" not in vars(env.unwrapped)
+
+
+def test_environments_which_cannot_be_imported_are_reported(monkeypatch):
+    # a None entry in sys.modules makes the import fail
+    monkeypatch.setitem(sys.modules, "pettingzoo.mpe.simple_push_v3", None)
+    environments = select_environments(["mpe"])
+    assert isinstance(environments["mpe/simple_push_v3"], ImportError)
+    assert len(environments) == 9
+
+    results = run_benchmarks(
+        ["mpe/simple_push_v3", "mpe/simple_v3"],
+        apis=["aec"],
+        verbose=False,
+        seconds=0.05,
+        alloc_steps=2,
+    )
+    assert [result["env"] for result in results] == [
+        "mpe/simple_push_v3",
+        "mpe/simple_v3",
+    ]
+    assert results[0]["error"].startswith("ModuleNotFoundError")
+    assert "error" not in results[1]
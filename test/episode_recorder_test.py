@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from pettingzoo.classic import tictactoe_v3
+from pettingzoo.mpe import simple_spread_v3
+from pettingzoo.utils import EpisodeReader
+from pettingzoo.utils.wrappers import (
+    EpisodeRecorderParallelWrapper,
+    EpisodeRecorderWrapper,
+)
+
+
+def test_parallel_episode_recorder(tmp_path):
+    env = EpisodeRecorderParallelWrapper(
+        simple_spread_v3.parallel_env(max_cycles=5), tmp_path, chunk_size=3
+    )
+    expected = {agent: [] for agent in env.possible_agents}
+    for episode in range(2):
+        observations, _ = env.reset(seed=episode)
+        while env.agents:
+            actions = {agent: env.action_space(agent).sample() for agent in env.agents}
+            next_observations, rewards, terminations, truncations, _ = env.step(actions)
+            for agent, action in actions.items():
+                transition = (observations[agent].copy(), action, rewards[agent])
+                expected[agent].append((*transition, truncations[agent]))
+            observations = next_observations
+    env.close()
+
+    reader = EpisodeReader(tmp_path)
+    assert len(reader) == 2
+    assert reader.agents == env.possible_agents
+    for agent in env.possible_agents:
+        rows = [row for episode in reader for row in zip(*_columns(episode[agent]))]
+        assert len(rows) == len(expected[agent]) == 10
+        for (obs, action, reward, truncated), row in zip(expected[agent], rows):
+            np.testing.assert_allclose(row[0], obs, rtol=1e-6)
+            assert row[1:] == (action, pytest.approx(reward), truncated)
+    # the last transition of every episode is truncated
+    assert all(episode["agent_0"]["truncated"][-1] for episode in reader)
+
+
+def _columns(agent_episode):
+    return (
+        agent_episode["observation"],
+        agent_episode["action"].tolist(),
+        agent_episode["reward"].tolist(),
+        agent_episode["truncated"].tolist(),
+    )
+
+
+def test_aec_episode_recorder(tmp_path):
+    env = EpisodeRecorderWrapper(tictactoe_v3.env(), tmp_path, chunk_size=2)
+    env.reset(seed=0)
+    actions = {agent: [] for agent in env.possible_agents}
+    masks = {agent: [] for agent in env.possible_agents}
+    final_rewards = {}
+    for agent in env.agent_iter():
+        observation, reward, termination, truncation, _ = env.last()
+        if termination or truncation:
+            action = None
+            final_rewards[agent] = reward
+        else:
+            action = int(np.flatnonzero(observation["action_mask"])[0])
+            actions[agent].append(action)
+            masks[agent].append(observation["action_mask"].copy())
+        env.step(action)
+    env.close()
+
+    reader = EpisodeReader(tmp_path)
+    assert len(reader) == 1
+    episode = reader[0]
+    for agent in env.possible_agents:
+        assert episode[agent]["action"].tolist() == actions[agent]
+        np.testing.assert_array_equal(
+            episode[agent]["observation"]["action_mask"], masks[agent]
+        )
+        assert episode[agent]["terminated"].tolist() == [False] * (
+            len(actions[agent]) - 1
+        ) + [True]
+        assert episode[agent]["reward"][-1] == final_rewards[agent]
+
+
+def test_recorder_refuses_existing_dataset(tmp_path):
+    EpisodeRecorderParallelWrapper(simple_spread_v3.parallel_env(), tmp_path).close()
+    with pytest.raises(FileExistsError):
+        EpisodeRecorderParallelWrapper(simple_spread_v3.parallel_env(), tmp_path)
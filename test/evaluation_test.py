@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from pettingzoo.classic import connect_four_v3, rps_v2
+from pettingzoo.mpe import simple_spread_v3
+from pettingzoo.utils import evaluate
+from pettingzoo.utils.evaluation import run_episode
+
+
+def first_legal_column(observation, agent):
+    return int(np.flatnonzero(observation["action_mask"])[0])
+
+
+def test_evaluate_is_deterministic():
+    policies = {"player_0": first_legal_column}
+    local = evaluate(connect_four_v3.env, policies, num_episodes=8, num_workers=0)
+    pooled = evaluate(connect_four_v3.env, policies, num_episodes=8, num_workers=2)
+    assert pooled.seeds == local.seeds == list(range(8))
+    for agent in ("player_0", "player_1"):
+        np.testing.assert_array_equal(pooled.returns[agent], local.returns[agent])
+    np.testing.assert_array_equal(pooled.lengths, local.lengths)
+
+
+def test_win_rates():
+    result = evaluate(connect_four_v3.env, num_episodes=20, seed=3, num_workers=0)
+    win_rates = result.win_rates()
+    draws = result.winners.count(None)
+    wins = sum(rate for rate, _, _ in win_rates.values()) * 20
+    assert wins + draws == pytest.approx(20)
+    for rate, low, high in [*win_rates.values(), result.draw_rate()]:
+        assert 0 <= low <= rate <= high <= 1
+    mean, low, high = result.mean_length()
+    assert low <= mean <= high
+    assert result.summary()["num_episodes"] == 20
+
+
+def test_parallel_env():
+    result = evaluate(
+        simple_spread_v3.parallel_env, num_episodes=3, max_cycles=5, num_workers=0
+    )
+    assert set(result.returns) == {"agent_0", "agent_1", "agent_2"}
+    np.testing.assert_array_equal(result.lengths, [15, 15, 15])
+
+
+@pytest.mark.parametrize("env_fn", [rps_v2.env, rps_v2.parallel_env])
+def test_run_episode_seed(env_fn):
+    env = env_fn()
+    assert run_episode(env, seed=7) == run_episode(env, seed=7)
@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from pettingzoo.butterfly import pistonball_v6
+from pettingzoo.classic import tictactoe_v3
+from pettingzoo.utils import average_total_reward
+from pettingzoo.utils.env import LazyObservation
+from pettingzoo.utils.wrappers import ProfilingWrapper
+
+
+def test_lazy_observation_is_only_observed_when_used():
+    env = ProfilingWrapper(pistonball_v6.env())
+    env.reset(seed=0)
+    observation, reward, termination, truncation, info = env.last(lazy=True)
+    assert isinstance(observation, LazyObservation)
+    assert not observation.observed
+    assert (reward, termination, truncation) == env.last(observe=False)[1:4]
+    assert "observe" not in env.profiler.as_dict()
+
+    expected = env.observe(env.agent_selection)
+    assert observation.shape == expected.shape
+    assert observation.observed
+    np.testing.assert_array_equal(np.asarray(observation), expected)
+    np.testing.assert_array_equal(observation[0], expected[0])
+    # the observation is computed once
+    observation.get()
+    assert env.profiler.as_dict()["observe"]["calls"] == 2
+
+
+def test_lazy_dict_observation():
+    env = tictactoe_v3.env()
+    env.reset(seed=0)
+    observation, *_ = env.last(lazy=True)
+    assert "action_mask" in observation
+    np.testing.assert_array_equal(
+        observation["action_mask"], env.observe(env.agent_selection)["action_mask"]
+    )
+    # masked actions are sampled from lazy observations
+    assert average_total_reward(env, max_episodes=3) == 0
+
+
+def test_lazy_observation_used_after_step_raises():
+    env = pistonball_v6.env()
+    env.reset(seed=0)
+    observation, *_ = env.last(lazy=True)
+    observed, *_ = env.last(lazy=True)
+    expected = observed.get()
+    env.step(env.action_space(env.agent_selection).sample())
+    with pytest.raises(RuntimeError, match="after the environment was stepped"):
+        observation.get()
+    # observations computed before the step stay available
+    np.testing.assert_array_equal(np.asarray(observed), expected)
+
+    observation, *_ = env.last(lazy=True)
+    env.reset(seed=1)
+    with pytest.raises(RuntimeError):
+        np.asarray(observation)
+
+
+def test_lazy_observation_array_copy():
+    env = pistonball_v6.env()
+    env.reset(seed=0)
+    observation, *_ = env.last(lazy=True)
+    array = np.asarray(observation)
+    assert np.shares_memory(np.array(observation, copy=False), array)
+    assert not np.shares_memory(np.array(observation, copy=True), array)
+    with pytest.raises(ValueError):
+        np.array(observation, dtype=np.float64, copy=False)
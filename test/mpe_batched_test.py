@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from pettingzoo.mpe import (
+    simple_adversary_v3,
+    simple_push_v3,
+    simple_spread_v3,
+    simple_tag_v3,
+    simple_v3,
+)
+
+batched_envs = [
+    (simple_v3, dict()),
+    (simple_spread_v3, dict(N=4)),
+    (simple_tag_v3, dict(num_good=2, num_adversaries=3)),
+    (simple_tag_v3, dict(continuous_actions=True)),
+    (simple_adversary_v3, dict()),
+    (simple_push_v3, dict()),
+]
+
+
+@pytest.mark.parametrize(["env_module", "kwargs"], batched_envs)
+def test_batched_env_matches_parallel_env(env_module, kwargs):
+    num_worlds = 3
+    envs = [env_module.parallel_env(**kwargs) for _ in range(num_worlds)]
+    batched = env_module.batched_env(num_worlds=num_worlds, **kwargs)
+    observations, _ = batched.reset(seed=0)
+    for i, env in enumerate(envs):
+        env.reset(seed=i)
+        for agent in env.agents:
+            env.action_space(agent).seed(i)
+        batched.scenario.load_batched_world(env.unwrapped.world, batched.world, i)
+        for agent in env.agents:
+            assert observations[agent].shape == (num_worlds,) + (
+                env.observation_space(agent).shape
+            )
+
+    while batched.agents:
+        actions = [
+            {agent: env.action_space(agent).sample() for agent in env.agents}
+            for env in envs
+        ]
+        batched_actions = {
+            agent: np.stack([env_actions[agent] for env_actions in actions])
+            for agent in batched.agents
+        }
+        observations, rewards, _, truncations, _ = batched.step(batched_actions)
+        for i, env in enumerate(envs):
+            env_obs, env_rew, _, env_trunc, _ = env.step(actions[i])
+            for agent in env_obs:
+                np.testing.assert_allclose(
+                    observations[agent][i], env_obs[agent], atol=1e-5
+                )
+                assert rewards[agent][i] == pytest.approx(env_rew[agent], abs=1e-5)
+                assert truncations[agent][i] == env_trunc[agent]
+    assert not any(env.agents for env in envs)
+    assert batched.state().shape == (num_worlds,) + envs[0].state_space.shape
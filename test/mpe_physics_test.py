@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from pettingzoo.mpe import (
+    simple_adversary_v3,
+    simple_spread_v3,
+    simple_tag_v3,
+    simple_world_comm_v3,
+)
+from pettingzoo.mpe._mpe_utils.core import VectorizedWorld, World
+from pettingzoo.test.collision_benchmark import make_swarm_world
+from pettingzoo.utils.conversions import aec_to_parallel
+
+
+@pytest.mark.parametrize(
+    ["env_module", "kwargs"],
+    [
+        (simple_spread_v3, dict(N=10)),
+        (simple_tag_v3, dict(num_good=3, num_adversaries=20, num_obstacles=5)),
+        (simple_adversary_v3, dict(continuous_actions=True)),
+        (simple_world_comm_v3, dict()),
+    ],
+)
+def test_vectorized_physics_matches_world(env_module, kwargs):
+    env = env_module.parallel_env(**kwargs)
+    vectorized_env = env_module.parallel_env(vectorized_physics=True, **kwargs)
+    assert isinstance(vectorized_env.unwrapped.world, VectorizedWorld)
+
+    observations, _ = env.reset(seed=42)
+    vectorized_observations, _ = vectorized_env.reset(seed=42)
+    for agent in env.agents:
+        env.action_space(agent).seed(42)
+    while env.agents:
+        actions = {agent: env.action_space(agent).sample() for agent in env.agents}
+        observations, rewards, *_ = env.step(actions)
+        vectorized_observations, vectorized_rewards, *_ = vectorized_env.step(actions)
+        for agent in env.agents or env.possible_agents:
+            np.testing.assert_allclose(
+                observations[agent], vectorized_observations[agent], atol=1e-5
+            )
+            assert rewards[agent] == pytest.approx(vectorized_rewards[agent], abs=1e-5)
+
+
+def test_vectorized_world_entity_states_are_views():
+    env = simple_spread_v3.parallel_env(vectorized_physics=True)
+    env.reset(seed=0)
+    world = env.unwrapped.world
+    env.step({agent: 1 for agent in env.agents})
+    p_pos = world.p_pos
+    for i, entity in enumerate(world.entities):
+        assert np.shares_memory(entity.state.p_pos, p_pos)
+        np.testing.assert_array_equal(entity.state.p_pos, p_pos[i])
+    # the arrays are kept while the entity states are views of them
+    env.step({agent: 1 for agent in env.agents})
+    assert world.p_pos is p_pos
+    # reset_world replaces the entity states, so they are gathered again
+    env.reset(seed=1)
+    env.step({agent: 1 for agent in env.agents})
+    assert world.p_pos is not p_pos
+    assert all(entity.state.p_pos.base is world.p_pos for entity in world.entities)
+
+
+@pytest.mark.parametrize("world_class", [World, VectorizedWorld])
+def test_broadphase_matches_all_pairs(world_class):
+    world = make_swarm_world(60, world_class)
+    broadphase_world = make_swarm_world(60, world_class, broadphase=True)
+    for _ in range(20):
+        world.step()
+        broadphase_world.step()
+    for agent, broadphase_agent in zip(world.agents, broadphase_world.agents):
+        np.testing.assert_allclose(
+            agent.state.p_pos, broadphase_agent.state.p_pos, atol=1e-8
+        )
+        np.testing.assert_allclose(
+            agent.state.p_vel, broadphase_agent.state.p_vel, atol=1e-8
+        )
+
+
+def test_observations_are_cached_per_world_step():
+    env = simple_tag_v3.parallel_env()
+    observations, _ = env.reset(seed=0)
+    first, *others = env.agents
+    for agent in others:
+        assert np.shares_memory(observations[agent], env.observe(first).base)
+        assert not observations[agent].flags.writeable
+    assert env.observe(first).base is observations[first].base
+
+    # the state is a copy which the caller may modify
+    state = env.state()
+    assert state.flags.writeable
+    state[:] = 0
+    np.testing.assert_array_equal(
+        env.state(), np.concatenate([observations[agent] for agent in env.agents])
+    )
+
+    env.step({agent: 1 for agent in env.agents})
+    assert env.observe(first).base is not observations[first].base
+
+
+def test_parallel_env_checks_actions_like_aec():
+    env = simple_spread_v3.parallel_env(continuous_actions=True)
+    aec_env = aec_to_parallel(simple_spread_v3.env(continuous_actions=True))
+    observations, _ = env.reset(seed=0)
+    aec_observations, _ = aec_env.reset(seed=0)
+    # out of bound continuous actions are clipped, as ClipOutOfBoundsWrapper does
+    actions = {
+        agent: np.array([0, 50, 0, 0, 0], dtype=np.float32) for agent in env.agents
+    }
+    observations = env.step(actions)[0]
+    aec_observations = aec_env.step(actions)[0]
+    np.testing.assert_equal(observations, aec_observations)
+
+    env = simple_spread_v3.parallel_env()
+    env.reset(seed=0)
+    with pytest.raises(AssertionError, match="action is not in action space"):
+        env.step({agent: 5 for agent in env.agents})
+    # without validation the actions are not checked
+    env = simple_spread_v3.parallel_env(validate=False)
+    env.reset(seed=0)
+    env.step({agent: 5 for agent in env.agents})
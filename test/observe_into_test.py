@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from pettingzoo.butterfly import (
+    cooperative_pong_v5,
+    knights_archers_zombies_v10,
+    pistonball_v6,
+)
+from pettingzoo.mpe import simple_spread_v3
+from pettingzoo.utils.wrappers import BaseWrapper, ProfilingWrapper
+
+
+@pytest.mark.parametrize(
+    "env_fn",
+    [
+        pistonball_v6.env,
+        cooperative_pong_v5.env,
+        knights_archers_zombies_v10.env,
+        lambda: knights_archers_zombies_v10.env(vector_state=False),
+        simple_spread_v3.env,
+    ],
+)
+def test_observe_into(env_fn):
+    env = env_fn()
+    env.reset(seed=0)
+    for agent in env.agent_iter(len(env.possible_agents) * 2):
+        space = env.observation_space(agent)
+        out = np.full(space.shape, 7, dtype=space.dtype)
+        assert env.observe_into(agent, out) is out
+        np.testing.assert_array_equal(out, env.observe(agent))
+        _, _, termination, truncation, _ = env.last(observe=False)
+        action = None if termination or truncation else env.action_space(agent).sample()
+        env.step(action)
+    env.close()
+
+
+class InvertObservation(BaseWrapper):
+    def observe(self, agent):
+        return 255 - super().observe(agent)
+
+
+def test_observe_into_wrapped_observe():
+    # the observation of a wrapper which changes observe() is copied
+    env = ProfilingWrapper(InvertObservation(pistonball_v6.env()))
+    env.reset(seed=0)
+    agent = env.agent_selection
+    out = np.empty(env.observation_space(agent).shape, dtype=np.uint8)
+    env.observe_into(agent, out)
+    np.testing.assert_array_equal(out, env.observe(agent))
+    np.testing.assert_array_equal(out, 255 - env.unwrapped.observe(agent))
+    assert env.profiler.as_dict()["observe"]["calls"] == 2
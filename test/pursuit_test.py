@@ -0,0 +1,160 @@
+from __future__ import annotations
+
+import copy
+import pickle
+
+import numpy as np
+import pytest
+
+from pettingzoo.sisl import pursuit_v4
+from pettingzoo.sisl.pursuit.pursuit_base import Pursuit
+from pettingzoo.test import parallel_api_test
+from pettingzoo.utils.conversions import aec_to_parallel_wrapper
+
+
+def place(env, pursuers, evaders):
+    for i, (x, y) in enumerate(pursuers):
+        env.pursuer_layer.set_position(i, x, y)
+    for i, (x, y) in enumerate(evaders):
+        env.evader_layer.set_position(i, x, y)
+    env.model_state[1] = env.pursuer_layer.get_state_matrix()
+    env.model_state[2] = env.evader_layer.get_state_matrix()
+
+
+def test_surround_need():
+    # the 8x8 map has a building in x = 3..5, y = 2..6
+    env = Pursuit(x_size=8, y_size=8, n_evaders=2, n_pursuers=5)
+    assert env.need_to_surround(0, 0) == 2
+    assert env.need_to_surround(0, 4) == 3
+    assert env.need_to_surround(2, 4) == 3
+    assert env.need_to_surround(1, 1) == 4
+
+
+def test_surround_catch():
+    env = Pursuit(x_size=8, y_size=8, n_evaders=2, n_pursuers=5)
+    place(env, [(1, 0), (0, 1), (2, 0), (6, 7), (7, 0)], [(0, 0), (7, 7)])
+    n_evaders, n_pursuers, catchers = env.remove_agents()
+    assert (n_evaders, n_pursuers) == (1, 0)
+    np.testing.assert_array_equal(catchers, [True, True, False, False, False])
+    np.testing.assert_array_equal(env.evaders_gone, [True, False])
+    np.testing.assert_array_equal(env.evader_layer.get_positions(), [[7, 7]])
+
+
+def test_n_catch():
+    env = Pursuit(
+        x_size=8, y_size=8, n_evaders=3, n_pursuers=3, n_catch=2, surround=False
+    )
+    place(env, [(1, 1), (1, 1), (7, 7)], [(0, 0), (1, 1), (7, 7)])
+    n_evaders, _, catchers = env.remove_agents()
+    assert n_evaders == 1
+    np.testing.assert_array_equal(catchers, [True, True, False])
+    np.testing.assert_array_equal(env.evaders_gone, [False, True, False])
+
+
+def reference_obs(env, x, y):
+    obs = np.zeros((3, env.obs_range, env.obs_range), dtype=np.float32)
+    obs[0] = 1.0
+    for dx in range(2 * env.obs_offset + 1):
+        for dy in range(2 * env.obs_offset + 1):
+            mx, my = x - env.obs_offset + dx, y - env.obs_offset + dy
+            if 0 <= mx < env.x_size and 0 <= my < env.y_size:
+                obs[:, dx, dy] = np.abs(env.model_state[:3, mx, my])
+    return obs
+
+
+@pytest.mark.parametrize("obs_range", [1, 3, 7, 8, 15])
+def test_collect_all_obs(obs_range):
+    env = Pursuit(x_size=10, y_size=12, n_evaders=5, n_pursuers=6, obs_range=obs_range)
+    rng = np.random.default_rng(0)
+    for _ in range(20):
+        for i in range(env.n_pursuers):
+            env.step(rng.integers(5), i, i == env.n_pursuers - 1)
+        observations = env.collect_all_obs()
+        for i in range(env.n_pursuers):
+            x, y = env.pursuer_layer.get_position(i)
+            expected = reference_obs(env, x, y)
+            np.testing.assert_array_equal(observations[i], expected)
+            np.testing.assert_array_equal(env.safely_observe(i), expected)
+            np.testing.assert_array_equal(
+                env.collect_obs_by_idx(env.pursuer_layer, i), expected
+            )
+
+
+@pytest.mark.parametrize(
+    "clone", [copy.deepcopy, lambda env: pickle.loads(pickle.dumps(env))]
+)
+def test_copy_observes_own_state(clone):
+    env = Pursuit(x_size=10, y_size=12, n_evaders=5, n_pursuers=6)
+    env.collect_all_obs()
+    copied = clone(env)
+    rng = np.random.default_rng(0)
+    for _ in range(10):
+        actions = rng.integers(5, size=env.n_pursuers)
+        for i in range(env.n_pursuers):
+            copied.step(actions[i], i, i == env.n_pursuers - 1)
+        for i in range(env.n_pursuers):
+            x, y = copied.pursuer_layer.get_position(i)
+            expected = reference_obs(copied, x, y)
+            np.testing.assert_array_equal(copied.collect_all_obs()[i], expected)
+            np.testing.assert_array_equal(
+                copied.collect_obs_by_idx(copied.pursuer_layer, i), expected
+            )
+            np.testing.assert_array_equal(copied.pursuers[i].current_position(), [x, y])
+
+
+def test_agent_layer_moves():
+    env = Pursuit(x_size=8, y_size=8, n_evaders=3, n_pursuers=3)
+    layer = env.evader_layer
+    # left off the map, right into the building and down
+    place(env, [], [(0, 0), (2, 3), (6, 6)])
+    layer.move_all(np.array([0, 1, 3]))
+    np.testing.assert_array_equal(layer.get_positions(), [[0, 0], [2, 3], [6, 5]])
+    np.testing.assert_array_equal(env.evaders[2].current_position(), [6, 5])
+    np.testing.assert_array_equal(env.evaders[2].last_position(), [6, 6])
+
+    layer.remove_agent(1)
+    assert layer.n_agents() == 2
+    np.testing.assert_array_equal(layer.get_position(1), [6, 5])
+    layer.move_agent(1, 2)
+    np.testing.assert_array_equal(layer.get_positions(), [[0, 0], [6, 6]])
+    state = layer.get_state_matrix()
+    assert state.sum() == 2 and state[6, 6] == 1
+
+
+def test_parallel_api():
+    parallel_api_test(pursuit_v4.parallel_env(max_cycles=30), num_cycles=30)
+
+
+@pytest.mark.parametrize("action", [-1, 5, 9])
+def test_parallel_asserts_actions(action):
+    env = pursuit_v4.parallel_env()
+    env.reset(seed=0)
+    actions = {agent: 0 for agent in env.agents}
+    actions["pursuer_0"] = action
+    with pytest.raises(AssertionError, match="action is not in action space"):
+        env.step(actions)
+    assert pickle.loads(pickle.dumps(env)).validate
+    assert not pursuit_v4.parallel_env(validate=False).validate
+
+
+def test_parallel_matches_aec_cycles():
+    """Moving all pursuers at once gives the same state as moving them in turn."""
+    kwargs = dict(max_cycles=30, n_evaders=10)
+    env = pursuit_v4.parallel_env(**kwargs)
+    aec_env = aec_to_parallel_wrapper(pursuit_v4.env(**kwargs), fast=True)
+    observations, _ = env.reset(seed=3)
+    aec_observations, _ = aec_env.reset(seed=3)
+    rng = np.random.default_rng(0)
+    while env.agents:
+        np.testing.assert_equal(observations, aec_observations)
+        actions = {agent: rng.integers(5) for agent in env.agents}
+        observations, rewards, terminations, truncations, _ = env.step(actions)
+        aec_observations, _, aec_terminations, aec_truncations, _ = aec_env.step(
+            actions
+        )
+        assert terminations == aec_terminations and truncations == aec_truncations
+        # the reward of the state at the end of the cycle
+        np.testing.assert_allclose(
+            list(rewards.values()), aec_env.unwrapped.env.latest_reward_state
+        )
+    assert not aec_env.agents
@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+import pickle
+
+import numpy as np
+import pytest
+
+from pettingzoo.butterfly import (
+    cooperative_pong_v5,
+    knights_archers_zombies_v10,
+    pistonball_v6,
+)
+from pettingzoo.classic import (
+    chess_v6,
+    connect_four_v3,
+    go_v5,
+    leduc_holdem_v4,
+    rps_v2,
+    texas_holdem_v4,
+    tictactoe_v3,
+)
+from pettingzoo.mpe import simple_crypto_v3, simple_reference_v3, simple_spread_v3
+from pettingzoo.sisl import pursuit_v4, waterworld_v4
+from pettingzoo.utils import compile_wrappers
+
+
+def play(env, num_steps, actions=None):
+    """Steps ``env`` with ``actions``, or legal random actions, and returns what every agent saw."""
+    trajectory = []
+    taken = []
+    for i, agent in enumerate(env.agent_iter(num_steps)):
+        observation, reward, termination, truncation, _ = env.last()
+        trajectory.append((agent, observation, reward, termination, truncation))
+        if termination or truncation:
+            action = None
+        elif actions is not None:
+            action = actions[i]
+        else:
+            mask = observation["action_mask"] if isinstance(observation, dict) else None
+            action = env.action_space(agent).sample(mask)
+        taken.append(action)
+        env.step(action)
+    return trajectory, taken
+
+
+@pytest.mark.parametrize(
+    "env_fn",
+    [
+        tictactoe_v3.env,
+        connect_four_v3.env,
+        chess_v6.env,
+        lambda: go_v5.env(board_size=9),
+        leduc_holdem_v4.env,
+        texas_holdem_v4.env,
+        rps_v2.env,
+        simple_spread_v3.env,
+        simple_reference_v3.env,
+        simple_crypto_v3.env,
+        lambda: simple_spread_v3.env(vectorized_physics=True),
+        lambda: pistonball_v6.env(continuous=False),
+        pursuit_v4.env,
+        cooperative_pong_v5.env,
+        knights_archers_zombies_v10.env,
+        lambda: knights_archers_zombies_v10.env(vector_state=False),
+        lambda: compile_wrappers(tictactoe_v3.env()),
+    ],
+)
+def test_restore_replays_episode(env_fn):
+    env = env_fn()
+    env.reset(seed=42)
+    play(env, 5)
+    snapshot = env.snapshot()
+    expected, actions = play(env, 40)
+
+    # snapshots are independent of the environment and can be restored repeatedly
+    for restored in (snapshot, pickle.loads(pickle.dumps(snapshot))):
+        env.restore(restored)
+        trajectory, _ = play(env, 40, actions)
+        np.testing.assert_equal(trajectory, expected)
+    env.close()
+
+
+def test_waterworld_restores_replay_each_other():
+    env = waterworld_v4.env()
+    env.reset(seed=42)
+    play(env, 5)
+    base = env.unwrapped.env
+    pursuers, space = base.pursuers, base.space
+    snapshot = env.snapshot()
+    # taking a snapshot leaves the simulation objects of the environment alone
+    assert base.pursuers is pursuers and base.space is space
+    _, actions = play(env, 40)
+
+    # restores replay the same trajectory, which can differ slightly from the
+    # one after the snapshot since the copied pymunk space orders collisions
+    # differently
+    env.restore(snapshot)
+    expected, _ = play(env, 40, actions)
+    for restored in (snapshot, pickle.loads(pickle.dumps(snapshot))):
+        env.restore(restored)
+        trajectory, _ = play(env, 40, actions)
+        np.testing.assert_equal(trajectory, expected)
+    env.close()
+
+
+def test_restore_after_reset():
+    env = simple_spread_v3.env(max_cycles=5)
+    env.reset(seed=0)
+    snapshot = env.snapshot()
+    expected, actions = play(env, 10)
+    env.reset(seed=1)
+    env.restore(snapshot)
+    trajectory, _ = play(env, 10, actions)
+    np.testing.assert_equal(trajectory, expected)
+
+
+def test_parallel_restore():
+    env = simple_spread_v3.parallel_env()
+    env.reset(seed=0)
+    snapshot = env.snapshot()
+    actions = [
+        {agent: env.action_space(agent).sample() for agent in env.agents}
+        for _ in range(5)
+    ]
+    expected = [env.step(step_actions) for step_actions in actions]
+    env.restore(snapshot)
+    np.testing.assert_equal(
+        [env.step(step_actions) for step_actions in actions], expected
+    )
+
+
+def test_snapshot_before_reset():
+    env = tictactoe_v3.env()
+    with pytest.raises(AssertionError, match="snapshot"):
+        env.snapshot()
+
+
+def test_restore_illegal_move():
+    env = tictactoe_v3.env()
+    env.reset(seed=0)
+    snapshot = env.snapshot()
+    # an illegal move ends the game through the TerminateIllegalWrapper
+    env.step(0)
+    env.step(0)
+    assert all(env.terminations.values())
+    env.restore(snapshot)
+    assert not any(env.terminations.values())
+    env.step(0)
+    assert env.agent_selection == "player_2"
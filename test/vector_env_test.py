@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import numpy as np
+
+from pettingzoo.butterfly import pistonball_v6
+from pettingzoo.mpe import simple_speaker_listener_v4, simple_spread_v3
+from pettingzoo.utils import AsyncVectorParallelEnv, VectorParallelEnv
+
+
+def test_vector_env_matches_sub_envs():
+    envs = VectorParallelEnv([lambda: simple_spread_v3.parallel_env(N=3)] * 2)
+    reference = simple_spread_v3.parallel_env(N=3)
+
+    observations, infos = envs.reset(seed=7)
+    ref_obs, _ = reference.reset(seed=8)
+    assert observations.shape == (2, 3, 18)
+    assert len(infos) == 2
+    for i, agent in enumerate(envs.possible_agents):
+        np.testing.assert_array_equal(observations[1, i], ref_obs[agent])
+
+    actions = np.ones((2, 3), dtype=np.int64)
+    observations, rewards, terminations, truncations, _ = envs.step(actions)
+    ref_obs, ref_rew, *_ = reference.step({agent: 1 for agent in reference.agents})
+    assert rewards.shape == terminations.shape == truncations.shape == (2, 3)
+    for i, agent in enumerate(envs.possible_agents):
+        np.testing.assert_array_equal(observations[1, i], ref_obs[agent])
+        assert rewards[1, i] == ref_rew[agent]
+
+
+def test_vector_env_pads_heterogeneous_spaces():
+    envs = VectorParallelEnv([simple_speaker_listener_v4.parallel_env] * 2)
+    observations, _ = envs.reset(seed=0)
+    # speaker observes 3 values and listener 11, padded to the largest
+    assert observations.shape == (2, 2, 11)
+    assert np.all(observations[:, 0, 3:] == 0)
+    envs.step(np.zeros((2, 2), dtype=np.int64))
+
+
+def test_vector_env_autoreset():
+    envs = VectorParallelEnv(
+        [lambda: pistonball_v6.parallel_env(max_cycles=3, continuous=False)] * 2
+    )
+    envs.reset(seed=0)
+    actions = np.zeros((2, envs.num_agents), dtype=np.int64)
+    for _ in range(2):
+        _, _, _, truncations, infos = envs.step(actions)
+        assert not truncations.any()
+    _, _, _, truncations, infos = envs.step(actions)
+    assert truncations.all()
+    for info in infos:
+        assert info["final_observation"].shape == (envs.num_agents, 457, 120, 3)
+    assert envs.agents_mask.all()
+    envs.close()
+
+
+def test_async_vector_env_matches_sync():
+    sync_envs = VectorParallelEnv([simple_spread_v3.parallel_env] * 3)
+    async_envs = AsyncVectorParallelEnv([simple_spread_v3.parallel_env] * 3)
+
+    sync_obs, _ = sync_envs.reset(seed=0)
+    async_obs, _ = async_envs.reset(seed=0)
+    np.testing.assert_array_equal(sync_obs, async_obs)
+
+    rng = np.random.default_rng(0)
+    for _ in range(30):
+        actions = rng.integers(0, 5, size=(3, 3))
+        async_envs.step_async(actions)
+        sync_results = sync_envs.step(actions)
+        async_results = async_envs.step_wait()
+        for sync_array, async_array in zip(sync_results[:4], async_results[:4]):
+            np.testing.assert_array_equal(sync_array, async_array)
+    async_envs.close()
@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from pettingzoo.sisl.waterworld.waterworld_base import WaterworldBase
+
+
+def reference_observation(env, i):
+    """The observation of pursuer i computed one object at a time."""
+    pursuer = env.pursuers[i]
+
+    def readings(objects, max_speed):
+        distances, velocities = [], []
+        for obj in objects:
+            distance, velocity = pursuer.get_sensor_reading(
+                obj.body.position, obj.radius, obj.body.velocity, max_speed
+            )
+            distances.append(distance)
+            velocities.append(velocity)
+        return env.get_sensor_readings(
+            distances, pursuer.sensor_range, velocites=velocities
+        )
+
+    obstacle, _ = readings(env.obstacles, 0.0)
+    evader, evader_velocity = readings(env.evaders, env.evader_speed)
+    poison, poison_velocity = readings(env.poisons, env.poison_speed)
+    others = [p for j, p in enumerate(env.pursuers) if j != i]
+    if others:
+        other, other_velocity = readings(others, env.pursuer_speed)
+    else:
+        other = other_velocity = np.zeros(env.n_sensors)
+    food = float(pursuer.shape.food_touched_indicator >= 1)
+    poisoned = float(pursuer.shape.poison_indicator >= 1)
+    parts = [obstacle, pursuer.get_sensor_barrier_readings(), evader]
+    if env.speed_features:
+        parts += [evader_velocity, poison, poison_velocity, other, other_velocity]
+    else:
+        parts += [poison, other]
+    return np.concatenate([*parts, [food], [poisoned]])
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        dict(n_pursuers=5, n_evaders=20, n_poisons=20),
+        dict(n_pursuers=1, n_evaders=3, n_poisons=4, speed_features=False),
+    ],
+)
+def test_observe_list_matches_reference(kwargs):
+    env = WaterworldBase(**kwargs)
+    env._seed(0)
+    env.reset()
+    rng = np.random.default_rng(0)
+    for _ in range(20):
+        for i in range(env.n_pursuers):
+            env.step(rng.uniform(-1, 1, 2), i, i == env.n_pursuers - 1)
+        observations = env.observe_list()
+        assert len(observations) == env.n_pursuers
+        for i, observation in enumerate(observations):
+            assert observation.shape == (env.pursuers[i].obs_dim,)
+            np.testing.assert_allclose(
+                observation, reference_observation(env, i), atol=1e-9
+            )
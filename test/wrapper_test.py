@@ -1,14 +1,27 @@
 from __future__ import annotations
 
+import numpy as np
 import pytest
+from gymnasium.utils.env_checker import data_equivalence
 
 from pettingzoo.butterfly import pistonball_v6
 from pettingzoo.classic import texas_holdem_no_limit_v6, tictactoe_v3
+from pettingzoo.mpe import simple_spread_v3, simple_tag_v3
+from pettingzoo.sisl import multiwalker_v9, pursuit_v4
+from pettingzoo.test import api_test
+from pettingzoo.utils.conversions import aec_to_parallel_wrapper
 from pettingzoo.utils.wrappers import (
+    AssertOutOfBoundsWrapper,
     BaseWrapper,
+    CompiledWrapper,
     MultiEpisodeEnv,
     MultiEpisodeParallelEnv,
+    OrderEnforcingWrapper,
+    ProfilingParallelWrapper,
+    ProfilingWrapper,
     TerminateIllegalWrapper,
+    compile_wrappers,
+    set_validation,
 )
 
 
@@ -134,3 +147,193 @@ def test_terminate_illegal() -> None:
 
     # all values must be the same, or else the wrapper and env are mismatched
     assert len(set(agent_selections)) == 1, "agent_selection mismatch"
+
+
+@pytest.mark.parametrize(
+    ("env_module"), [simple_spread_v3, simple_tag_v3, pursuit_v4, multiwalker_v9]
+)
+def test_fast_aec_to_parallel_wrapper(env_module) -> None:
+    """The fast path of aec_to_parallel_wrapper must return the same data as the default path."""
+    fast_env = aec_to_parallel_wrapper(env_module.env(), fast=True)
+    env = aec_to_parallel_wrapper(env_module.env())
+
+    fast_obs, _ = fast_env.reset(seed=42)
+    obs, _ = env.reset(seed=42)
+    assert data_equivalence(fast_obs, obs)
+
+    for _ in range(50):
+        actions = {agent: env.action_space(agent).sample() for agent in env.agents}
+        fast_results = fast_env.step(actions)
+        results = env.step(actions)
+        for fast_result, result in zip(fast_results, results):
+            assert fast_result.keys() == result.keys()
+        fast_obs, fast_rew, fast_term, fast_trunc, _ = fast_results
+        obs, rew, term, trunc, _ = results
+        assert data_equivalence(fast_obs, obs)
+        assert all(np.isclose(fast_rew[agent], rew[agent]) for agent in rew)
+        assert fast_term == term and fast_trunc == trunc
+        assert fast_env.agents == env.agents
+        if not env.agents:
+            break
+
+
+class _NegatedObservationWrapper(BaseWrapper):
+    def observe(self, agent):
+        return -super().observe(agent)
+
+
+class _DeathMidCycleWrapper(BaseWrapper):
+    """Kills the second agent after the first one steps, skipping it or dropping its reward."""
+
+    def __init__(self, env, remove):
+        super().__init__(env)
+        self.remove = remove
+
+    def step(self, action):
+        super().step(action)
+        raw_env = self.unwrapped
+        second, third = raw_env.agents[1:3]
+        if self.remove:
+            del raw_env.rewards[second]
+        elif raw_env.agent_selection == second:
+            raw_env.terminations[second] = True
+            raw_env.agent_selection = third
+
+
+def test_fast_aec_to_parallel_wrapper_observes_through_wrappers() -> None:
+    fast_env = aec_to_parallel_wrapper(
+        _NegatedObservationWrapper(pursuit_v4.env()), fast=True
+    )
+    env = aec_to_parallel_wrapper(_NegatedObservationWrapper(pursuit_v4.env()))
+    fast_obs, _ = fast_env.reset(seed=42)
+    obs, _ = env.reset(seed=42)
+    actions = {agent: 1 for agent in env.agents}
+    assert data_equivalence(fast_env.step(actions)[0], env.step(actions)[0])
+
+
+@pytest.mark.parametrize(
+    ("fast", "remove"), [(False, False), (True, False), (True, True)]
+)
+def test_aec_to_parallel_wrapper_rejects_death_mid_cycle(fast, remove) -> None:
+    env = aec_to_parallel_wrapper(
+        _DeathMidCycleWrapper(pursuit_v4.env(), remove=remove), fast=fast
+    )
+    env.reset(seed=42)
+    with pytest.raises(AssertionError, match="only at the end of a cycle"):
+        env.step({agent: 1 for agent in env.agents})
+
+
+def test_profiling_wrapper() -> None:
+    env = ProfilingWrapper(pistonball_v6.env(continuous=False))
+    env.reset(seed=0)
+    for agent in env.agent_iter(40):
+        _, _, termination, truncation, _ = env.last()
+        env.step(None if termination or truncation else 1)
+    env.state()
+
+    sections = env.profiler.as_dict()
+    assert sections["step"]["calls"] == sections["last"]["calls"] == 40
+    assert sections["observe"]["calls"] == 40
+    assert set(sections["step"]["agents"]) == set(env.possible_agents)
+    assert sections["step"]["agents"]["piston_0"]["calls"] == 2
+    assert sections["reset"]["calls"] == sections["state"]["calls"] == 1
+    # internal sections marked by the environment
+    assert sections["space.step"]["calls"] == 40
+    # the pistons are drawn once per cycle
+    assert sections["draw"]["calls"] == 2
+    assert sections["step"]["total_seconds"] >= sections["space.step"]["total_seconds"]
+
+    text = env.profiler.to_prometheus()
+    assert "# TYPE pettingzoo_section_seconds_total counter" in text
+    assert 'pettingzoo_section_calls_total{section="step",agent="piston_0"} 2' in text
+
+    env.profiler.enabled = False
+    env.step(1)
+    assert env.profiler.as_dict()["step"]["calls"] == 40
+    env.close()
+    assert env.unwrapped._profiler is None
+
+
+def test_profiling_parallel_wrapper() -> None:
+    env = ProfilingParallelWrapper(simple_spread_v3.parallel_env(max_cycles=5))
+    env.reset(seed=0)
+    while env.agents:
+        env.step({agent: 0 for agent in env.agents})
+
+    sections = env.profiler.as_dict()
+    assert sections["step"]["calls"] == sections["world.step"]["calls"] == 5
+    assert sections["rewards"]["calls"] == 5
+    # observations are computed once per reset and world step
+    assert sections["observations"]["calls"] == 6
+
+
+@pytest.mark.parametrize("skip_checks", [False, True])
+def test_compiled_wrapper(skip_checks: bool) -> None:
+    api_test(compile_wrappers(tictactoe_v3.env(), skip_checks=skip_checks))
+
+    env = compile_wrappers(pistonball_v6.env(continuous=False), skip_checks=skip_checks)
+    reference = pistonball_v6.env(continuous=False)
+    assert str(env) == str(reference)
+    if skip_checks:
+        # the order enforcing and out of bounds assertion wrappers are skipped
+        assert env._target is env.unwrapped
+    else:
+        with pytest.raises(AttributeError):
+            env.agents
+    env.reset(seed=0)
+    reference.reset(seed=0)
+    assert env._owners["rewards"] is env.unwrapped
+    for agent in env.agent_iter(50):
+        assert agent == reference.agent_selection
+        obs, rew, term, trunc, _ = env.last()
+        ref_obs, ref_rew, ref_term, ref_trunc, _ = reference.last()
+        assert np.array_equal(obs, ref_obs)
+        assert (rew, term, trunc) == (ref_rew, ref_term, ref_trunc)
+        env.step(1)
+        reference.step(1)
+    assert env.rewards == reference.rewards
+    # forwarded methods are bound on the first lookup
+    assert "get_nearby_pistons" not in vars(env)
+    env.get_nearby_pistons()
+    assert "get_nearby_pistons" in vars(env)
+
+
+def test_compiled_wrapper_keeps_overridden_last() -> None:
+    env = compile_wrappers(ProfilingWrapper(tictactoe_v3.env()), skip_checks=True)
+    assert isinstance(env, CompiledWrapper)
+    env.reset(seed=0)
+    env.last()
+    assert env.env.profiler.as_dict()["last"]["calls"] == 1
+
+
+def _wrapper_types(env) -> list[type]:
+    types = []
+    while isinstance(env, BaseWrapper):
+        types.append(type(env))
+        env = env.env
+    return types
+
+
+def test_release_mode() -> None:
+    assert _wrapper_types(tictactoe_v3.env()) == [
+        OrderEnforcingWrapper,
+        AssertOutOfBoundsWrapper,
+        TerminateIllegalWrapper,
+    ]
+    # the wrappers which change the behavior of the environment are kept
+    assert _wrapper_types(tictactoe_v3.env(validate=False)) == [TerminateIllegalWrapper]
+    assert _wrapper_types(simple_spread_v3.env(validate=False)) == []
+    assert simple_spread_v3.parallel_env(validate=False).possible_agents
+
+    set_validation(False)
+    try:
+        assert _wrapper_types(pursuit_v4.env()) == []
+        assert _wrapper_types(multiwalker_v9.env(validate=True))[0] is (
+            OrderEnforcingWrapper
+        )
+        env = pursuit_v4.parallel_env()
+        env.reset(seed=0)
+        env.step({agent: 0 for agent in env.agents})
+    finally:
+        set_validation(True)
+    assert _wrapper_types(pursuit_v4.env())[0] is OrderEnforcingWrapper